@@ -17,6 +17,9 @@ class AudioPlayer:
     и управлением воспроизведением (пауза, громкость, скорость)
     """
     
+    # Как часто (в наносекундах) сверять позицию с VLC, между сверками она вычисляется по часам
+    POSITION_SYNC_INTERVAL_NS = 1_000_000_000
+    
     def __init__(self, debug=False):
         """
         Инициализация плеера
@@ -35,6 +38,9 @@ class AudioPlayer:
         self.position = 0           # Позиция в секундах
         self.duration = 0           # Длительность в секундах
         
+        # Последняя позиция, полученная от VLC: (позиция, время по time.monotonic)
+        self._position_sync = None
+        
         # Процесс воспроизведения
         self.playback_process = None
         self.playback_thread = None
@@ -140,6 +146,7 @@ class AudioPlayer:
                     print(f"Установлена примерная длительность: {self.duration:.2f} сек")
             
             self.position = 0
+            self._position_sync = None
             self.is_playing = False
             self.is_paused = False
             self.playback_process = None
@@ -571,6 +578,7 @@ class AudioPlayer:
             
             # Устанавливаем новую позицию
             self.position = position
+            self._position_sync = None
             
             # Возобновляем воспроизведение, если оно было активно
             if was_playing:
@@ -894,13 +902,30 @@ class AudioPlayer:
                 try:
                     # Если воспроизведение не запущено или на паузе, ждем
                     if not self.is_playing or self.is_paused:
+                        # После паузы позицию нужно заново сверить с VLC
+                        self._position_sync = None
                         time.sleep(update_interval)
                         continue
+                    
+                    # Между сверками с VLC продолжаем позицию по монотонным часам
+                    # Отметки времени храним целыми наносекундами, позицию - целыми миллисекундами
+                    now = time.monotonic_ns()
+                    sync = self._position_sync
+                    position = None
+                    if sync is not None and now - sync[1] < self.POSITION_SYNC_INTERVAL_NS:
+                        position = (sync[0] + (now - sync[1]) // 1_000_000) / 1000.0
                         
-                    # Получаем текущую позицию через VLC (в миллисекундах)
-                    current_pos_ms = self.vlc_player.get_time()
-                    if current_pos_ms >= 0:  # VLC может вернуть -1 если позиция неизвестна
-                        self.position = current_pos_ms / 1000.0  # конвертируем в секунды
+                    # Конец файла всегда подтверждаем реальной позицией VLC
+                    if position is None or (self.duration > 0 and position >= self.duration):
+                        # Получаем текущую позицию через VLC (в миллисекундах)
+                        current_pos_ms = self.vlc_player.get_time()
+                        if current_pos_ms >= 0:  # VLC может вернуть -1 если позиция неизвестна
+                            self.position = current_pos_ms / 1000.0  # конвертируем в секунды
+                        else:
+                            current_pos_ms = int(self.position * 1000)
+                        self._position_sync = (current_pos_ms, now)
+                    else:
+                        self.position = position
                         
                     # Проверяем, не превышает ли позиция длительность файла
                     if self.duration > 0 and self.position >= self.duration:
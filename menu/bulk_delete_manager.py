@@ -3,6 +3,7 @@ import os
 import time
 import glob
 import sentry_sdk
+from functools import partial
 from pathlib import Path
 from .menu_item import MenuItem, SubMenu
 
@@ -53,21 +54,21 @@ class BulkDeleteManager:
             # Добавляем пункты меню для папок с указанием количества файлов
             folder_a_item = MenuItem(
                 f"Папка A [{files_in_a} {self._get_files_word(files_in_a)}]",
-                action=lambda: self.confirm_delete_folder("A", files_in_a),
+                action=partial(self.confirm_delete_folder, "A", files_in_a),
                 speech_text="Папка A"  # Только название папки для озвучки
             )
             delete_menu.add_item(folder_a_item)
             
             folder_b_item = MenuItem(
                 f"Папка B [{files_in_b} {self._get_files_word(files_in_b)}]",
-                action=lambda: self.confirm_delete_folder("B", files_in_b),
+                action=partial(self.confirm_delete_folder, "B", files_in_b),
                 speech_text="Папка B"  # Только название папки для озвучки
             )
             delete_menu.add_item(folder_b_item)
             
             folder_c_item = MenuItem(
                 f"Папка C [{files_in_c} {self._get_files_word(files_in_c)}]",
-                action=lambda: self.confirm_delete_folder("C", files_in_c),
+                action=partial(self.confirm_delete_folder, "C", files_in_c),
                 speech_text="Папка C"  # Только название папки для озвучки
             )
             delete_menu.add_item(folder_c_item)
@@ -76,7 +77,7 @@ class BulkDeleteManager:
             total_files = files_in_a + files_in_b + files_in_c
             all_folders_item = MenuItem(
                 f"Удалить записи из всех папок [{total_files} {self._get_files_word(total_files)}]",
-                action=lambda: self.confirm_delete_all_folders(files_in_a, files_in_b, files_in_c),
+                action=partial(self.confirm_delete_all_folders, files_in_a, files_in_b, files_in_c),
                 speech_text="Удалить записи из всех папок"
             )
             delete_menu.add_item(all_folders_item)
@@ -137,14 +138,14 @@ class BulkDeleteManager:
             # ВАЖНО: пункт "Нет" должен быть первым
             no_item = MenuItem(
                 "Нет",
-                action=lambda: self.return_to_dictaphone_menu(),
+                action=self.return_to_dictaphone_menu,
                 speech_text="Нет"
             )
             confirm_menu.add_item(no_item)
             
             yes_item = MenuItem(
                 "Да",
-                action=lambda: self.execute_delete_folder(folder),
+                action=partial(self.execute_delete_folder, folder),
                 speech_text="Да"
             )
             confirm_menu.add_item(yes_item)
@@ -227,14 +228,14 @@ class BulkDeleteManager:
             # ВАЖНО: пункт "Нет" должен быть первым
             no_item = MenuItem(
                 "Нет",
-                action=lambda: self.return_to_dictaphone_menu(),
+                action=self.return_to_dictaphone_menu,
                 speech_text="Нет"
             )
             confirm_menu.add_item(no_item)
             
             yes_item = MenuItem(
                 "Да",
-                action=lambda: self.show_final_confirmation_all_folders(),
+                action=self.show_final_confirmation_all_folders,
                 speech_text="Да"
             )
             confirm_menu.add_item(yes_item)
@@ -285,14 +286,14 @@ class BulkDeleteManager:
             # ВАЖНО: пункт "Нет" должен быть первым
             no_item = MenuItem(
                 "Нет",
-                action=lambda: self.return_to_dictaphone_menu(),
+                action=self.return_to_dictaphone_menu,
                 speech_text="Нет"
             )
             final_confirm_menu.add_item(no_item)
             
             yes_item = MenuItem(
                 "Да",
-                action=lambda: self.execute_delete_all_folders(),
+                action=self.execute_delete_all_folders,
                 speech_text="Да"
             )
             final_confirm_menu.add_item(yes_item)
@@ -25,6 +25,9 @@ class DisplayManager:
             # Текущий экран (menu, recording, playback, delete_confirmation)
             self.current_screen = "menu"
             
+            # Содержимое последнего выведенного меню, сбрасывается при очистке экрана
+            self._last_menu_frame = None
+            
             # Размеры экрана
             self.screen_width = 80
             self.screen_height = 24
@@ -36,25 +39,45 @@ class DisplayManager:
             print(error_msg)
             sentry_sdk.capture_exception(e)
     
+    def invalidate(self, screen=None):
+        """
+        Отмечает, что на экране больше нет последнего выведенного меню и кадров
+        других экранов, поэтому следующая отрисовка выполнится полностью
+        
+        Args:
+            screen (str, optional): Экран, который выводится вместо них (None - неизвестно)
+        """
+        self._last_menu_frame = None
+        self.current_screen = screen
+    
     def clear_screen(self):
         """Очищает экран"""
         try:
+            self._last_menu_frame = None
             os.system('cls' if os.name == 'nt' else 'clear')
         except Exception as e:
             error_msg = f"Ошибка при очистке экрана: {e}"
             print(error_msg)
             sentry_sdk.capture_exception(e)
     
-    def display_menu(self, menu):
+    def display_menu(self, menu, force=False):
         """
         Отображает меню
         
         Args:
             menu: Объект меню для отображения
+            force (bool): Перерисовать, даже если на экране уже это же меню
         """
         try:
+            # Если с прошлой отрисовки экран не очищался и меню не изменилось, не перерисовываем.
+            # В режиме отладки в консоль пишут логи, поэтому меню всегда выводится заново
+            frame = (menu.name, menu.current_selection, tuple(item.name for item in menu.items))
+            if not force and not self.debug and frame == self._last_menu_frame:
+                return
+                
             self.current_screen = "menu"
             self.clear_screen()
+            self._last_menu_frame = frame
             
             # Заголовок
             print("=" * self.screen_width)
@@ -95,7 +118,8 @@ class DisplayManager:
             folder (str): Папка для сохранения
         """
         try:
-            self.current_screen = "recording"
+            # Экран меню будет перекрыт
+            self.invalidate("recording")
             self.clear_screen()
             
             # Заголовок
@@ -130,7 +154,8 @@ class DisplayManager:
             folder (str): Папка с файлами
         """
         try:
-            self.current_screen = "playback"
+            # Экран меню будет перекрыт
+            self.invalidate("playback")
             self.clear_screen()
             
             # Заголовок
@@ -173,7 +198,8 @@ class DisplayManager:
             selected_option (str): Выбранный вариант ("Да" или "Нет")
         """
         try:
-            self.current_screen = "delete_confirmation"
+            # Экран меню будет перекрыт
+            self.invalidate("delete_confirmation")
             self.clear_screen()
             
             # Заголовок
@@ -211,6 +237,8 @@ class DisplayManager:
             title (str): Заголовок сообщения
         """
         try:
+            # Экран меню будет перекрыт
+            self.invalidate("message")
             self.clear_screen()
             
             # Заголовок
@@ -233,9 +261,8 @@ class DisplayManager:
     def display_debug_info(self):
         """Отображает отладочную информацию"""
         try:
-            # Сохраняем текущий экран
-            previous_screen = self.current_screen
-            
+            # Экран меню будет перекрыт
+            self.invalidate("debug_info")
             self.clear_screen()
             
             # Заголовок
@@ -252,9 +279,6 @@ class DisplayManager:
             
             print("\n" + "=" * self.screen_width)
             print("Нажмите любую клавишу для возврата...")
-            
-            # Восстанавливаем предыдущий экран
-            self.current_screen = previous_screen
         except Exception as e:
             error_msg = f"Ошибка при отображении отладочной информации: {e}"
             print(error_msg)
@@ -8,6 +8,7 @@ from typing import List, Dict, Optional, Tuple
 import sentry_sdk
 import time
 import glob
+from functools import partial
 
 # Отключаем отладочные сообщения от Sentry
 logging.getLogger('sentry_sdk.errors').setLevel(logging.INFO)
@@ -17,8 +18,8 @@ sentry_sdk.init(
     dsn="https://990b663058427f36a87004fc14319c09@o4508953992101888.ingest.de.sentry.io/4508953994330192",
     # Добавляем данные о пользователе и запросах
     send_default_pii=True,
-    # Включаем отслеживание исключений в фоновых потоках
-    enable_tracing=True,
+    # Трассируем только часть операций, чтобы отправка в Sentry не нагружала сеть
+    traces_sample_rate=0.1,
 )
 
 from menu.base_menu import BaseMenu
@@ -37,6 +38,8 @@ SETTINGS_FILE = "/home/aleks/cache_tts/settings.json"
 class FolderMenuItem(MenuItem):
     """Класс для представления пунктов меню папок"""
     
+    __slots__ = ('folder_name',)
+    
     def __init__(self, name, folder_name, action):
         """
         Инициализирует пункт меню папки
@@ -650,7 +653,7 @@ class ExternalStorageMenu(BaseMenu):
             copy_all_item = MenuItem(
                 name=f"Скопировать все аудиозаписи из всех папок ({self._format_size(all_files_size)})",
                 speech_text=f"Скопировать все аудиозаписи из всех папок",
-                action=lambda: self._perform_copy_operation(records_dir, mount_point, all_files_size, free_space, copy_all=True)
+                action=partial(self._perform_copy_operation, records_dir, mount_point, all_files_size, free_space, copy_all=True)
             )
             copy_menu.add_item(copy_all_item)
             
@@ -661,10 +664,11 @@ class ExternalStorageMenu(BaseMenu):
                     folder_item = MenuItem(
                         name=f"Скопировать все аудиозаписи из папки {folder} ({self._format_size(folder_sizes[folder])})",
                         speech_text=f"Скопировать все аудиозаписи из папки {folder}",
-                        action=lambda f=folder, s=folder_sizes[folder]: self._perform_copy_operation(
-                            os.path.join(records_dir, f), 
-                            mount_point, 
-                            s, 
+                        action=partial(
+                            self._perform_copy_operation,
+                            os.path.join(records_dir, folder),
+                            mount_point,
+                            folder_sizes[folder],
                             free_space
                         )
                     )
@@ -964,13 +968,13 @@ class ExternalStorageMenu(BaseMenu):
             device_menu.add_item(MenuItem(
                 name="Посмотреть файлы на флешке",
                 speech_text="Посмотреть файлы на флешке",
-                action=lambda: self._list_files(device_info['mount_point'])
+                action=partial(self._list_files, device_info['mount_point'])
             ))
             
             device_menu.add_item(MenuItem(
                 name="Скопировать файлы на флешку",
                 speech_text="Скопировать файлы на флешку",
-                action=lambda: self._copy_files_to_usb(device_info['mount_point'], device_info.get('filesystem', 'Неизвестно'))
+                action=partial(self._copy_files_to_usb, device_info['mount_point'], device_info.get('filesystem', 'Неизвестно'))
             ))
             
             # Устанавливаем родительское меню
@@ -1096,7 +1100,7 @@ class ExternalStorageMenu(BaseMenu):
                     device_item = MenuItem(
                         name=title, 
                         speech_text=title,
-                        action=lambda dev=device: self.create_device_menu(dev)
+                        action=partial(self.create_device_menu, device)
                     )
                     self.add_item(device_item)
                 
@@ -1168,20 +1172,17 @@ class ExternalStorageMenu(BaseMenu):
             menu_name = f"{device_name} ({free_space})"
             device_menu = SubMenu(name=menu_name)
             
-            # Сохраняем информацию об устройстве в меню
-            device_menu.device_info = device_info
-            
             # Добавляем пункты меню
             device_menu.add_item(MenuItem(
                 name="Посмотреть файлы на флешке",
                 speech_text="Посмотреть файлы на флешке",
-                action=lambda: self._list_files(mount_point)
+                action=partial(self._list_files, mount_point)
             ))
             
             device_menu.add_item(MenuItem(
                 name="Скопировать файлы на флешку",
                 speech_text="Скопировать файлы на флешку",
-                action=lambda: self._copy_files_to_usb(mount_point, filesystem)
+                action=partial(self._copy_files_to_usb, mount_point, filesystem)
             ))
             
             # Устанавливаем родительское меню
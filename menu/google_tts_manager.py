@@ -5,6 +5,7 @@ import hashlib
 import threading
 import subprocess
 import json
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 from google.cloud import texttospeech
 from google.cloud import monitoring_v3
@@ -26,6 +27,9 @@ class GoogleTTSManager:
     # Бесплатный лимит в месяц (в символах)
     FREE_MONTHLY_CHARS = 1000000  # 1 миллион символов
     
+    # Количество одновременных запросов к API при предварительной генерации
+    PRE_GENERATE_WORKERS = 4
+    
     def __init__(self, cache_dir="/home/aleks/cache_tts", credentials_file="credentials-google-api.json", 
                  lang="ru-RU", debug=False, use_wav=True, voice="ru-RU-Standard-A", settings_manager=None):
         """
@@ -46,7 +50,18 @@ class GoogleTTSManager:
             self.lang = lang
             self.current_sound_process = None
             self.is_playing = False
+            # Событие окончания текущей фразы (установлено, когда ничего не звучит)
+            self.speech_done = threading.Event()
+            self.speech_done.set()
+            # Защищает процесс озвучки и событие окончания фразы: play_speech и
+            # stop_current_sound вызываются из разных потоков меню
+            self._sound_lock = threading.Lock()
+            # Растет при каждом запуске фразы и каждой остановке извне (под _sound_lock):
+            # по нему play_speech_blocking узнает, что его сообщение прервали
+            self._speech_serial = 0
             self.cache_lock = threading.Lock()
+            # Блокировки отдельных файлов кэша: одну фразу одновременно генерирует только один поток
+            self._key_locks = {}
             self.debug = debug
             self.use_wav = use_wav
             self.settings_manager = settings_manager
@@ -459,6 +474,48 @@ class GoogleTTSManager:
         else:
             return os.path.join(self.cache_dir, f"{filename}.mp3")
     
+    def cached_keys(self, use_wav=None):
+        """
+        Возвращает имена (без расширения) уже сгенерированных файлов Google Cloud TTS
+        
+        Args:
+            use_wav (bool, optional): Искать WAV вместо MP3
+            
+        Returns:
+            set: Множество имен файлов в кэше
+        """
+        if use_wav is None:
+            use_wav = self.use_wav
+            
+        ext = ".wav" if use_wav else ".mp3"
+        
+        try:
+            return {
+                name[:-len(ext)]
+                for name in os.listdir(self.cache_dir)
+                if name.startswith("gc_") and name.endswith(ext)
+            }
+        except OSError as e:
+            print(f"Ошибка при чтении каталога кэша: {e}")
+            sentry_sdk.capture_exception(e)
+            return set()
+    
+    def _key_lock(self, key):
+        """
+        Возвращает блокировку для файла кэша
+        
+        Args:
+            key (str): Путь к файлу кэша
+            
+        Returns:
+            threading.Lock: Блокировка, общая для всех потоков, работающих с этим файлом
+        """
+        with self.cache_lock:
+            lock = self._key_locks.get(key)
+            if lock is None:
+                lock = self._key_locks[key] = threading.Lock()
+            return lock
+    
     def mp3_to_wav(self, mp3_file):
         """
         Конвертирует MP3 в WAV
@@ -475,6 +532,9 @@ class GoogleTTSManager:
         if os.path.exists(wav_file):
             return wav_file
             
+        # Конвертируем во временный файл и переименовываем его целиком,
+        # чтобы плеер никогда не открыл недописанный WAV
+        tmp_file = wav_file + ".tmp"
         try:
             # Проверяем, установлен ли ffmpeg
             if self.debug:
@@ -482,19 +542,34 @@ class GoogleTTSManager:
                 
             # Используем mpg123 для конвертации, так как он скорее всего установлен
             subprocess.run(
-                ["mpg123", "-w", wav_file, mp3_file],
+                ["mpg123", "-w", tmp_file, mp3_file],
                 stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
                 check=True
             )
+            os.replace(tmp_file, wav_file)
             
             return wav_file
         except subprocess.CalledProcessError as e:
             print(f"Ошибка при конвертации MP3 в WAV: {e}")
+            self._remove_tmp(tmp_file)
             return None
         except FileNotFoundError:
             print("mpg123 не найден, конвертация невозможна")
             return None
     
+    def _remove_tmp(self, tmp_file):
+        """
+        Удаляет временный файл, оставшийся после неудачной записи
+        
+        Args:
+            tmp_file (str): Путь к временному файлу
+        """
+        try:
+            if os.path.exists(tmp_file):
+                os.remove(tmp_file)
+        except OSError as e:
+            print(f"Не удалось удалить временный файл {tmp_file}: {e}")
+    
     def generate_speech(self, text, force_regenerate=False, voice=None):
         """
         Генерирует озвучку текста с помощью Google Cloud TTS и сохраняет в кэш
@@ -519,7 +594,10 @@ class GoogleTTSManager:
         if self.use_wav:
             wav_file = self.get_cached_filename(text, use_wav=True, voice=voice)
         
-        with self.cache_lock:
+        # Одну и ту же фразу генерирует только один поток: остальные дожидаются
+        # его и берут готовый файл из кэша, не оплачивая повторный запрос к API.
+        # Разные фразы по-прежнему синтезируются параллельно
+        with self._key_lock(mp3_file):
             # Проверяем наличие файлов в кэше
             mp3_exists = os.path.exists(mp3_file)
             wav_exists = wav_file and os.path.exists(wav_file)
@@ -528,8 +606,9 @@ class GoogleTTSManager:
             if (not self.use_wav and mp3_exists and not force_regenerate) or \
                (self.use_wav and wav_exists and not force_regenerate):
                 # Увеличиваем счётчик использования кэша
-                self.stats["cached_used"] += 1
-                self._save_stats()
+                with self.cache_lock:
+                    self.stats["cached_used"] += 1
+                    self._save_stats()
                 
                 if self.debug:
                     print(f"Использован кэш для: {text} (голос: {voice})")
@@ -542,8 +621,9 @@ class GoogleTTSManager:
                 wav_result = self.mp3_to_wav(mp3_file)
                 if wav_result:
                     # Увеличиваем счётчик использования кэша
-                    self.stats["cached_used"] += 1
-                    self._save_stats()
+                    with self.cache_lock:
+                        self.stats["cached_used"] += 1
+                        self._save_stats()
                     
                     if self.debug:
                         print(f"Использован кэш (конвертация в WAV) для: {text} (голос: {voice})")
@@ -552,17 +632,9 @@ class GoogleTTSManager:
                 
             if self.debug:
                 print(f"Генерация озвучки для: {text} (голос: {voice})")
-                
-            # Увеличиваем счетчики запросов
-            self.stats["total_requests"] += 1
-            self.stats["today_requests"] += 1
-            
-            # Увеличиваем счетчик символов
-            char_count = len(text)
-            self.stats["total_chars"] += char_count
             
-            # Замеряем время запроса
             start_time = time.time()
+            tmp_file = mp3_file + ".tmp"
             
             try:
                 # Создаем запрос к Google Cloud TTS API
@@ -586,9 +658,11 @@ class GoogleTTSManager:
                     audio_config=audio_config
                 )
                 
-                # Сохраняем аудио в файл
-                with open(mp3_file, "wb") as out:
+                # Сохраняем аудио во временный файл и переименовываем его целиком,
+                # чтобы плеер никогда не открыл недописанный MP3
+                with open(tmp_file, "wb") as out:
                     out.write(response.audio_content)
+                os.replace(tmp_file, mp3_file)
                 
                 # Если нужен WAV, конвертируем MP3 в WAV
                 result_file = mp3_file
@@ -599,30 +673,38 @@ class GoogleTTSManager:
                 
                 # Вычисляем время выполнения
                 elapsed_time = time.time() - start_time
-                
-                # Записываем в историю
-                self.stats["requests_history"].append({
-                    "text": text,
-                    "time": elapsed_time,
-                    "date": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                    "voice": voice,
-                    "chars": char_count
-                })
-                
-                # Ограничиваем историю до 100 последних запросов
-                if len(self.stats["requests_history"]) > 100:
-                    self.stats["requests_history"] = self.stats["requests_history"][-100:]
-                    
-                # Обновляем метрики использования
-                self._update_usage_metrics()
-                
-                # Сохраняем статистику
-                self._save_stats()
-                
-                return result_file
             except Exception as e:
                 print(f"Ошибка при генерации озвучки: {e}")
+                self._remove_tmp(tmp_file)
                 return None
+        
+        with self.cache_lock:
+            # Запрос выполнен, учитываем его в счетчиках запросов и символов
+            char_count = len(text)
+            self.stats["total_requests"] += 1
+            self.stats["today_requests"] += 1
+            self.stats["total_chars"] += char_count
+            
+            # Записываем в историю
+            self.stats["requests_history"].append({
+                "text": text,
+                "time": elapsed_time,
+                "date": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                "voice": voice,
+                "chars": char_count
+            })
+            
+            # Ограничиваем историю до 100 последних запросов
+            if len(self.stats["requests_history"]) > 100:
+                self.stats["requests_history"] = self.stats["requests_history"][-100:]
+                
+            # Обновляем метрики использования
+            self._update_usage_metrics()
+            
+            # Сохраняем статистику
+            self._save_stats()
+        
+        return result_file
     
     def get_usage_info(self):
         """
@@ -678,8 +760,10 @@ class GoogleTTSManager:
             if voice is None:
                 voice = self.voice
                 
-            # Если уже что-то воспроизводится, останавливаем
-            self.stop_current_sound()
+            # Если уже что-то воспроизводится, останавливаем. Это не остановка извне,
+            # поэтому _speech_serial увеличит только запуск новой фразы
+            with self._sound_lock:
+                self._stop_process_locked()
             
             # Генерируем озвучку
             audio_file = self.generate_speech(text, force_regenerate=False, voice=voice)
@@ -700,37 +784,49 @@ class GoogleTTSManager:
                 # Используем экспоненциальную шкалу для более естественного изменения громкости
                 volume_exp = (volume / 100.0) ** 2
                 
-                # Запускаем процесс воспроизведения звука с указанной громкостью
-                if self.use_wav:
-                    # Для WAV используем paplay или aplay с контролем громкости
-                    try:
-                        # paplay использует линейную шкалу от 0 до 65536
-                        volume_paplay = int(volume_exp * 65536)
-                        self.current_sound_process = subprocess.Popen(
-                            ["paplay", "--volume", str(volume_paplay), audio_file],
-                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
-                        )
-                    except:
-                        # Если paplay не доступен, пробуем aplay с softvol
-                        # aplay использует линейную шкалу от 0 до 100
-                        volume_aplay = int(volume_exp * 100)
+                # Процесс запускается под блокировкой: звук, начатый другим потоком
+                # после остановки выше, тоже останавливается, а speech_done
+                # всегда относится к последней запущенной фразе
+                with self._sound_lock:
+                    self._stop_process_locked()
+                    
+                    # Запускаем процесс воспроизведения звука с указанной громкостью
+                    if self.use_wav:
+                        # Для WAV используем paplay или aplay с контролем громкости
+                        try:
+                            # paplay использует линейную шкалу от 0 до 65536
+                            volume_paplay = int(volume_exp * 65536)
+                            self.current_sound_process = subprocess.Popen(
+                                ["paplay", "--volume", str(volume_paplay), audio_file],
+                                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+                            )
+                        except:
+                            # Если paplay не доступен, пробуем aplay с softvol
+                            # aplay использует линейную шкалу от 0 до 100
+                            volume_aplay = int(volume_exp * 100)
+                            self.current_sound_process = subprocess.Popen(
+                                ["aplay", "-D", f"softvol,softvol=volume={volume_aplay}", audio_file],
+                                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+                            )
+                    else:
+                        # Для MP3 используем mpg123 с контролем громкости
+                        # mpg123 использует линейную шкалу от 0 до 32768
+                        volume_mpg123 = int(volume_exp * 32768)
                         self.current_sound_process = subprocess.Popen(
-                            ["aplay", "-D", f"softvol,softvol=volume={volume_aplay}", audio_file],
+                            ["mpg123", "-f", str(volume_mpg123), audio_file],
                             stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
                         )
-                else:
-                    # Для MP3 используем mpg123 с контролем громкости
-                    # mpg123 использует линейную шкалу от 0 до 32768
-                    volume_mpg123 = int(volume_exp * 32768)
-                    self.current_sound_process = subprocess.Popen(
-                        ["mpg123", "-f", str(volume_mpg123), audio_file],
-                        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+                        
+                    # Запускаем поток ожидания завершения воспроизведения
+                    self.is_playing = True
+                    self._speech_serial += 1
+                    self.speech_done = threading.Event()
+                    wait_thread = threading.Thread(
+                        target=self.wait_completion,
+                        args=(self.current_sound_process, self.speech_done),
+                        daemon=True
                     )
-                    
-                # Запускаем поток ожидания завершения воспроизведения
-                self.is_playing = True
-                wait_thread = threading.Thread(target=self.wait_completion, daemon=True)
-                wait_thread.start()
+                    wait_thread.start()
                 
                 # Если нужен блокирующий режим, ждем завершения
                 if blocking:
@@ -748,24 +844,56 @@ class GoogleTTSManager:
             sentry_sdk.capture_exception(e)
             return False
     
-    def wait_completion(self):
-        """Ожидает завершения воспроизведения звука"""
-        if self.current_sound_process:
-            self.current_sound_process.wait()
-            self.is_playing = False
-            self.current_sound_process = None
+    def wait_completion(self, process=None, done_event=None):
+        """
+        Ожидает завершения воспроизведения звука
+        
+        Args:
+            process (subprocess.Popen, optional): Процесс воспроизведения
+            done_event (threading.Event, optional): Событие, устанавливаемое по окончании
+        """
+        process = process or self.current_sound_process
+        if process:
+            process.wait()
+            # Процесс мог быть уже заменен следующей фразой
+            with self._sound_lock:
+                if self.current_sound_process is process:
+                    self.is_playing = False
+                    self.current_sound_process = None
+        if done_event:
+            done_event.set()
+    
+    def wait_for_speech(self, timeout=None):
+        """
+        Ожидает окончания текущей фразы
+        
+        Args:
+            timeout (float, optional): Максимальное время ожидания в секундах
+            
+        Returns:
+            bool: True, если фраза закончилась, False по таймауту
+        """
+        return self.speech_done.wait(timeout)
     
     def stop_current_sound(self):
         """Останавливает текущий воспроизводимый звук"""
-        if self.current_sound_process and self.current_sound_process.poll() is None:
+        with self._sound_lock:
+            self._speech_serial += 1
+            self._stop_process_locked()
+    
+    def _stop_process_locked(self):
+        """Останавливает текущий процесс озвучки, вызывается под _sound_lock"""
+        process = self.current_sound_process
+        if process and process.poll() is None:
             try:
-                self.current_sound_process.terminate()
-                self.current_sound_process.wait()
+                process.terminate()
+                process.wait()
             except:
                 pass
                 
         self.is_playing = False
         self.current_sound_process = None
+        self.speech_done.set()
     
     def pre_generate_menu_items(self, menu_items, voices=None):
         """
@@ -778,23 +906,15 @@ class GoogleTTSManager:
         if not voices:
             voices = [self.voice]  # По умолчанию только текущий голос
             
-        # Удаляем дубликаты из списка текстов
-        unique_items = set(menu_items)
-        
-        total_items = len(unique_items) * len(voices)
-        processed = 0
-        total_chars = 0
+        # Удаляем дубликаты из списка текстов, сохраняя порядок
+        unique_items = list(dict.fromkeys(menu_items))
         
         if self.debug:
             print(f"Предварительная генерация озвучки для {len(unique_items)} уникальных текстов в {len(voices)} голосах")
         
-        for voice in voices:
-            for text in unique_items:
-                self.generate_speech(text, force_regenerate=False, voice=voice)
-                processed += 1
-                total_chars += len(text)
-                if self.debug:
-                    print(f"Предварительная генерация: {processed}/{total_items} - {text} (голос: {voice})")
+        items = [(text, voice) for voice in voices for text in unique_items]
+        total_chars = sum(len(text) for text, _ in items)
+        self._generate_in_pool(items, "Предварительная генерация")
         
         # Обновляем метрики использования
         self._update_usage_metrics()
@@ -818,22 +938,23 @@ class GoogleTTSManager:
         if not voices:
             voices = [self.voice]  # По умолчанию только текущий голос
             
-        # Удаляем дубликаты из списка текстов
-        unique_items = set(menu_items)
+        # Удаляем дубликаты из списка текстов, сохраняя порядок
+        unique_items = list(dict.fromkeys(menu_items))
         
         missing_items = []
         
-        # Проверяем наличие файлов и составляем список отсутствующих
+        # Проверяем наличие файлов одним чтением каталога кэша
+        # вместо отдельной проверки существования для каждого текста
+        cached = self.cached_keys(use_wav=False)
         for voice in voices:
             for text in unique_items:
                 # Получаем имя файла без проверки существования
                 filename = self.get_cached_filename(text, use_wav=False, voice=voice)
-                if not os.path.exists(filename):
+                if os.path.splitext(os.path.basename(filename))[0] not in cached:
                     missing_items.append((text, voice))
         
         total_missing = len(missing_items)
-        processed = 0
-        total_chars = 0
+        total_chars = sum(len(text) for text, _ in missing_items)
         
         if self.debug:
             print(f"Предварительная генерация отсутствующей озвучки: найдено {total_missing} из {len(unique_items) * len(voices)} возможных файлов")
@@ -842,12 +963,7 @@ class GoogleTTSManager:
             print("Все аудиофайлы Google Cloud TTS уже сгенерированы. Нет необходимости в дополнительной генерации.")
             return
         
-        for text, voice in missing_items:
-            self.generate_speech(text, force_regenerate=False, voice=voice)
-            processed += 1
-            total_chars += len(text)
-            if self.debug:
-                print(f"Генерация Google Cloud TTS: {processed}/{total_missing} - {text} (голос: {voice})")
+        self._generate_in_pool(missing_items, "Генерация Google Cloud TTS")
         
         # Обновляем метрики использования
         self._update_usage_metrics()
@@ -858,4 +974,48 @@ class GoogleTTSManager:
             usage_info = self.get_usage_info()
             print(f"Использовано символов в этом месяце: {usage_info['monthly_chars_used']}")
             print(f"Осталось бесплатных символов: {usage_info['remaining_free_chars']}")
-            print(f"Общая стоимость: ${usage_info['estimated_cost']:.2f}") 
\ No newline at end of file
+            print(f"Общая стоимость: ${usage_info['estimated_cost']:.2f}") 
+    
+    def _generate_in_pool(self, items, label):
+        """
+        Генерирует озвучку для набора фраз в пуле потоков
+        
+        Args:
+            items (list): Список пар (текст, голос)
+            label (str): Подпись для отладочного вывода прогресса
+            
+        Returns:
+            int: Количество фраз, которые не удалось сгенерировать
+        """
+        total = len(items)
+        processed = 0
+        failed = 0
+        
+        with ThreadPoolExecutor(max_workers=self.PRE_GENERATE_WORKERS) as executor:
+            futures = {
+                executor.submit(self.generate_speech, text, False, voice): (text, voice)
+                for text, voice in items
+            }
+            for future in as_completed(futures):
+                text, voice = futures[future]
+                processed += 1
+                try:
+                    # generate_speech сообщает об ошибке синтеза, возвращая None
+                    generated = future.result() is not None
+                except Exception as e:
+                    error_msg = f"Ошибка при генерации озвучки для '{text}': {e}"
+                    print(error_msg)
+                    sentry_sdk.capture_exception(e)
+                    generated = False
+                if not generated:
+                    failed += 1
+                if self.debug:
+                    status = "готово" if generated else "ошибка"
+                    print(f"{label}: {processed}/{total} - {text} (голос: {voice}) - {status}")
+        
+        if failed:
+            print(f"{label}: не удалось сгенерировать {failed} из {total} фраз")
+        elif self.debug:
+            print(f"{label}: все фразы сгенерированы ({total})")
+        
+        return failed
@@ -19,6 +19,10 @@ KEY_VOLUMEDOWN = 114  # Клавиша Volume Down
 class InputHandler:
     """Класс для обработки ввода с пульта"""
     
+    # Время обработки нажатия (в секундах), после которого в режиме отладки
+    # выводится предупреждение о блокировке цикла ввода
+    SLOW_HANDLER_THRESHOLD = 0.1
+    
     def __init__(self, menu_manager, target_device_name="HAOBO Technology USB Composite Device Keyboard"):
         """
         Инициализация обработчика ввода
@@ -146,8 +150,14 @@ class InputHandler:
                             return
                     
                     # Если не обработано PlaybackManager, передаем в MenuManager
+                    start_time = time.monotonic()
                     self.menu_manager.handle_button_press(key_id)
                     
+                    # Долгий обработчик задерживает чтение следующих нажатий
+                    elapsed = time.monotonic() - start_time
+                    if self.debug and elapsed > self.SLOW_HANDLER_THRESHOLD:
+                        print(f"[INPUT] Обработка {key_id} заблокировала цикл ввода на {elapsed:.2f} с")
+                    
                 # Обработка отпускания
                 elif event.value == 0:  # Отпускание
                     # Сначала проверяем PlaybackManager
@@ -4,6 +4,10 @@ import sentry_sdk
 class MenuItem:
     """Базовый класс для пунктов меню"""
     
+    # Фиксированный набор атрибутов: дерево меню состоит из десятков узлов,
+    # поэтому экономим память на __dict__ и ускоряем доступ к атрибутам
+    __slots__ = ('name', 'action', 'speech_text', 'on_focus')
+    
     def __init__(self, name, action=None, speech_text=None):
         """
         Инициализация пункта меню
@@ -18,6 +22,7 @@ class MenuItem:
             self.action = action
             # Если текст для озвучки не указан, используем название пункта
             self.speech_text = speech_text if speech_text else name
+            self.on_focus = None  # Обработчик наведения на пункт меню
         except Exception as e:
             error_msg = f"Ошибка при инициализации MenuItem: {e}"
             print(error_msg)
@@ -53,6 +58,8 @@ class MenuItem:
 class SubMenu(MenuItem):
     """Класс для подменю, содержащего другие пункты меню"""
     
+    __slots__ = ('parent', 'items', 'current_selection', 'on_enter', 'loader')
+    
     def __init__(self, name, parent=None, speech_text=None):
         """
         Инициализация подменю
@@ -68,6 +75,8 @@ class SubMenu(MenuItem):
             self.items = []
             self.current_selection = 0
             self.on_enter = None  # Добавляем обработчик события входа в меню
+            # Догрузка пунктов порциями: функция добавляет порцию и возвращает True, если пункты еще остались
+            self.loader = None
         except Exception as e:
             error_msg = f"Ошибка при инициализации SubMenu: {e}"
             print(error_msg)
@@ -84,6 +93,19 @@ class SubMenu(MenuItem):
             print(error_msg)
             sentry_sdk.capture_exception(e)
     
+    def extend_items(self, items):
+        """Добавляет в подменю несколько пунктов меню за один вызов"""
+        try:
+            items = list(items)
+            self.items.extend(items)
+            for item in items:
+                if isinstance(item, SubMenu):
+                    item.parent = self
+        except Exception as e:
+            error_msg = f"Ошибка при добавлении пунктов меню: {e}"
+            print(error_msg)
+            sentry_sdk.capture_exception(e)
+    
     def select(self):
         """Вызывается при выборе подменю"""
         try:
@@ -112,11 +134,32 @@ class SubMenu(MenuItem):
             sentry_sdk.capture_exception(e)
             return None
     
+    def load_more(self):
+        """
+        Догружает следующую порцию пунктов меню через loader
+        
+        Returns:
+            bool: True, если после этого в меню еще остались незагруженные пункты
+        """
+        try:
+            if self.loader and not self.loader():
+                self.loader = None
+        except Exception as e:
+            self.loader = None
+            error_msg = f"Ошибка при догрузке пунктов меню: {e}"
+            print(error_msg)
+            sentry_sdk.capture_exception(e)
+        return self.loader is not None
+    
     def move_up(self):
         """Перемещение вверх по списку пунктов меню (циклически)"""
         try:
             if not self.items:
                 return
+            # Для перехода с первого пункта на последний нужен весь список
+            if self.current_selection == 0:
+                while self.load_more():
+                    pass
             self.current_selection = (self.current_selection - 1) % len(self.items)
         except Exception as e:
             error_msg = f"Ошибка при перемещении вверх по меню: {e}"
@@ -128,11 +171,35 @@ class SubMenu(MenuItem):
         try:
             if not self.items:
                 return
+            # Догружаем следующую порцию, когда курсор дошел до последнего загруженного пункта
+            if self.loader and self.current_selection + 1 >= len(self.items):
+                self.load_more()
             self.current_selection = (self.current_selection + 1) % len(self.items)
         except Exception as e:
             error_msg = f"Ошибка при перемещении вниз по меню: {e}"
             print(error_msg)
             sentry_sdk.capture_exception(e)
 
+class SubMenuItem(MenuItem):
+    """Пункт меню, открывающий уже готовое меню (без промежуточной функции)"""
+    
+    __slots__ = ('submenu',)
+    
+    def __init__(self, name, submenu, speech_text=None):
+        """
+        Инициализация пункта-обертки для меню
+        
+        Args:
+            name (str): Название пункта меню
+            submenu (SubMenu): Меню, которое открывается при выборе пункта
+            speech_text (str, optional): Текст для озвучки, если отличается от name
+        """
+        super().__init__(name, None, speech_text)
+        self.submenu = submenu
+    
+    def select(self):
+        """Возвращает меню, в которое нужно перейти"""
+        return self.submenu
+
 # Добавляем псевдоним для SubMenu, чтобы исправить импорты
 Menu = SubMenu
\ No newline at end of file
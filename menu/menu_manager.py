@@ -1,18 +1,21 @@
 #!/usr/bin/env python3
 import os
-import sys
 import time
-import importlib
+import queue
+import atexit
+import threading
 import sentry_sdk
 import logging
-from pathlib import Path
+import logging.handlers
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from .tts_manager import TTSManager
 from .display_manager import DisplayManager
 from .recorder_manager import RecorderManager
 from .playback_manager import PlaybackManager
 from .settings_manager import SettingsManager
 from .audio_recorder import AudioRecorder
-from .menu_item import MenuItem, SubMenu, Menu
+from .menu_item import MenuItem, SubMenu, SubMenuItem
 from .external_storage_menu import ExternalStorageMenu
 from .base_menu import BaseMenu
 from .bulk_delete_manager import BulkDeleteManager
@@ -22,10 +25,218 @@ from .microphone_selector import MicrophoneSelector
 # Настройка логирования
 logger = logging.getLogger("menu_manager")
 
+# Поток, выводящий сообщения логгера меню (создается при первом MenuManager)
+_log_listener = None
+
+
+def _setup_queue_logging():
+    """
+    Переводит логгер меню на очередь: сообщения выводит отдельный поток
+    QueueListener, поэтому поток меню не ждет записи в консоль
+    """
+    global _log_listener
+    if _log_listener is not None:
+        return
+        
+    log_queue = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+    
+    _log_listener = logging.handlers.QueueListener(log_queue, stream_handler)
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
+    
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    logger.propagate = False
+
+# Системные сообщения, которые озвучиваются вне дерева меню.
+# Собираются один раз при импорте и используются при предварительной генерации озвучки.
+_SYSTEM_SPEECH = (
+    # Сообщения для возврата
+    "Возврат в",
+    "главное меню",
+    "предыдущее меню",
+    "Голос успешно изменен",
+
+    # Сообщения для диктофона
+    "Запись началась",
+    "Запись приостановлена",
+    "Запись возобновлена",
+    "Запись остановлена",
+    "Запись сохранена в папку",  # Первая часть сообщения
+    "Запись отменена",
+    "Выберите папку для записи",
+    "Папка A",
+    "Папка B",
+    "Папка C",
+
+    # Сообщения для информации о файлах в папках
+    "В папке",  # Первая часть сообщения
+    "нет записей",  # Третья часть сообщения
+    "файл",
+    "файла",
+    "файлов",
+
+    # Слово "Папка" для навигации по файлам на флешке
+    "Папка",
+
+    # Сообщения для воспроизведения
+    "Воспроизведение",
+    "Пауза",
+    "Прослушано",
+    "Переключаю вперед на запись",
+    "Переключаю назад на запись",
+    "Ошибка при переключении трека",
+
+    # Сообщения для удаления файлов
+    "Вы точно хотите удалить эту запись",
+    "Запись успешно удалена",
+    "Ошибка при удалении записи",
+
+    # Сообщения для массового удаления записей
+    "Массовое удаление записей",
+    "Удалить записи из всех папок",
+    "Вы действительно хотите удалить все записи из папки",
+    "Вы точно хотите удалить все записи из всех папок",
+    "Финальное подтверждение удаления всех записей",
+    "Количество записей",
+    "В папке нет записей",
+    "Нет записей во всех папках",
+    "Ошибка при удалении записей из папки",
+    "Ошибка при удалении записей из всех папок",
+    "запись",
+    "записи",
+    "записей",
+
+    # Сообщения для внешнего носителя
+    "Недостаточно места на флешке",
+    "Копирование успешно завершено",
+    "Возврат в режим внешнего носителя",
+    "Произошла ошибка при копировании файлов",
+    "Флешка была отключена",
+    "Директория с записями не найдена",
+    "Скопировать все аудиозаписи из всех папок",
+    "Скопировать все аудиозаписи из папки",
+
+    # Сообщения для настроек громкости
+    "Установлен уровень громкости",
+    "Уровень громкости",
+    "Сейчас установлен уровень громкости",
+) + tuple(
+    # Числа для сообщений о количестве файлов (до 99) и уровней громкости (0-6)
+    str(count) for count in range(100)
+)
+
+# Папки диктофона и названия их пунктов меню
+_FOLDERS = ("A", "B", "C")
+_FOLDER_LABELS = {folder: f"Папка {folder}" for folder in _FOLDERS}
+_RECORDER_FOLDER_TEXTS = frozenset(_FOLDER_LABELS.values())
+
+# Начальные состояния записи и воспроизведения, каждому MenuManager выдается копия
+_RECORDING_STATE_TEMPLATE = {
+    "active": False,
+    "paused": False,
+    "folder": None,
+    "elapsed_time": 0,
+    "formatted_time": "00:00:00",
+    "max_duration_handled": False
+}
+_PLAYBACK_STATE_TEMPLATE = {
+    "active": False,
+    "paused": False,
+    "folder": None,
+    "current_file": None,
+    "position": "00:00:00",
+    "duration": "00:00:00",
+    "progress": 0
+}
+
+# Метрики Google Cloud TTS в отладочной информации (в порядке вывода)
+_GOOGLE_METRICS_KEYS = (
+    "total_requests",
+    "today_requests",
+    "total_chars",
+    "monthly_chars_used",
+    "remaining_free_chars",
+    "voice_type",
+    "price_per_million",
+    "estimated_cost",
+    "last_update",
+)
+
+# Форматирование числовых метрик, остальные выводятся как есть
+_GOOGLE_METRICS_FORMATTERS = {
+    "total_chars": "{:,}".format,
+    "monthly_chars_used": "{:,}".format,
+    "remaining_free_chars": "{:,}".format,
+    "price_per_million": "${:.2f}".format,
+    "estimated_cost": "${:.2f}".format,
+}
+
+# Описание меню режима звонка (см. MenuManager._build_menu)
+_CALL_MENU_SPEC = ("Режим звонка", [
+    ("Принять звонок", [
+        ("Входящий вызов", [
+            ("Да", "Звонок принят"),
+            ("Нет", "Звонок отклонен"),
+        ]),
+    ]),
+    ("Совершить звонок", [
+        ("Избранные контакты", [
+            ("NAME1", "Звонок NAME1"),
+            ("NAME2", "Звонок NAME2"),
+            ("Удалить избранный контакт", "Удаление контакта"),
+            ("Добавить избранный контакт", "Добавление контакта"),
+        ]),
+        ("Последние набранные", [
+            ("NAME", "Звонок NAME (последний)"),
+        ]),
+    ]),
+])
+
+
+def _walk_menu(menu):
+    """
+    Обходит дерево меню в глубину, не озвучивая название самого меню
+    
+    Args:
+        menu (SubMenu): Меню, с которого начинается обход
+        
+    Yields:
+        MenuItem: Очередной пункт меню
+    """
+    stack = [iter(menu.items)]
+    while stack:
+        for item in stack[-1]:
+            yield item
+            if isinstance(item, SubMenu):
+                stack.append(iter(item.items))
+                break
+        else:
+            stack.pop()
+
 class MenuManager:
     """Класс для управления иерархическим меню"""
     
-    def __init__(self, tts_enabled=True, cache_dir="/home/aleks/cache_tts", debug=False, use_wav=True, settings_manager=None, records_dir="/home/aleks/records"):
+    # Время жизни (в секундах) кэша отладочной информации
+    DEBUG_INFO_TTL = 1.0
+    
+    # Время жизни (в секундах) кэша метрик Google Cloud TTS
+    GOOGLE_USAGE_TTL = 10.0
+    
+    # Количество записей, добавляемых в меню файлов за один раз
+    FILES_MENU_BATCH = 10
+    
+    # Сообщение при возврате из аудиоплеера в меню записей
+    RETURN_MESSAGE = "Возврат к {}"
+    
+    # Окно (в секундах), за которое нажатия громкости объединяются в одно изменение
+    VOLUME_DEBOUNCE = 0.03
+    
+    # Повторяющаяся ошибка отправляется в Sentry один раз на столько случаев
+    SENTRY_SAMPLE_EVERY = 10
+    
+    def __init__(self, tts_enabled=True, cache_dir="/home/aleks/cache_tts", debug=False, use_wav=True, settings_manager=None, records_dir="/home/aleks/records", background_pre_generate=True):
         """
         Инициализация менеджера меню
         
@@ -36,21 +247,41 @@ class MenuManager:
             use_wav (bool): Использовать WAV вместо MP3
             settings_manager: Менеджер настроек
             records_dir (str): Директория для записей
+            background_pre_generate (bool): Генерировать озвучку меню в фоне после построения меню.
+                Отключается, когда вызывающий код сам генерирует озвучку синхронно
         """
         self.root_menu = None
         self.current_menu = None
         self.tts_enabled = tts_enabled
+        self.background_pre_generate = background_pre_generate
+        
+        # Фоновые задачи предварительной генерации озвучки, по одной на голос
+        self._pre_generate_jobs = {}
         self.debug = debug
         self.use_wav = use_wav
         self.cache_dir = cache_dir
+        
+        # Уровень логирования задается один раз при запуске: отладочные сообщения
+        # не форматируются, пока режим отладки выключен
+        logger.setLevel(logging.DEBUG if debug else logging.INFO)
+        _setup_queue_logging()
         self.records_dir = records_dir
         
         # Флаг режима аудиоплеера - когда True, все команды идут в аудиоплеер, а не в меню
         self.player_mode_active = False
         
+        # Счетчики повторов ошибок для выборочной отправки в Sentry (см. _capture)
+        self._sentry_sampler = {}
+        
+        # Один рабочий поток для синтеза речи параллельно с остановкой воспроизведения
+        self._tts_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="menu_tts")
+        
         # Инициализация менеджера настроек
         self.settings_manager = settings_manager
         
+        # Текущий голос озвучки, обновляется только в change_voice
+        self._current_voice = settings_manager.get_voice() if settings_manager else None
+        
         # Инициализация менеджера синтеза речи
         if tts_enabled:
             self.tts_manager = TTSManager(
@@ -59,9 +290,15 @@ class MenuManager:
                 use_wav=use_wav,
                 settings_manager=settings_manager
             )
+            # Прогреваем движок в фоне, чтобы не задерживать запуск меню
+            threading.Thread(target=self.tts_manager.prewarm, daemon=True).start()
         else:
             self.tts_manager = None
         
+        # Методы озвучки, привязанные один раз для частых вызовов при навигации
+        self._play_speech = self.tts_manager.play_speech if self.tts_manager else None
+        self._play_speech_blocking = self.tts_manager.play_speech_blocking if self.tts_manager else None
+        
         # Инициализация менеджера записи
         self.recorder_manager = RecorderManager(
             tts_manager=self.tts_manager,
@@ -77,6 +314,11 @@ class MenuManager:
             debug=self.debug
         )
         
+        # Накопленное изменение громкости и таймер его применения (см. _adjust_volume)
+        self._vol_pending = 0
+        self._vol_timer = None
+        self._vol_lock = threading.Lock()
+        
         # Инициализация менеджера массового удаления
         self.bulk_delete_manager = BulkDeleteManager(
             menu_manager=self,
@@ -85,25 +327,30 @@ class MenuManager:
         )
         
         # Состояние записи
-        self.recording_state = {
-            "active": False,
-            "paused": False,
-            "folder": None,
-            "elapsed_time": 0,
-            "formatted_time": "00:00:00",
-            "max_duration_handled": False
-        }
+        self.recording_state = _RECORDING_STATE_TEMPLATE.copy()
         
         # Состояние воспроизведения
-        self.playback_state = {
-            "active": False,
-            "paused": False,
-            "folder": None,
-            "current_file": None,
-            "position": "00:00:00",
-            "duration": "00:00:00",
-            "progress": 0
-        }
+        self.playback_state = _PLAYBACK_STATE_TEMPLATE.copy()
+        
+        # Действия пунктов меню, возвращающих строку, по одному на значение (см. _const)
+        self._const_actions = {}
+        
+        # Все фразы дерева меню и системных сообщений, собранные при построении
+        self._menu_phrases = _SYSTEM_SPEECH
+        
+        # Последние данные, выведенные на экран записи (статус, время, папка)
+        self._last_rendered_recording = None
+        
+        # Последние данные, выведенные на экран воспроизведения
+        self._last_rendered_playback = None
+        
+        # Строка времени воспроизведения и позиция с длительностью, из которых она собрана
+        self._last_pos_dur = None
+        self._last_time_str = ""
+        
+        # Кэш отладочной информации и метрик Google Cloud TTS: (время получения, данные)
+        self._debug_info_cache = (0.0, None)
+        self._google_usage_cache = (0.0, None)
         
         # Регистрируем обратный вызов для обновления информации о записи
         self.recorder_manager.set_update_callback(self._update_recording_info)
@@ -117,12 +364,128 @@ class MenuManager:
         # Меню, из которого был запущен аудиоплеер (для возврата по KEY_BACK)
         self.source_menu = None
         
+        # Меню выбора папки для записи и для воспроизведения, создаются при первом показе
+        self._folder_menu = None
+        self._play_menu = None
+        
         # Флаг для предотвращения двойного озвучивания громкости
         self._volume_announced = False
         
+        # Очередь перерисовки меню после ошибок: не больше одного ожидающего запроса
+        self._ui_queue = queue.Queue(maxsize=1)
+        threading.Thread(target=self._ui_worker, daemon=True).start()
+        
+        # Последний кадр экрана плеера для фоновой отрисовки: новый кадр заменяет неотрисованный
+        self._render_slot = queue.Queue(maxsize=1)
+        threading.Thread(target=self._render_worker, daemon=True).start()
+        
+        # Озвучка навигации в отдельном потоке: новый запрос вытесняет еще не начатый
+        self._tts_pending = None
+        self._tts_lock = threading.Lock()
+        self._tts_event = threading.Event()
+        self._tts_thread = threading.Thread(target=self._tts_loop, daemon=True)
+        self._tts_thread.start()
+        
+        # Предзагрузка озвучки пунктов открытого меню в одном потоке:
+        # новое меню вытесняет еще не обработанное и прерывает текущую предзагрузку
+        self._prefetch_pending = None
+        self._prefetch_lock = threading.Lock()
+        self._prefetch_event = threading.Event()
+        threading.Thread(target=self._prefetch_loop, daemon=True).start()
+        
         # Создаем структуру меню
         self.create_menu_structure()
     
+    def _ui_worker(self):
+        """Перерисовывает меню по запросам из _ui_queue в отдельном потоке"""
+        while True:
+            self._ui_queue.get()
+            try:
+                self.display_current_menu()
+            except Exception as e:
+                error_msg = f"Ошибка при перерисовке меню: {e}"
+                print(error_msg)
+                sentry_sdk.capture_exception(e)
+    
+    def _render_worker(self):
+        """Отрисовывает экран плеера по кадрам из _render_slot в отдельном потоке"""
+        while True:
+            draw, kwargs = self._render_slot.get()
+            # Плеер могли закрыть, пока кадр ждал отрисовки
+            if not self.player_mode_active:
+                continue
+            try:
+                draw(**kwargs)
+            except Exception as e:
+                error_msg = f"Ошибка при отрисовке экрана плеера: {e}"
+                print(error_msg)
+                sentry_sdk.capture_exception(e)
+    
+    def _render_latest(self, draw, **kwargs):
+        """
+        Передает кадр экрана плеера на отрисовку, заменяя еще не отрисованный
+        
+        Args:
+            draw (callable): Метод display_manager для отрисовки
+            **kwargs: Аргументы метода отрисовки
+        """
+        try:
+            self._render_slot.get_nowait()
+        except queue.Empty:
+            pass
+        try:
+            self._render_slot.put_nowait((draw, kwargs))
+        except queue.Full:
+            # Другой поток успел положить более свежий кадр
+            pass
+    
+    def _tts_loop(self):
+        """Озвучивает последний запрос из _tts_pending в отдельном потоке"""
+        while True:
+            self._tts_event.wait()
+            with self._tts_lock:
+                self._tts_event.clear()
+                request, self._tts_pending = self._tts_pending, None
+            if not request:
+                continue
+                
+            texts, voice_id = request
+            try:
+                last = len(texts) - 1
+                for index, text in enumerate(texts):
+                    # Более новый запрос отменяет оставшиеся фразы
+                    if self._tts_event.is_set():
+                        break
+                    if index < last:
+                        self._play_speech_blocking(text, voice_id=voice_id)
+                    else:
+                        # Последняя фраза не блокирует: следующий запрос прервет ее
+                        self._play_speech(text, voice_id=voice_id)
+            except Exception as e:
+                error_msg = f"Ошибка при озвучивании навигации: {e}"
+                print(error_msg)
+                sentry_sdk.capture_exception(e)
+    
+    def _submit_tts(self, texts, voice_id):
+        """
+        Передает фразы в поток озвучки, не дожидаясь воспроизведения
+        
+        Args:
+            texts (tuple): Фразы, которые озвучиваются одна за другой
+            voice_id (str): Идентификатор голоса
+        """
+        with self._tts_lock:
+            self._tts_pending = (texts, voice_id)
+            self._tts_event.set()
+    
+    def _request_redraw(self):
+        """Ставит перерисовку меню в очередь, не дожидаясь ее выполнения"""
+        try:
+            self._ui_queue.put_nowait(True)
+        except queue.Full:
+            # Перерисовка уже ожидает выполнения
+            pass
+    
     def set_root_menu(self, menu):
         """
         Устанавливает корневое меню
@@ -133,84 +496,151 @@ class MenuManager:
         self.root_menu = menu
         self.current_menu = menu
     
-    def display_current_menu(self):
-        """Отображает текущее меню и озвучивает его название"""
+    def display_current_menu(self, speak=True, force=False):
+        """
+        Отображает текущее меню и озвучивает его название
+        
+        Args:
+            speak (bool): Озвучивать текущий пункт меню после отрисовки
+            force (bool): Перерисовать экран, даже если меню на нем не изменилось
+        """
         try:
             if not self.current_menu:
                 return
                 
+            # Состояние меню изменилось, отладочную информацию нужно собрать заново
+            self._invalidate_debug_info()
+            
             # Получаем человеко-читаемое имя меню
             menu_name = self.current_menu.name
             
             # Отладочная информация
-            if self.debug:
-                print(f"\n--- ОТОБРАЖЕНИЕ МЕНЮ: {menu_name} ---")
-                print(f"Количество пунктов: {len(self.current_menu.items)}")
-                print(f"Текущий выбранный пункт: {self.current_menu.current_selection}")
+            logger.debug("--- ОТОБРАЖЕНИЕ МЕНЮ: %s ---", menu_name)
+            logger.debug("Количество пунктов: %s", len(self.current_menu.items))
+            logger.debug("Текущий выбранный пункт: %s", self.current_menu.current_selection)
                 
             # Обновляем отображение меню
             if self.display_manager:
                 try:
-                    self.display_manager.display_menu(self.current_menu)
+                    self.display_manager.display_menu(self.current_menu, force=force)
                 except Exception as display_error:
                     print(f"Ошибка при обновлении дисплея: {display_error}")
                     sentry_sdk.capture_exception(display_error)
             
+            # Заранее готовим озвучку пунктов нового меню, пока озвучивается текущий
+            if self.tts_enabled:
+                self._start_prefetch(self.current_menu)
+            
             # Больше не озвучиваем название меню при входе в него
             # Сразу переходим к озвучиванию текущего пункта меню
-            self.announce_current_menu_item()
+            if speak:
+                self.announce_current_menu_item()
         except Exception as e:
             error_msg = f"Ошибка при отображении меню: {e}"
             print(error_msg)
             sentry_sdk.capture_exception(e)
     
-    def move_up(self):
+    def _start_prefetch(self, menu):
         """
-        Перемещает выделение меню вверх
+        Передает меню в поток предзагрузки озвучки, заменяя еще не обработанное
         
+        Args:
+            menu: Меню, пункты которого нужно озвучить заранее
+        """
+        with self._prefetch_lock:
+            self._prefetch_pending = menu
+            self._prefetch_event.set()
+    
+    def _prefetch_loop(self):
+        """Генерирует в фоне озвучку пунктов последнего меню из _prefetch_pending"""
+        while True:
+            self._prefetch_event.wait()
+            with self._prefetch_lock:
+                self._prefetch_event.clear()
+                menu, self._prefetch_pending = self._prefetch_pending, None
+            
+            items = getattr(menu, 'items', None)
+            if not items:
+                continue
+                
+            try:
+                voice_id = self._current_voice
+                
+                for item in list(items):
+                    # Открыто другое меню: оставшиеся пункты этого больше не нужны
+                    if self._prefetch_event.is_set():
+                        break
+                        
+                    text = item.get_speech_text() if hasattr(item, 'get_speech_text') else None
+                    # Одновременную генерацию одной фразы исключает блокировка файла в TTS менеджере,
+                    # проверка кэша лишь не дает лишний раз обновлять статистику для готовых файлов
+                    if text and not self.tts_manager.cache_exists(text, voice_id):
+                        self.tts_manager.generate_speech(text, voice=voice_id)
+            except Exception as e:
+                error_msg = f"Ошибка при предзагрузке озвучки пунктов меню: {e}"
+                print(error_msg)
+                sentry_sdk.capture_exception(e)
+    
+    def _speak_current_item(self):
+        """Перерисовывает меню и озвучивает новый выбранный пункт после перемещения"""
+        # Обновляем отображение
+        if self.display_manager:
+            try:
+                self.display_manager.display_menu(self.current_menu)
+            except Exception as display_error:
+                print(f"Ошибка при обновлении дисплея: {display_error}")
+                sentry_sdk.capture_exception(display_error)
+        
+        # Озвучиваем новый пункт используя announce_current_menu_item
+        if self.tts_enabled:
+            self.announce_current_menu_item()
+    
+    def _navigate(self, move_fn, direction):
+        """
+        Перемещает выделение меню и, если пункт сменился, перерисовывает и озвучивает его
+        
+        Args:
+            move_fn (callable): Метод перемещения текущего меню (move_up или move_down)
+            direction (str): Направление для журнала ("ВВЕРХ" или "ВНИЗ")
+            
         Returns:
             bool: True если навигация выполнена успешно
         """
         try:
-            if not self.current_menu:
-                return False
-                
-            if self.debug:
-                print("Навигация: ВВЕРХ")
-                
-            # Перемещаем указатель вверх
-            old_index = self.current_menu.current_selection
-            self.current_menu.move_up()
-            new_index = self.current_menu.current_selection
+            logger.debug("Навигация: %s", direction)
+            
+            # Перемещаем указатель
+            menu = self.current_menu
+            old_index = menu.current_selection
+            move_fn()
+            new_index = menu.current_selection
             
             # Если индекс изменился, считаем навигацию успешной
             if old_index != new_index:
-                if self.debug:
-                    print(f"Переход с пункта {old_index} на {new_index}")
-                    
-                # Обновляем отображение
-                if self.display_manager:
-                    try:
-                        self.display_manager.display_menu(self.current_menu)
-                    except Exception as display_error:
-                        print(f"Ошибка при обновлении дисплея: {display_error}")
-                        sentry_sdk.capture_exception(display_error)
-                
-                # Озвучиваем новый пункт используя announce_current_menu_item
-                if self.tts_enabled:
-                    self.announce_current_menu_item()
-                
+                self._invalidate_debug_info()
+                logger.debug("Переход с пункта %d на %d", old_index, new_index)
+                self._speak_current_item()
                 return True
-            else:
-                if self.debug:
-                    print("Навигация вверх не изменила выбранный пункт")
-                return False
+            
+            logger.debug("Навигация %s не изменила выбранный пункт", direction)
+            return False
         except Exception as e:
-            error_msg = f"Ошибка при навигации вверх: {e}"
+            error_msg = f"Ошибка при навигации {direction}: {e}"
             print(error_msg)
             sentry_sdk.capture_exception(e)
             return False
     
+    def move_up(self):
+        """
+        Перемещает выделение меню вверх
+        
+        Returns:
+            bool: True если навигация выполнена успешно
+        """
+        if not self.current_menu:
+            return False
+        return self._navigate(self.current_menu.move_up, "ВВЕРХ")
+    
     def move_down(self):
         """
         Перемещает выделение меню вниз
@@ -218,45 +648,9 @@ class MenuManager:
         Returns:
             bool: True если навигация выполнена успешно
         """
-        try:
-            if not self.current_menu:
-                return False
-                
-            if self.debug:
-                print("Навигация: ВНИЗ")
-                
-            # Перемещаем указатель вниз
-            old_index = self.current_menu.current_selection
-            self.current_menu.move_down()
-            new_index = self.current_menu.current_selection
-            
-            # Если индекс изменился, считаем навигацию успешной
-            if old_index != new_index:
-                if self.debug:
-                    print(f"Переход с пункта {old_index} на {new_index}")
-                    
-                # Обновляем отображение
-                if self.display_manager:
-                    try:
-                        self.display_manager.display_menu(self.current_menu)
-                    except Exception as display_error:
-                        print(f"Ошибка при обновлении дисплея: {display_error}")
-                        sentry_sdk.capture_exception(display_error)
-                
-                # Озвучиваем новый пункт используя announce_current_menu_item
-                if self.tts_enabled:
-                    self.announce_current_menu_item()
-                
-                return True
-            else:
-                if self.debug:
-                    print("Навигация вниз не изменила выбранный пункт")
-                return False
-        except Exception as e:
-            error_msg = f"Ошибка при навигации вниз: {e}"
-            print(error_msg)
-            sentry_sdk.capture_exception(e)
+        if not self.current_menu:
             return False
+        return self._navigate(self.current_menu.move_down, "ВНИЗ")
     
     def _get_voice_id_for_menu_item(self, menu_item_name):
         """
@@ -268,15 +662,8 @@ class MenuManager:
         Returns:
             str: Идентификатор голоса или None, если соответствие не найдено
         """
-        # Получаем словарь голосов
-        voices_dict = self.settings_manager.get_available_voices()
-        
-        # Ищем соответствие между названием пункта меню и голосом
-        for voice_id, voice_desc in voices_dict.items():
-            if voice_desc == menu_item_name:
-                return voice_id
-                
-        return None
+        # Пункты меню выбора голоса совпадают с описаниями голосов
+        return self._get_voice_id_by_description(menu_item_name)
     
     def select_current_item(self):
         """Выбирает текущий пункт меню"""
@@ -292,7 +679,7 @@ class MenuManager:
         result = item.select()
         
         # Если результат - подменю или наследник BaseMenu, переключаемся на него
-        if isinstance(result, SubMenu) or isinstance(result, BaseMenu):
+        if isinstance(result, (SubMenu, BaseMenu)):
             self.current_menu = result
             
             # Вызываем метод on_enter для нового меню, если он существует
@@ -300,17 +687,21 @@ class MenuManager:
                 self.current_menu.on_enter()
                 
             self.display_current_menu()
-        elif result is not None:
+        elif result is not None and not isinstance(result, bool):
             # Если результат не None и не подменю, 
-            # показываем сообщение с результатом и озвучиваем его
-            self.display_manager.display_message(str(result))
+            # показываем сообщение с результатом и озвучиваем его.
+            # True/False только сообщают об успехе действия, которое само
+            # показывает и озвучивает свой экран, поэтому их не выводим
+            text = result if isinstance(result, str) else str(result)
+            self.display_manager.display_message(text)
             
             if self.tts_enabled:
-                # Получаем текущий голос из настроек
-                voice = self.settings_manager.get_voice()
-                self.tts_manager.play_speech(str(result), voice_id=voice)
+                # Озвучиваем через поток озвучки, чтобы фраза шла после
+                # объявления меню, а не одновременно с ним
+                self._submit_tts((text,), self._current_voice)
                 
-            self.display_current_menu()
+            # Только перерисовываем меню, чтобы не перебить озвучку результата
+            self.display_current_menu(speak=False)
         # Если возвращен None, и это пункт "Назад", возвращаемся в родительское меню
         elif result is None and hasattr(item, 'name') and item.name.lower() in ["назад", "back"]:
             if self.current_menu and self.current_menu.parent:
@@ -322,9 +713,13 @@ class MenuManager:
                     
                 self.display_current_menu()
     
-    def go_back(self) -> None:
+    def go_back(self, prefix: tuple = ()) -> None:
         """
         Возврат к предыдущему меню.
+        
+        Args:
+            prefix (tuple): Фразы, которые озвучиваются перед пунктом меню
+                тем же запросом, например сообщение о возврате
         """
         try:
             # Проверяем, есть ли у текущего меню родительское меню
@@ -340,19 +735,17 @@ class MenuManager:
                 if hasattr(parent, 'on_enter') and callable(parent.on_enter):
                     parent.on_enter()
                 
-                # Отображаем родительское меню
-                self.display_current_menu()
+                # Отображаем родительское меню и озвучиваем пункт вместе с prefix
+                self.display_current_menu(speak=False)
+                self.announce_current_menu_item(prefix)
             else:
                 # Если нет родительского меню, переходим в главное меню
                 logger.info("Возврат в главное меню (родительское меню не найдено)")
                 self.current_menu = self.root_menu
-                self.display_current_menu()
+                self.display_current_menu(speak=False)
                 
-                # Обновляем сообщение перед возвратом в главное меню
-                self.tts_manager.play_speech(
-                    "Возврат в главное меню", 
-                    voice_id=self.settings_manager.get_voice()
-                )
+                # Сообщение о возврате и пункт меню озвучиваются одним запросом
+                self.announce_current_menu_item(prefix or ("Возврат в", "главное меню"))
         except Exception as e:
             logger.error(f"Ошибка при возврате к предыдущему меню: {e}")
             sentry_sdk.capture_exception(e)
@@ -386,21 +779,15 @@ class MenuManager:
                     self.player.stop()
                     return
                 
-                # Возвращаемся в предыдущее меню
+                # Возвращаемся в предыдущее меню. Сообщение о возврате передается в go_back,
+                # чтобы оно озвучилось одним запросом с новым пунктом, а не было им вытеснено
                 if hasattr(self.current_menu, 'parent') and self.current_menu.parent:
                     logger.info("Подготовка к возврату в родительское меню")
                     parent_name = getattr(self.current_menu.parent, 'name', "предыдущее меню")
-                    self.tts_manager.play_speech("Возврат в", voice_id=self.settings_manager.get_voice())
-                    time.sleep(0.1)  # Небольшая пауза между сообщениями
-                    self.tts_manager.play_speech(parent_name, voice_id=self.settings_manager.get_voice())
+                    self.go_back(("Возврат в", parent_name))
                 else:
                     logger.info("Подготовка к возврату в главное меню")
-                    self.tts_manager.play_speech("Возврат в", voice_id=self.settings_manager.get_voice())
-                    time.sleep(0.1)  # Небольшая пауза между сообщениями
-                    self.tts_manager.play_speech("главное меню", voice_id=self.settings_manager.get_voice())
-                    
-                # Выполняем возврат
-                self.go_back()
+                    self.go_back(("Возврат в", "главное меню"))
             else:
                 logger.info(f"Текущий режим: {self.current_mode}")
                 # Другие режимы обрабатываются в соответствующих классах
@@ -412,6 +799,37 @@ class MenuManager:
             self.current_menu = self.root_menu
             self.display_current_menu()
     
+    def _collect_speech_texts(self):
+        """
+        Собирает тексты для предварительной генерации: фразы дерева меню,
+        системные сообщения и имена записей диктофона из папок A, B, C
+        
+        Returns:
+            list: Тексты для озвучки без повторов, в порядке обхода меню
+        """
+        # Фразы меню и системных сообщений собраны при построении меню
+        speech_texts = list(self._menu_phrases)
+        add = speech_texts.append
+        
+        # Попытка добавить имена записей диктофона из папок A, B, C
+        try:
+            # Путь к папке с записями
+            records_dir = self.records_dir
+            if os.path.exists(records_dir) and self.playback_manager:
+                get_readable_name = self.playback_manager.get_human_readable_filename
+                for folder in _FOLDERS:
+                    folder_path = os.path.join(records_dir, folder)
+                    if os.path.exists(folder_path):
+                        # Получаем человекочитаемые названия файлов
+                        for file in os.listdir(folder_path):
+                            if file.endswith(('.wav', '.mp3')):
+                                add(get_readable_name(os.path.join(folder_path, file)))
+        except Exception as e:
+            print(f"Ошибка при получении имен файлов из папок диктофона: {e}")
+            sentry_sdk.capture_exception(e)
+        
+        return list(dict.fromkeys(speech_texts))
+    
     def pre_generate_all_speech(self, voices=None):
         """
         Предварительно генерирует все звуки для меню
@@ -426,121 +844,8 @@ class MenuManager:
         if voices is None:
             voices = list(self.settings_manager.get_available_voices().keys())
         
-        # Собираем все тексты для озвучки
-        speech_texts = set()
-        
-        def collect_speech_texts(menu):
-            # Добавляем только тексты пунктов меню, не озвучиваем название самого меню
-            for item in menu.items:
-                speech_texts.add(item.get_speech_text())
-                if isinstance(item, SubMenu):
-                    collect_speech_texts(item)
-        
-        # Начинаем с корневого меню
-        collect_speech_texts(self.root_menu)
-        
-        # Добавляем системные сообщения для возврата
-        speech_texts.add("Возврат в")
-        speech_texts.add("главное меню")
-        speech_texts.add("предыдущее меню")
-        speech_texts.add("Голос успешно изменен")
-        
-        # Добавляем сообщения для диктофона
-        speech_texts.add("Запись началась")
-        speech_texts.add("Запись приостановлена")
-        speech_texts.add("Запись возобновлена")
-        speech_texts.add("Запись остановлена")
-        speech_texts.add("Запись сохранена в папку")  # Первая часть сообщения
-        speech_texts.add("Запись отменена")
-        speech_texts.add("Выберите папку для записи")
-        speech_texts.add("Папка A")
-        speech_texts.add("Папка B")
-        speech_texts.add("Папка C")
-        
-        # Добавляем сообщения для информации о файлах в папках
-        speech_texts.add("В папке")  # Первая часть сообщения
-        speech_texts.add("нет записей")  # Третья часть сообщения
-        
-        # Добавляем слова для формирования сообщений о количестве файлов
-        for count in range(0, 100):  # Поддержка до 99 файлов
-            speech_texts.add(str(count))
-        speech_texts.add("файл")
-        speech_texts.add("файла")
-        speech_texts.add("файлов")
-        
-        # Добавляем слово "Папка" для навигации по файлам на флешке
-        speech_texts.add("Папка")
-        
-        # Добавляем сообщения для воспроизведения
-        speech_texts.add("Воспроизведение")
-        speech_texts.add("Пауза")
-        speech_texts.add("Прослушано")
-        speech_texts.add("Переключаю вперед на запись")
-        speech_texts.add("Переключаю назад на запись")
-        speech_texts.add("Ошибка при переключении трека")
-        speech_texts.add("Запись успешно удалена")
-        speech_texts.add("Ошибка при удалении записи")
-        
-        # Добавляем сообщения для удаления файлов
-        speech_texts.add("Вы точно хотите удалить эту запись")
-        speech_texts.add("Запись успешно удалена")
-        speech_texts.add("Ошибка при удалении записи")
-        
-        # Добавляем сообщения для массового удаления записей
-        speech_texts.add("Массовое удаление записей")
-        speech_texts.add("Удалить записи из всех папок")
-        speech_texts.add("Вы действительно хотите удалить все записи из папки")
-        speech_texts.add("Вы точно хотите удалить все записи из всех папок")
-        speech_texts.add("Финальное подтверждение удаления всех записей")
-        speech_texts.add("Количество записей")
-        speech_texts.add("В папке нет записей")
-        speech_texts.add("Нет записей во всех папках")
-        speech_texts.add("Ошибка при удалении записей из папки")
-        speech_texts.add("Ошибка при удалении записей из всех папок")
-        speech_texts.add("запись")
-        speech_texts.add("записи")
-        speech_texts.add("записей")
-        
-        # Добавляем сообщения для внешнего носителя
-        speech_texts.add("Недостаточно места на флешке")
-        speech_texts.add("Копирование успешно завершено")
-        speech_texts.add("Возврат в режим внешнего носителя")
-        speech_texts.add("Произошла ошибка при копировании файлов")
-        speech_texts.add("Флешка была отключена")
-        speech_texts.add("Директория с записями не найдена")
-        speech_texts.add("Скопировать все аудиозаписи из всех папок")
-        speech_texts.add("Скопировать все аудиозаписи из папки")
-        
-        # Добавляем сообщения для настроек громкости (теперь отдельно)
-        speech_texts.add("Установлен уровень громкости")
-        speech_texts.add("Уровень громкости")
-        speech_texts.add("Сейчас установлен уровень громкости")
-        
-        # Добавляем числовые значения для уровней громкости
-        for level in range(0, 7):
-            speech_texts.add(f"{level}")
-        
-        # Попытка добавить имена записей диктофона из папок A, B, C
-        try:
-            # Путь к папке с записями
-            records_dir = self.records_dir
-            if os.path.exists(records_dir):
-                # Папки для диктофона
-                folders = ["A", "B", "C"]
-                for folder in folders:
-                    folder_path = os.path.join(records_dir, folder)
-                    if os.path.exists(folder_path):
-                        # Получаем список файлов в папке
-                        files = [f for f in os.listdir(folder_path) if f.endswith(('.wav', '.mp3'))]
-                        for file in files:
-                            file_path = os.path.join(folder_path, file)
-                            # Получаем человекочитаемое название файла
-                            if hasattr(self, 'playback_manager') and self.playback_manager:
-                                readable_name = self.playback_manager.get_human_readable_filename(file_path)
-                                speech_texts.add(readable_name)
-        except Exception as e:
-            print(f"Ошибка при получении имен файлов из папок диктофона: {e}")
-            sentry_sdk.capture_exception(e)
+        # Тексты пунктов меню, системных сообщений и имена записей диктофона
+        speech_texts = self._collect_speech_texts()
         
         # Попытка добавить имена файлов с подключенного внешнего носителя
         try:
@@ -558,13 +863,13 @@ class MenuManager:
                                     # Получаем человекочитаемое название файла
                                     if hasattr(self, 'playback_manager') and self.playback_manager:
                                         readable_name = self.playback_manager.get_human_readable_filename(file_path)
-                                        speech_texts.add(readable_name)
+                                        speech_texts.append(readable_name)
         except Exception as e:
             print(f"Ошибка при получении имен файлов с внешнего носителя: {e}")
             sentry_sdk.capture_exception(e)
         
         # Предварительно генерируем все звуки для всех голосов
-        self.tts_manager.pre_generate_menu_items(speech_texts, voices=voices)
+        self.tts_manager.pre_generate_menu_items(list(dict.fromkeys(speech_texts)), voices=voices)
     
     def change_voice(self, voice_id):
         """
@@ -577,160 +882,85 @@ class MenuManager:
             str: Сообщение о результате операции
         """
         try:
-            # Логируем начало процесса
-            sentry_sdk.add_breadcrumb(
-                category="voice",
-                message=f"Начало процесса изменения голоса на {voice_id}",
-                level="info"
-            )
-            print(f"[VOICE] Запрос на изменение голоса: {voice_id}")
+            # Шаги смены голоса пишутся в журнал, интеграция логирования Sentry
+            # сохраняет их как breadcrumbs, поэтому отдельно их не добавляем
+            logger.info("[VOICE] Запрос на изменение голоса: %s", voice_id)
             
             # Проверяем, доступен ли TTS
             if not self.tts_enabled:
-                sentry_sdk.capture_message("Попытка изменить голос при отключенной озвучке", level="warning")
+                logger.warning("[VOICE] Попытка изменить голос при отключенной озвучке")
                 return "Озвучка отключена"
             
             # Отладочная информация
-            current_voice = self.settings_manager.get_voice()
-            sentry_sdk.add_breadcrumb(
-                category="voice",
-                message=f"Текущий голос: {current_voice}",
-                level="info"
-            )
-            print(f"[VOICE] Текущий голос в настройках: {current_voice}")
+            current_voice = self._current_voice
+            logger.info("[VOICE] Текущий голос в настройках: %s", current_voice)
             
             # Проверяем, не выбран ли уже этот голос
             if current_voice == voice_id:
-                sentry_sdk.add_breadcrumb(
-                    category="voice",
-                    message=f"Голос {voice_id} уже выбран",
-                    level="info"
-                )
-                print(f"[VOICE] Голос {voice_id} уже выбран, никаких изменений не требуется")
+                logger.info("[VOICE] Голос %s уже выбран, никаких изменений не требуется", voice_id)
                 message = "Этот голос уже выбран"
                 self.tts_manager.play_speech(message, voice_id=voice_id)
                 return message
             
             # Проверяем существование голоса в доступных
             available_voices = self.settings_manager.get_available_voices()
-            sentry_sdk.add_breadcrumb(
-                category="voice",
-                message=f"Доступные голоса: {available_voices}",
-                level="info"
-            )
-            print(f"[VOICE] Доступные голоса: {available_voices}")
+            logger.info("[VOICE] Доступные голоса: %s", available_voices)
             
             if voice_id not in available_voices:
                 error_msg = f"Голос {voice_id} не найден в списке доступных голосов"
-                print(f"[VOICE ERROR] {error_msg}")
+                logger.error("[VOICE ERROR] %s", error_msg)
                 sentry_sdk.capture_message(error_msg, level="error")
                 return "Ошибка: выбранный голос недоступен"
             
             # Изменяем голос в настройках
-            print(f"[VOICE] Вызов settings_manager.set_voice({voice_id})")
+            logger.info("[VOICE] Вызов settings_manager.set_voice(%s)", voice_id)
             if not self.settings_manager.set_voice(voice_id):
                 error_msg = f"Не удалось установить голос {voice_id} в настройках"
-                print(f"[VOICE ERROR] {error_msg}")
+                logger.error("[VOICE ERROR] %s", error_msg)
                 sentry_sdk.capture_message(error_msg, level="error")
                 return "Ошибка при изменении голоса в настройках"
             
             # Проверяем результат установки голоса в настройках
             new_settings_voice = self.settings_manager.get_voice()
-            sentry_sdk.add_breadcrumb(
-                category="voice",
-                message=f"Голос в настройках после установки: {new_settings_voice}",
-                level="info"
-            )
-            print(f"[VOICE] Голос в настройках после установки: {new_settings_voice}")
+            logger.info("[VOICE] Голос в настройках после установки: %s", new_settings_voice)
+            
+            # Запоминаем голос, сохраненный в настройках
+            self._current_voice = new_settings_voice
             
             # Изменяем голос в TTS менеджере
             try:
-                print(f"[VOICE] Вызов tts_manager.set_voice({voice_id})")
+                logger.info("[VOICE] Вызов tts_manager.set_voice(%s)", voice_id)
                 result = self.tts_manager.set_voice(voice_id)
-                sentry_sdk.add_breadcrumb(
-                    category="voice",
-                    message=f"Результат установки голоса в TTS: {result}",
-                    level="info"
-                )
-                print(f"[VOICE] Результат установки голоса в TTS: {result}")
+                logger.info("[VOICE] Результат установки голоса в TTS: %s", result)
                 
                 if not result:
                     error_msg = f"Не удалось установить голос {voice_id} в TTS менеджере"
-                    print(f"[VOICE ERROR] {error_msg}")
+                    logger.error("[VOICE ERROR] %s", error_msg)
                     sentry_sdk.capture_message(error_msg, level="error")
                     return "Ошибка при изменении голоса в TTS системе"
             except Exception as tts_error:
                 error_msg = f"Ошибка при установке голоса {voice_id} в TTS менеджере: {str(tts_error)}"
-                print(f"[VOICE ERROR] {error_msg}")
+                logger.error("[VOICE ERROR] %s", error_msg)
                 sentry_sdk.capture_exception(tts_error)
                 return "Ошибка при изменении голоса в TTS системе"
             
             # Проверяем текущий голос в TTS после установки
             tts_current_voice = getattr(self.tts_manager, 'voice', 'неизвестно')
-            sentry_sdk.add_breadcrumb(
-                category="voice",
-                message=f"Текущий голос в TTS после установки: {tts_current_voice}",
-                level="info"
-            )
-            print(f"[VOICE] Текущий голос в TTS после установки: {tts_current_voice}")
+            logger.info("[VOICE] Текущий голос в TTS после установки: %s", tts_current_voice)
+            
+            # Голос в TTS изменился, отладочную информацию нужно собрать заново
+            self._invalidate_debug_info()
             
-            # Важно! Перестраиваем структуру меню, чтобы обновить голоса во всех пунктах
+            # Пункты меню не хранят голос (он подставляется при озвучке),
+            # поэтому дерево меню не перестраивается и ничего в нем не перепривязывается:
+            # текущее меню и выбранный пункт остаются на месте
             try:
-                # Сохраняем текущее меню и его состояние
-                current_menu_path = []
-                temp_menu = self.current_menu
-                while temp_menu and temp_menu != self.root_menu:
-                    # Ищем индекс текущего меню в родительском
-                    if temp_menu.parent:
-                        for i, item in enumerate(temp_menu.parent.items):
-                            if item is temp_menu:
-                                current_menu_path.insert(0, i)
-                                break
-                    temp_menu = temp_menu.parent
-                
-                current_index = self.current_menu.current_selection
-                sentry_sdk.add_breadcrumb(
-                    category="voice",
-                    message=f"Сохранение состояния меню перед обновлением: путь {current_menu_path}, индекс {current_index}",
-                    level="info"
-                )
-                print(f"[VOICE] Сохранение состояния меню перед обновлением: путь {current_menu_path}, индекс {current_index}")
-                
-                # Пересоздаем структуру меню
-                self.create_menu_structure()
-                sentry_sdk.add_breadcrumb(
-                    category="voice",
-                    message="Структура меню успешно пересоздана",
-                    level="info"
-                )
-                print(f"[VOICE] Структура меню успешно пересоздана")
-                
-                # Восстанавливаем положение в меню
-                temp_menu = self.root_menu
-                for menu_index in current_menu_path:
-                    if 0 <= menu_index < len(temp_menu.items):
-                        item = temp_menu.items[menu_index]
-                        if isinstance(item, SubMenu):
-                            temp_menu = item
-                        else:
-                            # Если это не подменю, прерываем восстановление
-                            break
-                
-                # Устанавливаем текущее меню и выбранный пункт
-                self.current_menu = temp_menu
-                if 0 <= current_index < len(self.current_menu.items):
-                    self.current_menu.current_selection = current_index
-                
-                sentry_sdk.add_breadcrumb(
-                    category="voice",
-                    message=f"Состояние меню восстановлено: {self.current_menu.name}, индекс {self.current_menu.current_selection}",
-                    level="info"
-                )
-                print(f"[VOICE] Состояние меню восстановлено: {self.current_menu.name}, индекс {self.current_menu.current_selection}")
+                # Генерируем озвучку пунктов меню для нового голоса
+                self._pre_generate_in_background([voice_id])
                 
             except Exception as menu_error:
-                error_msg = f"Ошибка при обновлении структуры меню: {str(menu_error)}"
-                print(f"[VOICE ERROR] {error_msg}")
+                error_msg = f"Ошибка при генерации озвучки меню для нового голоса: {str(menu_error)}"
+                logger.error("[VOICE ERROR] %s", error_msg)
                 sentry_sdk.capture_exception(menu_error)
                 # Продолжаем выполнение, это не критическая ошибка
             
@@ -738,225 +968,275 @@ class MenuManager:
             message = "Голос успешно изменен"
             
             try:
-                print(f"[VOICE] Пробуем тестовую озвучку с голосом {voice_id}")
+                logger.info("[VOICE] Пробуем тестовую озвучку с голосом %s", voice_id)
                 # Явно передаем идентификатор голоса для корректной озвучки
                 result = self.tts_manager.play_speech(message, voice_id=voice_id)
-                sentry_sdk.add_breadcrumb(
-                    category="voice",
-                    message=f"Результат тестовой озвучки: {result}",
-                    level="info"
-                )
-                print(f"[VOICE] Результат тестовой озвучки: {result}")
+                logger.info("[VOICE] Результат тестовой озвучки: %s", result)
                 
                 if not result:
                     error_msg = f"Не удалось выполнить тестовую озвучку с голосом {voice_id}"
-                    print(f"[VOICE ERROR] {error_msg}")
+                    logger.error("[VOICE ERROR] %s", error_msg)
                     sentry_sdk.capture_message(error_msg, level="error")
                     return "Ошибка при проверке нового голоса"
             except Exception as speech_error:
                 error_msg = f"Ошибка при тестовой озвучке с голосом {voice_id}: {str(speech_error)}"
-                print(f"[VOICE ERROR] {error_msg}")
+                logger.error("[VOICE ERROR] %s", error_msg)
                 sentry_sdk.capture_exception(speech_error)
                 return "Ошибка при проверке нового голоса"
             
             # Обновляем отображение текущего меню
-            self.display_current_menu()
+            self.display_current_menu(force=True)
             
-            # Финальная проверка
-            final_voice = self.settings_manager.get_voice()
+            # Успешная смена голоса остается одним breadcrumb, отдельное событие в Sentry не отправляем
             sentry_sdk.add_breadcrumb(
                 category="voice",
-                message=f"Финальная проверка голоса: {final_voice}",
-                level="info"
-            )
-            print(f"[VOICE] Финальная проверка голоса в настройках: {final_voice}")
-            
-            # Отправляем в Sentry информацию об успешной смене голоса
-            sentry_sdk.capture_message(
-                f"Голос успешно изменен с {current_voice} на {final_voice}",
-                level="info"
+                message=f"Голос успешно изменен с {current_voice} на {new_settings_voice}",
+                level="info",
+                data={"previous": current_voice, "settings": new_settings_voice, "tts": tts_current_voice}
             )
             
             return message
             
         except Exception as e:
             error_msg = f"Критическая ошибка при смене голоса на {voice_id}: {str(e)}"
-            print(f"[VOICE CRITICAL ERROR] {error_msg}")
+            logger.error("[VOICE CRITICAL ERROR] %s", error_msg)
             sentry_sdk.capture_exception(e)
             return "Критическая ошибка при изменении голоса"
         
-    def create_menu_structure(self):
-        """Создает структуру меню согласно заданной схеме"""
-        # Создаем корневое (главное) меню
-        main_menu = SubMenu("Главное меню")
-        
-        # Меню режима диктофона
-        dictaphone_menu = SubMenu("Режим диктофона", parent=main_menu)
-        main_menu.add_item(MenuItem("Режим диктофона", lambda: dictaphone_menu))
-        
-        # Добавляем подменю для диктофона
-        dictaphone_menu.add_item(MenuItem("Создать новую запись", lambda: self._show_folder_selection_menu()))
-        dictaphone_menu.add_item(MenuItem("Воспроизвести запись", lambda: self._show_play_record_menu()))
-        dictaphone_menu.add_item(MenuItem("Массовое удаление записей", lambda: self._show_delete_record_menu()))
-        
-        # Добавляем подменю для режима звонка
-        call_menu = SubMenu("Режим звонка", parent=main_menu)
-        main_menu.add_item(MenuItem("Режим звонка", lambda: call_menu))
-        
-        # - Принять звонок
-        accept_call_menu = SubMenu("Принять звонок", parent=call_menu)
-        call_menu.add_item(accept_call_menu)
-        
-        # -- Подтверждение входящего вызова
-        incoming_call_menu = SubMenu("Входящий вызов", parent=accept_call_menu)
-        accept_call_menu.add_item(incoming_call_menu)
-        
-        # --- Подтверждение
-        incoming_call_menu.add_item(MenuItem("Да", lambda: "Звонок принят"))
-        incoming_call_menu.add_item(MenuItem("Нет", lambda: "Звонок отклонен"))
-        
-        # - Совершить звонок
-        make_call_menu = SubMenu("Совершить звонок", parent=call_menu)
-        call_menu.add_item(make_call_menu)
-        
-        # -- Избранные контакты
-        favorites_menu = SubMenu("Избранные контакты", parent=make_call_menu)
-        make_call_menu.add_item(favorites_menu)
+    def _build_menu(self, spec, parent=None):
+        """
+        Строит подменю по декларативному описанию
         
-        # --- Контакты
-        favorites_menu.add_item(MenuItem("NAME1", lambda: "Звонок NAME1"))
-        favorites_menu.add_item(MenuItem("NAME2", lambda: "Звонок NAME2"))
-        favorites_menu.add_item(MenuItem("Удалить избранный контакт", lambda: "Удаление контакта"))
-        favorites_menu.add_item(MenuItem("Добавить избранный контакт", lambda: "Добавление контакта"))
+        Узлы описания:
+            (название, [узлы])        - вложенное подменю
+            (название, функция)       - пункт меню с действием
+            (название, "строка")      - пункт меню, возвращающий строку
+            (название, готовое меню)  - пункт-обертка для готового меню (радио, флешка)
+            MenuItem / SubMenu        - готовый пункт, добавляется как есть
         
-        # -- Последние набранные
-        recent_menu = SubMenu("Последние набранные", parent=make_call_menu)
-        make_call_menu.add_item(recent_menu)
+        Args:
+            spec (tuple): (название, список узлов[, обработчик входа в меню])
+            parent (SubMenu, optional): Родительское меню
+            
+        Returns:
+            SubMenu: Построенное подменю
+        """
+        name, children, *on_enter = spec
+        menu = SubMenu(name, parent=parent)
+        if on_enter:
+            menu.on_enter = on_enter[0]
+        
+        for node in children:
+            if isinstance(node, MenuItem):
+                menu.add_item(node)
+                continue
+            
+            item_name, target = node[0], node[1]
+            if isinstance(target, list):
+                menu.add_item(self._build_menu(node, parent=menu))
+            elif isinstance(target, str):
+                menu.add_item(MenuItem(item_name, self._const(target)))
+            elif callable(target):
+                menu.add_item(MenuItem(item_name, target))
+            else:
+                menu.add_item(SubMenuItem(item_name, target))
         
-        # --- Контакты
-        recent_menu.add_item(MenuItem("NAME", lambda: "Звонок NAME (последний)"))
+        return menu
+    
+    def _const(self, value):
+        """
+        Возвращает общее для одинаковых значений действие, которое возвращает value
         
-        # Добавляем подменю для режима радио
-        radio_menu = RadioMenu(parent=main_menu, menu_manager=self)
-        main_menu.add_item(MenuItem("Радио", lambda: radio_menu))
+        Args:
+            value (str): Результат выбора пункта меню
+            
+        Returns:
+            callable: Функция без аргументов
+        """
+        action = self._const_actions.get(value)
+        if action is None:
+            action = self._const_actions[value] = lambda: value
+        return action
+    
+    def _get_or_build_call_menu(self):
+        """
+        Возвращает меню режима звонка, создавая его при первом обращении
         
-        # Добавляем подменю для внешних носителей
+        Returns:
+            SubMenu: Меню режима звонка
+        """
+        if self._call_menu is None:
+            self._call_menu = self._build_menu(_CALL_MENU_SPEC, parent=self.root_menu)
+        return self._call_menu
+    
+    def create_menu_structure(self):
+        """Создает структуру меню согласно заданной схеме"""
+        # Готовые меню, которые строятся своими классами
+        radio_menu = RadioMenu(menu_manager=self)
         external_storage = ExternalStorageMenu(
             settings_manager=self.settings_manager, 
             debug=self.debug, 
             menu_manager=self
         )
-        main_menu.add_item(MenuItem("Внешний носитель", lambda: external_storage))
-        
-        # Добавляем подменю для настроек
-        settings_menu = SubMenu("Настройки", parent=main_menu)
-        main_menu.add_item(MenuItem("Настройки", lambda: settings_menu))
-        
-        # - Подменю выбора голоса
-        voice_menu = SubMenu("Выбор голоса", parent=settings_menu)
-        settings_menu.add_item(voice_menu)
         
-        # -- Добавляем доступные голоса
+        # Пункты выбора голоса
         available_voices = self.settings_manager.get_available_voices()
-        if self.debug:
-            print("Создание пунктов меню выбора голоса:")
+        logger.debug("Создание пунктов меню выбора голоса:")
             
+        voice_items = []
         for voice_id, voice_desc in available_voices.items():
-            if self.debug:
-                print(f"  Добавление пункта: {voice_desc} -> {voice_id}")
-                
-            # Создаем обертку для каждого голоса, чтобы избежать проблем с lambda в цикле
-            def create_voice_action(voice_id=voice_id):
-                return lambda: self.change_voice(voice_id)
-                
-            voice_menu.add_item(MenuItem(
-                voice_desc, 
-                create_voice_action()
-            ))
-
-        # - Подменю выбора микрофона
+            logger.debug("  Добавление пункта: %s -> %s", voice_desc, voice_id)
+            voice_items.append((voice_desc, partial(self.change_voice, voice_id)))
+        
+        # Подменю выбора микрофона
+        microphone_menu = None
         try:
-            # Создаем селектор микрофона
+            # Создаем селектор микрофона и получаем его подменю
             microphone_selector = MicrophoneSelector(
                 menu_manager=self,
                 settings_manager=self.settings_manager,
                 debug=self.debug
             )
-            
-            # Получаем подменю от селектора и добавляем его в настройки
             microphone_menu = microphone_selector.get_menu()
-            microphone_menu.parent = settings_menu
-            settings_menu.add_item(microphone_menu)
             
-            if self.debug:
-                print("Подменю выбора микрофона добавлено в настройки")
+            logger.debug("Подменю выбора микрофона добавлено в настройки")
         except Exception as e:
             error_msg = f"Ошибка при добавлении меню выбора микрофона: {e}"
             print(error_msg)
             sentry_sdk.capture_exception(e)
-                
-        # - Подменю управления громкостью системных сообщений
-        volume_menu = SubMenu("Громкость системных сообщений", parent=settings_menu)
-        # Добавляем обработчик входа в меню для озвучивания текущей громкости
-        volume_menu.on_enter = lambda: self._announce_current_volume()
-        settings_menu.add_item(volume_menu)
         
-        # -- Добавляем пункты управления громкостью (7 уровней от 0 до 6)
+        # Пункты управления громкостью (7 уровней от 0 до 6)
+        volume_items = []
         for level in range(7):
             volume_item = MenuItem(
                 f"Уровень громкости {level}",
-                lambda lvl=level: self.change_system_volume(lvl)
+                partial(self.change_system_volume, level)
             )
             # Добавляем обработчик наведения курсора
-            volume_item.on_focus = lambda lvl=level: self.preview_system_volume(lvl)
-            volume_menu.add_item(volume_item)
+            volume_item.on_focus = partial(self.preview_system_volume, level)
+            volume_items.append(volume_item)
+        
+        settings_items = [("Выбор голоса", voice_items)]
+        if microphone_menu is not None:
+            settings_items.append(microphone_menu)
+        # При входе в меню громкости озвучиваем текущий уровень
+        settings_items.append(("Громкость системных сообщений", volume_items, self._announce_current_volume))
+        
+        menu_spec = ("Главное меню", [
+            ("Режим диктофона", [
+                ("Создать новую запись", self._show_folder_selection_menu),
+                ("Воспроизвести запись", self._show_play_record_menu),
+                ("Массовое удаление записей", self._show_delete_record_menu),
+            ]),
+            # Меню звонков открывается редко, поэтому строится при первом входе
+            ("Режим звонка", self._get_or_build_call_menu),
+            ("Радио", radio_menu),
+            ("Внешний носитель", external_storage),
+            ("Настройки", settings_items),
+        ])
+        
+        main_menu = self._build_menu(menu_spec)
+        radio_menu.parent = main_menu
+        self._call_menu = None
         
         # Устанавливаем главное меню как корневое
         self.set_root_menu(main_menu)
         
+        # Собираем фразы один раз, чтобы не обходить дерево при каждой генерации.
+        # Порядок обхода сохраняется, чтобы файлы кэша создавались в порядке меню
+        phrases = [item.get_speech_text() for item in _walk_menu(main_menu)]
+        phrases.extend(_SYSTEM_SPEECH)
+        self._menu_phrases = tuple(dict.fromkeys(phrases))
+        
         # Предварительно генерируем озвучку если включен TTS
-        if self.tts_enabled:
-            self.pre_generate_all_speech([self.tts_manager.voice])  # Генерируем только для текущего голоса
+        if self.tts_enabled and self.background_pre_generate:
+            self._pre_generate_in_background([self.tts_manager.voice])  # Генерируем только для текущего голоса
+    
+    def _pre_generate_in_background(self, voices):
+        """
+        Запускает предварительную генерацию озвучки в фоновом потоке,
+        чтобы меню было доступно сразу
+        
+        Для каждого голоса одновременно идет не больше одной задачи: если генерация
+        для голоса еще выполняется, новая не запускается
+        
+        Args:
+            voices (list): Список голосов для предварительной генерации
+        """
+        for voice in voices:
+            job = self._pre_generate_jobs.get(voice)
+            if job is not None and job.is_alive():
+                continue
+                
+            job = threading.Thread(
+                target=self.pre_generate_all_speech,
+                args=([voice],),
+                daemon=True
+            )
+            self._pre_generate_jobs[voice] = job
+            job.start()
     
     def get_debug_info(self):
         """
         Возвращает отладочную информацию для текущего состояния меню
         
+        Результат кэшируется на DEBUG_INFO_TTL секунд и сбрасывается
+        при смене меню или голоса
+        
         Returns:
             dict: Словарь с отладочной информацией
         """
+        cached_at, cached_info = self._debug_info_cache
+        if cached_info is not None and time.monotonic() - cached_at < self.DEBUG_INFO_TTL:
+            return cached_info
+            
+        menu = self.current_menu
         debug_info = {
-            "current_menu": self.current_menu.name if self.current_menu else "None",
-            "menu_items": [item.name for item in self.current_menu.items] if self.current_menu else [],
-            "current_index": getattr(self.current_menu, 'current_selection', 0)
+            "current_menu": menu.name if menu else "None",
+            "menu_items": [item.name for item in menu.items] if menu else [],
+            "current_index": getattr(menu, 'current_selection', 0)
         }
         
         # Добавляем информацию от TTS менеджера, если он доступен
-        if hasattr(self, 'tts_manager') and self.tts_manager:
+        if self.tts_manager:
             debug_info["tts"] = self.tts_manager.get_debug_info()
             
             # Если используется Google Cloud TTS, добавляем специфичную информацию
-            if hasattr(self.tts_manager, 'tts_engine') and self.tts_manager.tts_engine == "google_cloud":
-                if hasattr(self.tts_manager, 'google_tts_manager') and self.tts_manager.google_tts_manager:
-                    try:
-                        google_tts_metrics = self.tts_manager.google_tts_manager.get_usage_info()
-                        
-                        # Форматируем метрики для удобства чтения
-                        debug_info["google_cloud_tts"] = {
-                            "total_requests": google_tts_metrics["total_requests"],
-                            "today_requests": google_tts_metrics["today_requests"],
-                            "total_chars": f"{google_tts_metrics['total_chars']:,}",
-                            "monthly_chars_used": f"{google_tts_metrics['monthly_chars_used']:,}",
-                            "remaining_free_chars": f"{google_tts_metrics['remaining_free_chars']:,}",
-                            "voice_type": google_tts_metrics["voice_type"],
-                            "price_per_million": f"${google_tts_metrics['price_per_million']:.2f}",
-                            "estimated_cost": f"${google_tts_metrics['estimated_cost']:.2f}",
-                            "last_update": google_tts_metrics["last_update"]
-                        }
-                    except Exception as e:
-                        debug_info["google_cloud_tts_error"] = str(e)
+            try:
+                if self.tts_manager.tts_engine == "google_cloud" and self.tts_manager.google_tts_manager:
+                    google_tts_metrics = self._get_google_usage_info()
+                    
+                    # Форматируем метрики для удобства чтения
+                    debug_info["google_cloud_tts"] = {
+                        key: _GOOGLE_METRICS_FORMATTERS[key](google_tts_metrics[key])
+                        if key in _GOOGLE_METRICS_FORMATTERS else google_tts_metrics[key]
+                        for key in _GOOGLE_METRICS_KEYS
+                    }
+            except AttributeError:
+                # TTS менеджер без поддержки Google Cloud TTS
+                pass
+            except Exception as e:
+                debug_info["google_cloud_tts_error"] = str(e)
         
+        self._debug_info_cache = (time.monotonic(), debug_info)
         return debug_info
+    
+    def _get_google_usage_info(self):
+        """
+        Возвращает метрики Google Cloud TTS, обновляя их не чаще раза в GOOGLE_USAGE_TTL секунд
+        
+        Returns:
+            dict: Информация об использовании API
+        """
+        cached_at, usage_info = self._google_usage_cache
+        if usage_info is None or time.monotonic() - cached_at >= self.GOOGLE_USAGE_TTL:
+            usage_info = self.tts_manager.google_tts_manager.get_usage_info()
+            self._google_usage_cache = (time.monotonic(), usage_info)
+        return usage_info
+    
+    def _invalidate_debug_info(self):
+        """Сбрасывает кэш отладочной информации"""
+        self._debug_info_cache = (0.0, None)
 
     def _update_recording_info(self):
         """Обновляет информацию о записи"""
@@ -964,41 +1244,51 @@ class MenuManager:
             if not self.recorder_manager or not self.display_manager:
                 return
             
-            # Получаем текущий статус записи
-            is_recording = self.recorder_manager.is_recording()
-            is_paused = self.recorder_manager.is_paused()
+            # Берем готовый снимок, собранный менеджером записи в его же потоке
+            snapshot = self.recorder_manager.snapshot
+            is_paused = snapshot["paused"]
             
-            # Обновляем состояние записи
-            self.recording_state["active"] = is_recording
-            self.recording_state["paused"] = is_paused
+            if not snapshot["active"]:
+                self.recording_state.update(active=False, paused=is_paused)
+                return
             
-            if is_recording:
-                # Получаем текущую папку
-                self.recording_state["folder"] = self.recorder_manager.get_current_folder()
-                
-                # Получаем текущее время записи
-                current_time = self.recorder_manager.get_current_time()
-                formatted_time = self.recorder_manager.get_formatted_time()
-                
-                self.recording_state["elapsed_time"] = current_time
-                self.recording_state["formatted_time"] = formatted_time
-                
-                # Проверяем, не достигнут ли максимальный порог записи
-                if current_time >= AudioRecorder.MAX_RECORDING_DURATION:
-                    self._handle_max_duration_reached()
-                
-                # Отображаем экран записи
-                status = "Paused" if is_paused else "Recording"
+            folder = snapshot["folder"]
+            current_time = snapshot["elapsed_time"]
+            formatted_time = snapshot["formatted_time"]
+            
+            # Обновляем состояние записи одним вызовом
+            self.recording_state.update(snapshot)
+            
+            # Проверяем, не достигнут ли максимальный порог записи
+            if current_time >= AudioRecorder.MAX_RECORDING_DURATION:
+                self._handle_max_duration_reached()
+            
+            # Перерисовываем экран записи только если изменились выводимые данные
+            status = "Paused" if is_paused else "Recording"
+            rendered = (status, formatted_time, folder)
+            # Если после прошлого кадра экран занял другой вывод, кадр рисуется заново
+            if rendered != self._last_rendered_recording or self.display_manager.current_screen != "recording":
                 self.display_manager.display_recording_screen(
                     status=status,
                     time=formatted_time,
-                    folder=self.recording_state["folder"]
+                    folder=folder
                 )
+                self._last_rendered_recording = rendered
         except Exception as e:
             error_msg = f"Ошибка при обновлении информации о записи: {e}"
             print(error_msg)
             sentry_sdk.capture_exception(e)
     
+    def _wait_for_speech(self, timeout):
+        """
+        Ожидает окончания озвучиваемого системного сообщения
+        
+        Args:
+            timeout (float): Максимальное время ожидания в секундах
+        """
+        if self.tts_enabled and self.tts_manager:
+            self.tts_manager.wait_for_speech(timeout)
+    
     def _handle_max_duration_reached(self):
         """Обрабатывает ситуацию, когда достигнут максимальный порог записи"""
         try:
@@ -1008,6 +1298,18 @@ class MenuManager:
             print("Достигнут максимальный порог записи (3 часа)")
             self.recording_state["max_duration_handled"] = True
             
+            # Метод вызывается из потока таймера записи, который останавливается
+            # вместе с записью, поэтому завершаем запись в отдельном потоке
+            threading.Thread(target=self._finish_max_duration_recording, daemon=True).start()
+                
+        except Exception as e:
+            error_msg = f"Ошибка при обработке превышения длительности записи: {e}"
+            print(error_msg)
+            sentry_sdk.capture_exception(e)
+    
+    def _finish_max_duration_recording(self):
+        """Останавливает запись по достижении максимальной длительности и показывает сообщение"""
+        try:
             # Останавливаем запись
             self._stop_recording()
             
@@ -1017,16 +1319,24 @@ class MenuManager:
                 title="Автоматическая остановка"
             )
             
-            # Задержка, чтобы пользователь успел прочитать сообщение
-            time.sleep(3)
-            
-            # Возвращаемся к основному меню
+            # Возвращаемся к основному меню через 3 секунды, чтобы пользователь
+            # успел прочитать сообщение, не блокируя поток ожиданием
+            return_timer = threading.Timer(3, self._return_after_max_duration)
+            return_timer.daemon = True
+            return_timer.start()
+        except Exception as e:
+            error_msg = f"Ошибка при обработке превышения длительности записи: {e}"
+            print(error_msg)
+            sentry_sdk.capture_exception(e)
+    
+    def _return_after_max_duration(self):
+        """Возвращает в родительское меню после автоматической остановки записи"""
+        try:
             if self.current_menu and self.current_menu.parent:
                 self.current_menu = self.current_menu.parent
                 self.display_current_menu()
-                
         except Exception as e:
-            error_msg = f"Ошибка при обработке превышения длительности записи: {e}"
+            error_msg = f"Ошибка при возврате в меню после остановки записи: {e}"
             print(error_msg)
             sentry_sdk.capture_exception(e)
     
@@ -1038,21 +1348,17 @@ class MenuManager:
             folder (str): Папка для записи (A, B или C)
         """
         try:
-            print(f"\n*** НАЧАЛО ЗАПИСИ В ПАПКУ {folder} ***")
+            logger.debug("*** НАЧАЛО ЗАПИСИ В ПАПКУ %s ***", folder)
             
-            # Сбрасываем состояние записи
-            self.recording_state = {
-                "active": False,
-                "paused": False,
-                "folder": folder,
-                "elapsed_time": 0,
-                "formatted_time": "00:00:00",
-                "max_duration_handled": False
-            }
+            # Экран записи рисуется заново, прошлые кадры к нему не относятся
+            self._last_rendered_recording = None
+            
+            # Сбрасываем состояние записи, сохраняя тот же словарь
+            self.recording_state.update(_RECORDING_STATE_TEMPLATE, folder=folder)
             
             # Начинаем запись
             if self.recorder_manager.start_recording(folder):
-                print("Запись успешно начата")
+                logger.debug("Запись успешно начата")
                 
                 # Отображаем экран записи
                 self.display_manager.display_recording_screen(
@@ -1060,11 +1366,12 @@ class MenuManager:
                     time="00:00:00",
                     folder=folder
                 )
+                self._last_rendered_recording = ("Recording", "00:00:00", folder)
                 
                 # Обновляем состояние записи
                 self.recording_state["active"] = True
             else:
-                print("Ошибка при начале записи")
+                logger.error("Ошибка при начале записи")
                 # Возвращаемся в меню выбора папки
                 self.display_current_menu()
         except Exception as e:
@@ -1078,18 +1385,18 @@ class MenuManager:
     def _toggle_pause_recording(self):
         """Переключает паузу записи"""
         if not self.recording_state["active"]:
-            print("Попытка поставить на паузу, но запись не активна")
+            logger.debug("Попытка поставить на паузу, но запись не активна")
             return
         
         try:
-            print(f"Переключаем паузу. Текущее состояние паузы: {self.recording_state['paused']}")
+            logger.debug("Переключаем паузу. Текущее состояние паузы: %s", self.recording_state['paused'])
             
             if self.recording_state["paused"]:
                 # Возобновляем запись
-                print("Возобновляем запись...")
+                logger.debug("Возобновляем запись...")
                 result = self.recorder_manager.resume_recording()
                 if result:
-                    print("Запись успешно возобновлена")
+                    logger.debug("Запись успешно возобновлена")
                     # Обновляем состояние паузы
                     self.recording_state["paused"] = False
                     
@@ -1099,14 +1406,17 @@ class MenuManager:
                         time=self.recording_state["formatted_time"],
                         folder=self.recording_state["folder"]
                     )
+                    self._last_rendered_recording = (
+                        "Recording", self.recording_state["formatted_time"], self.recording_state["folder"]
+                    )
                 else:
-                    print("ОШИБКА: Не удалось возобновить запись!")
+                    logger.error("ОШИБКА: Не удалось возобновить запись!")
             else:
                 # Приостанавливаем запись
-                print("Приостанавливаем запись...")
+                logger.debug("Приостанавливаем запись...")
                 result = self.recorder_manager.pause_recording()
                 if result:
-                    print("Запись успешно приостановлена")
+                    logger.debug("Запись успешно приостановлена")
                     # Обновляем состояние паузы
                     self.recording_state["paused"] = True
                     
@@ -1116,26 +1426,32 @@ class MenuManager:
                         time=self.recording_state["formatted_time"],
                         folder=self.recording_state["folder"]
                     )
+                    self._last_rendered_recording = (
+                        "Paused", self.recording_state["formatted_time"], self.recording_state["folder"]
+                    )
                 else:
-                    print("ОШИБКА: Не удалось приостановить запись!")
+                    logger.error("ОШИБКА: Не удалось приостановить запись!")
             
             # Отображаем текущий статус записи (для информации)
-            print(f"Статус записи: активна={self.recording_state['active']}, "
-                f"на паузе={self.recording_state['paused']}, "
-                f"папка={self.recording_state['folder']}, "
-                f"время={self.recording_state['formatted_time']}")
+            logger.debug(
+                "Статус записи: активна=%s, на паузе=%s, папка=%s, время=%s",
+                self.recording_state['active'],
+                self.recording_state['paused'],
+                self.recording_state['folder'],
+                self.recording_state['formatted_time']
+            )
                 
         except Exception as e:
-            print(f"КРИТИЧЕСКАЯ ОШИБКА при переключении паузы: {e}")
+            logger.exception("КРИТИЧЕСКАЯ ОШИБКА при переключении паузы")
             sentry_sdk.capture_exception(e)
     
     def _stop_recording(self):
         """Останавливает запись и сохраняет файл"""
         if not self.recording_state["active"]:
-            print("Попытка остановить запись, но запись не активна")
+            logger.debug("Попытка остановить запись, но запись не активна")
             return
         
-        print("\n*** ОСТАНОВКА ЗАПИСИ ***")
+        logger.debug("*** ОСТАНОВКА ЗАПИСИ ***")
         folder = self.recording_state["folder"]
         parent_menu = None
         
@@ -1143,13 +1459,13 @@ class MenuManager:
             # Запоминаем родительское меню перед тем как остановить запись
             if hasattr(self, 'current_menu') and self.current_menu and hasattr(self.current_menu, 'parent'):
                 parent_menu = self.current_menu.parent
-                print(f"Запоминаем родительское меню: {parent_menu.name if parent_menu else 'None'}")
+                logger.debug("Запоминаем родительское меню: %s", parent_menu.name if parent_menu else 'None')
             
             # Останавливаем запись
-            print("Вызываем recorder_manager.stop_recording()...")
+            logger.debug("Вызываем recorder_manager.stop_recording()...")
             file_path = self.recorder_manager.stop_recording()
             
-            print(f"Результат stop_recording: {file_path}")
+            logger.debug("Результат stop_recording: %s", file_path)
             
             # Сбрасываем состояние записи
             self.recording_state["active"] = False
@@ -1157,79 +1473,35 @@ class MenuManager:
             
             # Даже если файл не сохранился, все равно озвучиваем что-то
             if not file_path:
-                print("ОШИБКА: Не удалось сохранить запись!")
+                logger.error("ОШИБКА: Не удалось сохранить запись!")
             else:
-                print(f"Запись сохранена в файл: {file_path}")
-            
-            # Значительная задержка для полного воспроизведения всех сообщений
-            # Сообщения "Запись завершается" и "Запись сохранена в папке X" должны воспроизвестись полностью
-            print("Ожидание окончания воспроизведения системных сообщений (3 секунды)...")
-            time.sleep(2)
+                logger.debug("Запись сохранена в файл: %s", file_path)
             
-            # Возвращаемся в родительское меню
-            if parent_menu:
-                print(f"Возвращаемся в родительское меню: {parent_menu.name}")
-                self.current_menu = parent_menu
-            else:
-                print("Родительское меню не найдено, возвращаемся в корневое меню")
-                self.current_menu = self.root_menu
+            # Ждем окончания системных сообщений ("Запись сохранена в папке X"),
+            # но не дольше 2 секунд
+            self._wait_for_speech(2)
             
-            # Отображаем меню
-            self.display_current_menu()
+            # Возвращаемся в родительское меню, а если его нет - в корневое
+            logger.debug("Возвращаемся в меню: %s", parent_menu.name if parent_menu else "корневое")
+            self._switch_menu(parent_menu)
             
         except Exception as e:
-            print(f"КРИТИЧЕСКАЯ ОШИБКА при остановке записи: {e}")
+            logger.exception("КРИТИЧЕСКАЯ ОШИБКА при остановке записи")
             sentry_sdk.capture_exception(e)
             
             # В случае ошибки все равно пытаемся вернуться в меню
             try:
                 # Даем время для завершения аудио сообщений
-                time.sleep(3)
+                self._wait_for_speech(3)
                 
-                if parent_menu:
-                    self.current_menu = parent_menu
-                else:
-                    self.current_menu = self.root_menu
-                self.display_current_menu()
+                self._switch_menu(parent_menu)
             except Exception as menu_e:
                 print(f"Ошибка при возврате в меню: {menu_e}")
     
     def _show_folder_selection_menu(self):
         """Показывает меню выбора папки для записи"""
         try:
-            # Создаем временное подменю для выбора папки
-            folder_menu = SubMenu("Выберите папку для записи", parent=self.current_menu)
-            
-            # Получаем количество файлов в каждой папке
-            files_in_a = self.playback_manager.count_files_in_folder("A")
-            files_in_b = self.playback_manager.count_files_in_folder("B")
-            files_in_c = self.playback_manager.count_files_in_folder("C")
-            
-            # Добавляем пункты меню для папок с указанием количества файлов
-            folder_a_item = MenuItem(
-                f"Папка A [{files_in_a} {self._get_files_word(files_in_a)}]", 
-                action=lambda: self._start_recording("A"),
-                speech_text="Папка A"  # Только название папки для озвучки
-            )
-            folder_menu.add_item(folder_a_item)
-            
-            folder_b_item = MenuItem(
-                f"Папка B [{files_in_b} {self._get_files_word(files_in_b)}]", 
-                action=lambda: self._start_recording("B"),
-                speech_text="Папка B"  # Только название папки для озвучки
-            )
-            folder_menu.add_item(folder_b_item)
-            
-            folder_c_item = MenuItem(
-                f"Папка C [{files_in_c} {self._get_files_word(files_in_c)}]", 
-                action=lambda: self._start_recording("C"),
-                speech_text="Папка C"  # Только название папки для озвучки
-            )
-            folder_menu.add_item(folder_c_item)
-            
-            # Переключаемся на меню выбора папки
-            self.current_menu = folder_menu
-            self.display_current_menu()
+            self._show_folder_menu("_folder_menu", "Выберите папку для записи", self._start_recording)
         except Exception as e:
             error_msg = f"Ошибка при отображении меню выбора папки: {e}"
             print(error_msg)
@@ -1242,44 +1514,47 @@ class MenuManager:
     def _show_play_record_menu(self):
         """Показывает меню воспроизведения записей"""
         try:
-            # Создаем временное подменю для выбора папки
-            play_menu = SubMenu("Выберите папку для воспроизведения", parent=self.current_menu)
-            
-            # Получаем количество файлов в каждой папке
-            files_in_a = self.playback_manager.count_files_in_folder("A")
-            files_in_b = self.playback_manager.count_files_in_folder("B")
-            files_in_c = self.playback_manager.count_files_in_folder("C")
-            
-            # Добавляем пункты меню для папок с указанием количества файлов
-            folder_a_item = MenuItem(
-                f"Папка A [{files_in_a} {self._get_files_word(files_in_a)}]",
-                action=lambda: self._show_play_files_menu("A"),
-                speech_text="Папка A"  # Только название папки для озвучки
-            )
-            play_menu.add_item(folder_a_item)
-            
-            folder_b_item = MenuItem(
-                f"Папка B [{files_in_b} {self._get_files_word(files_in_b)}]",
-                action=lambda: self._show_play_files_menu("B"),
-                speech_text="Папка B"  # Только название папки для озвучки
-            )
-            play_menu.add_item(folder_b_item)
-            
-            folder_c_item = MenuItem(
-                f"Папка C [{files_in_c} {self._get_files_word(files_in_c)}]",
-                action=lambda: self._show_play_files_menu("C"),
-                speech_text="Папка C"  # Только название папки для озвучки
-            )
-            play_menu.add_item(folder_c_item)
-            
-            # Переключаемся на меню выбора папки
-            self.current_menu = play_menu
-            self.display_current_menu()
+            self._show_folder_menu("_play_menu", "Выберите папку для воспроизведения", self._show_play_files_menu)
         except Exception as e:
             error_msg = f"Ошибка при отображении меню воспроизведения: {e}"
             print(error_msg)
             sentry_sdk.capture_exception(e)
     
+    def _show_folder_menu(self, cache_attr, title, action):
+        """
+        Показывает меню выбора папки A, B или C
+        
+        Меню создается один раз, при каждом показе обновляется только
+        количество файлов в названиях пунктов
+        
+        Args:
+            cache_attr (str): Имя атрибута, в котором хранится меню
+            title (str): Заголовок меню
+            action (callable): Действие, вызываемое с буквой выбранной папки
+        """
+        folder_menu = getattr(self, cache_attr)
+        if folder_menu is None:
+            folder_menu = SubMenu(title)
+            for folder in _FOLDERS:
+                folder_menu.add_item(MenuItem(
+                    _FOLDER_LABELS[folder],
+                    action=partial(action, folder),
+                    speech_text=_FOLDER_LABELS[folder]  # Только название папки для озвучки
+                ))
+            setattr(self, cache_attr, folder_menu)
+        
+        # Обновляем количество файлов в каждой папке
+        for item, folder in zip(folder_menu.items, _FOLDERS):
+            files_count = self.playback_manager.count_files_in_folder(folder)
+            item.name = f"{_FOLDER_LABELS[folder]} [{files_count} {self._get_files_word(files_count)}]"
+        
+        # Переключаемся на меню выбора папки
+        if self.current_menu is not folder_menu:
+            folder_menu.parent = self.current_menu
+        folder_menu.current_selection = 0
+        self.current_menu = folder_menu
+        self.display_current_menu()
+    
     def _show_delete_record_menu(self):
         """Показывает меню массового удаления записей"""
         try:
@@ -1292,53 +1567,73 @@ class MenuManager:
 
     def _update_playback_info(self):
         """Обновляет информацию о текущем воспроизведении"""
+        ps = self.playback_state
         try:
             # Получаем информацию о воспроизведении
             player_info = self.playback_manager.playback_info
             
-            # Обновляем состояние воспроизведения
-            self.playback_state["active"] = player_info["active"]
-            self.playback_state["paused"] = player_info["paused"]
-            self.playback_state["position"] = player_info["position"]
-            self.playback_state["duration"] = player_info["duration"]
-            self.playback_state["progress"] = player_info["progress"]
-            
             # Получаем информацию о текущем файле
             file_info = self.playback_manager.get_current_file_info()
+            delete_active = self.playback_manager.is_delete_confirmation_active()
+            
+            # Ничего не обновляем, если выводимые на экран данные не изменились
+            rendered = (
+                player_info["active"],
+                player_info["paused"],
+                player_info["position"],
+                player_info["duration"],
+                player_info["progress"],
+                file_info["description"] if file_info else None,
+                delete_active,
+                self.playback_manager.confirm_delete_selected
+            )
+            # Если после прошлого кадра экран занял другой вывод, кадр рисуется заново
+            if rendered == self._last_rendered_playback and \
+               self.display_manager.current_screen in ("playback", "delete_confirmation"):
+                return
+            self._last_rendered_playback = rendered
+            
+            # Обновляем состояние воспроизведения
+            ps["active"] = player_info["active"]
+            ps["paused"] = player_info["paused"]
+            ps["position"] = player_info["position"]
+            ps["duration"] = player_info["duration"]
+            ps["progress"] = player_info["progress"]
+            
             if file_info:
-                self.playback_state["current_file"] = file_info["description"]
-                self.playback_state["folder"] = file_info["folder"]
+                ps["current_file"] = file_info["description"]
+                ps["folder"] = file_info["folder"]
             
             # Проверяем, активен ли режим подтверждения удаления
-            if self.playback_manager.is_delete_confirmation_active():
+            if delete_active:
                 # Отображаем экран подтверждения удаления
-                self.display_manager.display_delete_confirmation(
-                    file_name=self.playback_state["current_file"],
+                self._render_latest(
+                    self.display_manager.display_delete_confirmation,
+                    file_name=ps["current_file"],
                     selected_option=self.playback_manager.confirm_delete_selected
                 )
                 
-                if self.debug:
-                    print(f"Отображение экрана подтверждения удаления: " +
-                        f"файл={self.playback_state['current_file']}, " +
-                        f"выбрано={self.playback_manager.confirm_delete_selected}")
+                logger.debug("Отображение экрана подтверждения удаления: файл=%s, выбрано=%s", ps['current_file'], self.playback_manager.confirm_delete_selected)
             
             # Обновляем экран воспроизведения, если воспроизведение активно и не активен режим подтверждения
-            elif self.playback_state["active"]:
-                status = "Paused" if self.playback_state["paused"] else "Playing"
-                self.display_manager.display_playback_screen(
+            elif ps["active"]:
+                status = "Paused" if ps["paused"] else "Playing"
+                # Строку времени пересобираем только при изменении позиции или длительности
+                pos_dur = (ps["position"], ps["duration"])
+                if pos_dur != self._last_pos_dur:
+                    self._last_pos_dur = pos_dur
+                    self._last_time_str = f"{pos_dur[0]} / {pos_dur[1]}"
+                time_str = self._last_time_str
+                self._render_latest(
+                    self.display_manager.display_playback_screen,
                     status=status,
-                    time=f"{self.playback_state['position']} / {self.playback_state['duration']}",
-                    progress=self.playback_state["progress"],
-                    file_name=self.playback_state["current_file"],
-                    folder=self.playback_state["folder"]
+                    time=time_str,
+                    progress=ps["progress"],
+                    file_name=ps["current_file"],
+                    folder=ps["folder"]
                 )
                 
-                if self.debug:
-                    print(f"Обновление информации о воспроизведении: " +
-                        f"активно={self.playback_state['active']}, " +
-                        f"пауза={self.playback_state['paused']}, " +
-                        f"время={self.playback_state['position']} / {self.playback_state['duration']}, " +
-                        f"файл={self.playback_state['current_file']}")
+                logger.debug("Обновление информации о воспроизведении: активно=%s, пауза=%s, время=%s, файл=%s", ps['active'], ps['paused'], time_str, ps['current_file'])
         except Exception as e:
             error_msg = f"Ошибка при обновлении информации о воспроизведении: {e}"
             print(error_msg)
@@ -1351,9 +1646,14 @@ class MenuManager:
         Args:
             folder (str): Папка для поиска файлов
             start_with_file (int, optional): Индекс файла для немедленного воспроизведения
+            
+        Returns:
+            bool: True, если меню файлов показано, False при ошибке.
+                Для пустой папки возвращает None: сообщение и возврат
+                в меню выполняет фоновый поток
         """
         try:
-            print(f"\n*** ЗАГРУЗКА ФАЙЛОВ ИЗ ПАПКИ {folder} ***")
+            logger.debug("*** ЗАГРУЗКА ФАЙЛОВ ИЗ ПАПКИ %s ***", folder)
             
             # Запоминаем текущее меню перед загрузкой файлов
             parent_menu = self.current_menu
@@ -1365,19 +1665,21 @@ class MenuManager:
                 
                 # Создаем подменю для файлов
                 files_menu = SubMenu(f"Записи в папке {os.path.basename(folder)}")
+                files_list = list(self.playback_manager.files_list)
                 
-                # Добавляем файлы в меню
-                for i in range(files_count):
-                    file_info = self.playback_manager.get_file_info(i)
-                    if file_info:
-                        # Используем человеко-читаемое имя файла
-                        file_item = MenuItem(file_info["description"], lambda idx=i: self._play_file(idx))
-                        files_menu.add_item(file_item)
+                # Первые записи добавляем сразу, остальные догружаются порциями,
+                # когда курсор доходит до конца загруженного списка. При немедленном
+                # воспроизведении нужен весь список, поэтому загружаем его целиком
+                first_batch = files_count if start_with_file is not None else min(files_count, self.FILES_MENU_BATCH)
+                self._append_file_items(files_menu, files_list, 0, first_batch)
+                
+                if first_batch < files_count:
+                    files_menu.loader = partial(self._load_file_page, files_menu, files_list)
                 
                 # Устанавливаем текущее меню
                 self.current_menu = files_menu
                 
-                print(f"Загружено {files_count} файлов из папки {folder}")
+                logger.debug("Загружено %s файлов из папки %s", files_count, folder)
                 
                 # Если указан индекс файла для воспроизведения, запускаем его сразу
                 if start_with_file is not None and 0 <= start_with_file < files_count:
@@ -1391,7 +1693,7 @@ class MenuManager:
                 self.display_current_menu()
                 return True
             else:
-                print(f"В папке {folder} нет файлов")
+                logger.debug("В папке %s нет файлов", folder)
                 
                 # Создаем сообщение
                 folder_name = os.path.basename(folder)
@@ -1399,128 +1701,179 @@ class MenuManager:
                 # Отображаем сообщение на экране
                 self.display_manager.display_message(f"В папке {folder_name} нет записей", title="Пустая папка")
                 
-                if self.tts_enabled:
-                    # Получаем текущий голос из настроек
-                    voice = self.settings_manager.get_voice()
-                    self.tts_manager.play_speech("В папке", voice_id=voice)
-                    time.sleep(0.1)  # Небольшая пауза между сообщениями
-                    self.tts_manager.play_speech(folder_name, voice_id=voice)
-                    time.sleep(0.1)  # Небольшая пауза между сообщениями
-                    self.tts_manager.play_speech("нет записей", voice_id=voice)
-                
-                # Возвращаемся в предыдущее меню
-                time.sleep(2)
-                self.display_current_menu()
-                return False
+                # Озвучиваем сообщение и возвращаемся в меню в фоне, не задерживая обработку кнопок
+                threading.Thread(
+                    target=self._announce_empty_folder,
+                    args=(folder_name, self._current_voice),
+                    daemon=True
+                ).start()
+                # Ничего не возвращаем, чтобы select_current_item не перебил сообщение своим
+                return None
         except Exception as e:
             error_msg = f"Ошибка при показе меню файлов: {e}"
             print(error_msg)
             sentry_sdk.capture_exception(e)
             return False
     
+    def _announce_empty_folder(self, folder_name, voice):
+        """
+        Озвучивает сообщение о пустой папке и возвращается к отображению меню
+        
+        Args:
+            folder_name (str): Название папки
+            voice (str): Идентификатор голоса
+        """
+        try:
+            if self.tts_enabled:
+                self.tts_manager.play_speech_blocking("В папке", voice_id=voice)
+                self.tts_manager.play_speech_blocking(folder_name, voice_id=voice)
+                self.tts_manager.play_speech("нет записей", voice_id=voice)
+            
+            # Возвращаемся в предыдущее меню после окончания сообщения,
+            # перерисовку выполняет поток интерфейса
+            self._wait_for_speech(2)
+            self._request_redraw()
+        except Exception as e:
+            error_msg = f"Ошибка при озвучивании пустой папки: {e}"
+            print(error_msg)
+            sentry_sdk.capture_exception(e)
+    
+    def _append_file_items(self, files_menu, files_list, start, stop):
+        """
+        Добавляет в меню пункты для записей с индексами от start до stop
+        
+        Args:
+            files_menu (SubMenu): Меню записей
+            files_list (list): Пути к файлам папки
+            start (int): Индекс первой записи
+            stop (int): Индекс, перед которым нужно остановиться
+        """
+        # Используем человеко-читаемые имена файлов, полученные одним вызовом
+        descriptions = self.playback_manager.get_file_descriptions(files_list[start:stop])
+        files_menu.extend_items([
+            MenuItem(description, partial(self._play_file, i))
+            for i, description in enumerate(descriptions, start)
+        ])
+    
+    def _load_file_page(self, files_menu, files_list):
+        """
+        Догружает в меню записей следующую порцию из FILES_MENU_BATCH записей
+        
+        Args:
+            files_menu (SubMenu): Меню записей
+            files_list (list): Пути к файлам папки
+            
+        Returns:
+            bool: True, если в папке остались еще не добавленные записи
+        """
+        start = len(files_menu.items)
+        stop = min(start + self.FILES_MENU_BATCH, len(files_list))
+        self._append_file_items(files_menu, files_list, start, stop)
+        return stop < len(files_list)
+    
     def _play_file(self, file_index):
         """Начинает воспроизведение выбранного файла"""
         try:
-            print("\n*** ВОСПРОИЗВЕДЕНИЕ ФАЙЛА ***")
-            print(f"Индекс файла: {file_index}")
+            logger.debug("*** ВОСПРОИЗВЕДЕНИЕ ФАЙЛА ***")
+            logger.debug("Индекс файла: %s", file_index)
+            
+            # Экран плеера рисуется заново, прошлые кадры к нему не относятся
+            self._last_rendered_playback = None
             
             # Запоминаем меню, из которого запущен аудиоплеер
             self.source_menu = self.current_menu
             if self.debug and self.source_menu:
-                print(f"Запоминаем исходное меню: {self.source_menu.name}")
+                logger.debug("Запоминаем исходное меню: %s", self.source_menu.name)
+            
+            # Пока идет воспроизведение, заранее синтезируем сообщение о возврате в это меню
+            if self.tts_enabled and self.source_menu and self.source_menu.name:
+                self._tts_pool.submit(
+                    self.tts_manager.generate_speech,
+                    self.RETURN_MESSAGE.format(self.source_menu.name),
+                    voice=self._current_voice
+                )
             
             # Активируем режим аудиоплеера
             self.player_mode_active = True
             
-            if self.debug:
-                print("РЕЖИМ АУДИОПЛЕЕРА АКТИВИРОВАН")
+            logger.debug("РЕЖИМ АУДИОПЛЕЕРА АКТИВИРОВАН")
             
-            # Устанавливаем текущий индекс файла
-            if self.playback_manager.set_current_file(file_index):
-                # Получаем информацию о файле
-                file_info = self.playback_manager.get_current_file_info()
-                
+            # Проверяем индекс до озвучки, чтобы не объявлять воспроизведение несуществующего файла
+            if 0 <= file_index < self.playback_manager.get_files_count():
                 # Используем простое сообщение "Воспроизведение" вместо полного названия записи
-                if file_info and self.tts_enabled:
+                if self.tts_enabled:
                     # Озвучиваем простое сообщение перед воспроизведением
-                    voice = self.settings_manager.get_voice()
+                    voice = self._current_voice
                     message = "Воспроизведение"
                     
-                    if self.debug:
-                        print(f"Озвучивание сообщения перед воспроизведением: {message}")
-                        print(f"Не озвучиваем полное название: {file_info['description']}")
+                    logger.debug("Озвучивание сообщения перед воспроизведением: %s", message)
                     
                     # Используем блокирующее воспроизведение, чтобы сообщение прозвучало полностью
                     message_played = False
                     try:
                         if hasattr(self.tts_manager, 'play_speech_blocking'):
-                            print("Использую блокирующее воспроизведение сообщения...")
+                            logger.debug("Использую блокирующее воспроизведение сообщения...")
                             self.tts_manager.play_speech_blocking(message, voice_id=voice)
                             message_played = True
                         else:
-                            print("Использую стандартное воспроизведение сообщения...")
+                            logger.debug("Использую стандартное воспроизведение сообщения...")
                             self.tts_manager.play_speech(message, voice_id=voice)
                             message_played = True
                     except Exception as e:
                         print(f"Ошибка при озвучивании перед воспроизведением: {e}")
                         sentry_sdk.capture_exception(e)
                     
-                    # Уменьшаем паузу до 1.5 секунд
+                    # Ждем окончания сообщения, но не дольше 2 секунд
                     if message_played:
-                        print("Ожидание 1.5 секунды для завершения воспроизведения сообщения...")
-                        time.sleep(1.5)
+                        self._wait_for_speech(2.0)
                 
-                # Теперь начинаем воспроизведение
-                print("Начинаем воспроизведение файла...")
-                result = self.playback_manager.play_current_file()
+                # Теперь делаем файл текущим и начинаем воспроизведение одним вызовом
+                logger.debug("Начинаем воспроизведение файла...")
+                result = self.playback_manager.play_file(file_index)
                 if result:
-                    print("Воспроизведение успешно начато")
+                    logger.debug("Воспроизведение успешно начато")
                 else:
-                    print("ОШИБКА: Не удалось начать воспроизведение")
+                    logger.error("ОШИБКА: Не удалось начать воспроизведение")
                     # Если не удалось начать воспроизведение, деактивируем режим плеера
                     self.player_mode_active = False
             else:
-                print(f"ОШИБКА: Не удалось установить текущий файл с индексом {file_index}")
+                logger.error("ОШИБКА: Не удалось установить текущий файл с индексом %s", file_index)
                 # Если не удалось установить файл, деактивируем режим плеера
                 self.player_mode_active = False
                 
         except Exception as e:
-            print(f"КРИТИЧЕСКАЯ ОШИБКА при воспроизведении файла: {e}")
+            logger.exception("КРИТИЧЕСКАЯ ОШИБКА при воспроизведении файла")
             sentry_sdk.capture_exception(e)
             # В случае ошибки деактивируем режим плеера
             self.player_mode_active = False
     
     def _toggle_pause_playback(self):
         """Переключает паузу воспроизведения"""
-        if not self.playback_state["active"]:
-            if self.debug:
-                print("Попытка поставить на паузу, но воспроизведение не активно")
+        ps = self.playback_state
+        if not ps["active"]:
+            logger.debug("Попытка поставить на паузу, но воспроизведение не активно")
             return False
         
         try:
             print("\n*** ПЕРЕКЛЮЧЕНИЕ ПАУЗЫ ВОСПРОИЗВЕДЕНИЯ ***")
             
             # Проверяем состояние воспроизведения и паузы
-            is_paused = self.playback_state["paused"]
+            is_paused = ps["paused"]
             
-            if self.debug:
-                print(f"Переключаем паузу воспроизведения. Текущее состояние паузы: {is_paused}")
+            logger.debug("Переключаем паузу воспроизведения. Текущее состояние паузы: %s", is_paused)
             
             # Пробуем несколько способов переключения паузы
             toggle_success = False
             
             # 1. Пробуем через playback_manager.toggle_pause()
             try:
-                if self.debug:
-                    print("ПОПЫТКА 1: Переключение через playback_manager.toggle_pause()")
+                logger.debug("ПОПЫТКА 1: Переключение через playback_manager.toggle_pause()")
                 success = self.playback_manager.toggle_pause()
                 if success:
                     toggle_success = True
-                    if self.debug:
-                        print("ПОПЫТКА 1: Успешно")
+                    logger.debug("ПОПЫТКА 1: Успешно")
                 else:
-                    if self.debug:
-                        print("ПОПЫТКА 1: Не удалось")
+                    logger.debug("ПОПЫТКА 1: Не удалось")
             except Exception as e:
                 print(f"Ошибка при переключении паузы через playback_manager: {e}")
                 sentry_sdk.capture_exception(e)
@@ -1528,32 +1881,27 @@ class MenuManager:
             # 2. Если не сработало, пробуем напрямую через AudioPlayer
             if not toggle_success and hasattr(self.playback_manager, 'player'):
                 try:
-                    if self.debug:
-                        print("ПОПЫТКА 2: Переключение напрямую через player.pause() или player.resume()")
+                    logger.debug("ПОПЫТКА 2: Переключение напрямую через player.pause() или player.resume()")
                     
                     player = self.playback_manager.player
                     if is_paused:
                         # Возобновляем воспроизведение
                         if hasattr(player, 'resume'):
-                            if self.debug:
-                                print("Вызываем player.resume()")
+                            logger.debug("Вызываем player.resume()")
                             result = player.resume()
                             if result:
-                                self.playback_state["paused"] = False
+                                ps["paused"] = False
                                 toggle_success = True
-                                if self.debug:
-                                    print("ПОПЫТКА 2: Успешное возобновление")
+                                logger.debug("ПОПЫТКА 2: Успешное возобновление")
                     else:
                         # Ставим на паузу
                         if hasattr(player, 'pause'):
-                            if self.debug:
-                                print("Вызываем player.pause()")
+                            logger.debug("Вызываем player.pause()")
                             result = player.pause()
                             if result:
-                                self.playback_state["paused"] = True
+                                ps["paused"] = True
                                 toggle_success = True
-                                if self.debug:
-                                    print("ПОПЫТКА 2: Успешная постановка на паузу")
+                                logger.debug("ПОПЫТКА 2: Успешная постановка на паузу")
                 except Exception as e:
                     print(f"Ошибка при прямом переключении паузы: {e}")
                     sentry_sdk.capture_exception(e)
@@ -1561,12 +1909,11 @@ class MenuManager:
             # 3. Если предыдущие попытки не сработали, принудительно меняем состояние
             if not toggle_success:
                 try:
-                    if self.debug:
-                        print("ПОПЫТКА 3: Принудительное переключение состояния")
+                    logger.debug("ПОПЫТКА 3: Принудительное переключение состояния")
                     
                     # Инвертируем состояние паузы
                     new_paused_state = not is_paused
-                    self.playback_state["paused"] = new_paused_state
+                    ps["paused"] = new_paused_state
                     
                     # Вызываем соответствующие методы AudioPlayer в зависимости от нового состояния
                     if hasattr(self.playback_manager, 'player'):
@@ -1581,8 +1928,7 @@ class MenuManager:
                                 player.resume()
                     
                     toggle_success = True
-                    if self.debug:
-                        print(f"ПОПЫТКА 3: Успешно принудительно установили состояние паузы: {new_paused_state}")
+                    logger.debug("ПОПЫТКА 3: Успешно принудительно установили состояние паузы: %s", new_paused_state)
                 except Exception as e:
                     print(f"Ошибка при принудительном переключении паузы: {e}")
                     sentry_sdk.capture_exception(e)
@@ -1590,45 +1936,37 @@ class MenuManager:
             # Проверяем успешность операции и выводим системное сообщение при необходимости
             if toggle_success:
                 # Получаем текущее состояние паузы после всех операций
-                current_paused_state = self.playback_state["paused"]
+                current_paused_state = ps["paused"]
                 
-                if self.debug:
-                    print(f"Итоговое состояние паузы: {current_paused_state}")
+                logger.debug("Итоговое состояние паузы: %s", current_paused_state)
                 
                 # Логика паузы уже обработана в PlaybackManager, включая озвучивание
                 # Не дублируем озвучивание здесь, так как это делает PlaybackManager
                 if current_paused_state:
-                    if self.debug:
-                        print("Воспроизведение на паузе")
+                    logger.debug("Воспроизведение на паузе")
                 else:
                     # Воспроизведение возобновлено
-                    if self.debug:
-                        print("Воспроизведение возобновлено")
+                    logger.debug("Воспроизведение возобновлено")
             else:
-                if self.debug:
-                    print("ОШИБКА: Не удалось переключить паузу воспроизведения всеми доступными способами")
+                logger.debug("ОШИБКА: Не удалось переключить паузу воспроизведения всеми доступными способами")
             
             # Отображаем текущий статус воспроизведения
-            if self.debug:
-                print(f"Статус воспроизведения: активно={self.playback_state['active']}, " +
-                      f"на паузе={self.playback_state['paused']}, " +
-                      f"время={self.playback_state['position']} / {self.playback_state['duration']}")
+            logger.debug("Статус воспроизведения: активно=%s, на паузе=%s, время=%s / %s", ps['active'], ps['paused'], ps['position'], ps['duration'])
             
             # Возвращаем результат операции
             return toggle_success
         
         except Exception as e:
-            if self.debug:
-                print(f"КРИТИЧЕСКАЯ ОШИБКА при переключении паузы воспроизведения: {e}")
+            logger.debug("КРИТИЧЕСКАЯ ОШИБКА при переключении паузы воспроизведения: %s", e)
             sentry_sdk.capture_exception(e)
             return False
     
     def _stop_playback(self):
         """Останавливает воспроизведение и возвращается в меню"""
+        ps = self.playback_state
         try:
-            if not self.playback_state["active"] and not self.player_mode_active:
-                if self.debug:
-                    print("Попытка остановить воспроизведение, но оно не активно и режим плеера не включен")
+            if not ps["active"] and not self.player_mode_active:
+                logger.debug("Попытка остановить воспроизведение, но оно не активно и режим плеера не включен")
                 return False
                 
             print("\n*** ОСТАНОВКА ВОСПРОИЗВЕДЕНИЯ ***")
@@ -1642,8 +1980,7 @@ class MenuManager:
             # чтобы предотвратить повторную обработку кнопок в режиме плеера
             old_mode = self.player_mode_active
             self.player_mode_active = False
-            if self.debug:
-                print(f"РЕЖИМ АУДИОПЛЕЕРА ДЕАКТИВИРОВАН (предыдущее значение: {old_mode})")
+            logger.debug("РЕЖИМ АУДИОПЛЕЕРА ДЕАКТИВИРОВАН (предыдущее значение: %s)", old_mode)
             
             # Определяем меню для возврата
             return_menu = None
@@ -1665,8 +2002,7 @@ class MenuManager:
                 # Проверяем корректность меню возврата
                 if files_menu and hasattr(files_menu, 'name'):
                     menu_name = files_menu.name
-                    if self.debug:
-                        print(f"Возврат к меню со списком записей: {menu_name}")
+                    logger.debug("Возврат к меню со списком записей: %s", menu_name)
                     sentry_sdk.add_breadcrumb(
                         category='playback',
                         message=f'Возврат к меню из playback_manager: {menu_name}',
@@ -1676,21 +2012,19 @@ class MenuManager:
                 else:
                     # Если у нас нет правильного меню со списком записей, попробуем найти его
                     folder = None
-                    if self.playback_state["folder"]:
-                        folder = self.playback_state["folder"]
+                    if ps["folder"]:
+                        folder = ps["folder"]
                     elif self.playback_manager.current_folder:
                         folder = self.playback_manager.current_folder
                     
                     if folder and self.current_menu and hasattr(self.current_menu, 'parent'):
-                        if self.debug:
-                            print(f"Пытаемся найти меню с записями для папки {folder}")
+                        logger.debug("Пытаемся найти меню с записями для папки %s", folder)
                         
                         # Находим правильное меню для возврата
                         for menu in self.current_menu.parent.submenus:
                             if hasattr(menu, 'name') and menu.name and folder in menu.name:
                                 return_menu = menu
-                                if self.debug:
-                                    print(f"Найдено меню записей: {menu.name}")
+                                logger.debug("Найдено меню записей: %s", menu.name)
                                 sentry_sdk.add_breadcrumb(
                                     category='playback',
                                     message=f'Найдено подходящее меню для возврата: {menu.name}',
@@ -1703,8 +2037,18 @@ class MenuManager:
             if return_menu and hasattr(return_menu, 'name') and return_menu.name:
                 menu_name = return_menu.name
             
-            if self.debug:
-                print(f"Меню для возврата: {menu_name}")
+            logger.debug("Меню для возврата: %s", menu_name)
+            
+            # Используем запомненный текущий голос
+            voice = self._current_voice
+            
+            # Формируем сообщение о возврате
+            message = self.RETURN_MESSAGE.format(menu_name)
+            
+            # Синтезируем сообщение в фоне, пока останавливается воспроизведение
+            speech_future = None
+            if self.tts_enabled:
+                speech_future = self._tts_pool.submit(self.tts_manager.generate_speech, message, voice=voice)
             
             # Останавливаем воспроизведение ПЕРЕД озвучиванием сообщения
             # чтобы избежать проблем с перекрытием звуков
@@ -1712,8 +2056,7 @@ class MenuManager:
             
             # Дополнительная проверка, что playback_manager существует и доступен
             if not hasattr(self, 'playback_manager') or not self.playback_manager:
-                if self.debug:
-                    print("ОШИБКА: playback_manager не найден")
+                logger.debug("ОШИБКА: playback_manager не найден")
                 sentry_sdk.capture_message("playback_manager не найден при остановке воспроизведения", level="error")
                 return False
                 
@@ -1724,111 +2067,98 @@ class MenuManager:
                 sentry_sdk.capture_message("stop_playback вернул False при остановке воспроизведения", level="warning")
             
             # Проверяем, что воспроизведение точно остановлено
-            if self.playback_state["active"]:
+            if ps["active"]:
                 if self.debug:
                     print("ОШИБКА: После вызова stop_playback флаг active остался True, делаем дополнительную остановку")
                     sentry_sdk.capture_message("Флаг active остался True после остановки, делаем дополнительную остановку", level="warning")
                 # Повторная попытка остановки
-                self.playback_manager.stop_playback()
+                stop_result = self.playback_manager.stop_playback()
                 # Принудительно сбрасываем состояние
-                self.playback_state["active"] = False
-                self.playback_state["paused"] = False
+                ps["active"] = False
+                ps["paused"] = False
             
-            # Даем время для полной остановки воспроизведения
-            time.sleep(0.5)
+            # Пауза для полной остановки нужна, только если плеер не подтвердил остановку
+            if not stop_result:
+                time.sleep(0.5)
             
             # Озвучиваем сообщение о возврате блокирующим методом
             if self.tts_enabled:
                 try:
-                    # Получаем текущий голос из настроек
-                    voice = self.settings_manager.get_voice()
+                    logger.debug("Озвучивание перед возвратом: %s, голос: %s", message, voice)
                     
-                    # Формируем сообщение о возврате
-                    message = f"Возврат к {menu_name}"
-                    
-                    if self.debug:
-                        print(f"Озвучивание перед возвратом: {message}, голос: {voice}")
+                    # Дожидаемся синтеза, чтобы воспроизвести уже готовый файл
+                    speech_future.result()
                     
                     # Используем блокирующее озвучивание
                     self.tts_manager.play_speech_blocking(message, voice_id=voice)
                 except Exception as e:
                     print(f"Ошибка при озвучивании перед переходом: {e}")
-                    sentry_sdk.capture_exception(e)
+                    self._capture(e)
             
-            # Выполняем переход в меню
-            if return_menu:
-                old_menu = self.current_menu
-                self.current_menu = return_menu
-                if self.debug:
-                    old_name = getattr(old_menu, 'name', str(old_menu)) if old_menu else "None"
-                    new_name = getattr(return_menu, 'name', str(return_menu))
-                    print(f"Переход в меню: {old_name} -> {new_name}")
-                    sentry_sdk.add_breadcrumb(
-                        category='navigation',
-                        message=f'Переход в меню после остановки воспроизведения: {old_name} -> {new_name}',
-                        level='info'
-                    )
-            else:
-                # Если не удалось найти меню с записями, возвращаемся к родительскому меню
-                parent_menu = None
-                if self.current_menu and hasattr(self.current_menu, 'parent'):
-                    parent_menu = self.current_menu.parent
-                
-                if parent_menu:
-                    old_menu = self.current_menu
-                    self.current_menu = parent_menu
-                    if self.debug:
-                        old_name = getattr(old_menu, 'name', str(old_menu)) if old_menu else "None"
-                        new_name = getattr(parent_menu, 'name', str(parent_menu))
-                        print(f"Переход в родительское меню: {old_name} -> {new_name}")
-                        sentry_sdk.add_breadcrumb(
-                            category='navigation',
-                            message=f'Переход в родительское меню: {old_name} -> {new_name}',
-                            level='info'
-                        )
-                else:
-                    # Если нет родительского меню, возвращаемся в корневое
-                    old_menu = self.current_menu
-                    self.current_menu = self.root_menu
-                    if self.debug:
-                        old_name = getattr(old_menu, 'name', str(old_menu)) if old_menu else "None"
-                        new_name = getattr(self.root_menu, 'name', str(self.root_menu))
-                        print(f"Переход в корневое меню: {old_name} -> {new_name}")
-                        sentry_sdk.add_breadcrumb(
-                            category='navigation',
-                            message=f'Переход в корневое меню: {old_name} -> {new_name}',
-                            level='info'
-                        )
+            # Переходим в меню с записями, а если его нет - в родительское или корневое
+            old_menu = self.current_menu
+            target_menu = return_menu or getattr(old_menu, 'parent', None) or self.root_menu
+            if self.debug:
+                old_name = getattr(old_menu, 'name', str(old_menu)) if old_menu else "None"
+                new_name = getattr(target_menu, 'name', str(target_menu))
+                print(f"Переход в меню: {old_name} -> {new_name}")
+                sentry_sdk.add_breadcrumb(
+                    category='navigation',
+                    message=f'Переход в меню после остановки воспроизведения: {old_name} -> {new_name}',
+                    level='info'
+                )
             
             # Сбрасываем source_menu
-            if hasattr(self, 'source_menu'):
-                self.source_menu = None
-                
-            # Отображаем меню
-            self.display_current_menu()
+            self.source_menu = None
+            
+            self._switch_menu(target_menu)
             
             # Возвращаем True если операция успешна
             return True
                 
         except Exception as e:
-            print(f"КРИТИЧЕСКАЯ ОШИБКА при остановке воспроизведения: {e}")
-            sentry_sdk.capture_exception(e)
+            logger.exception("КРИТИЧЕСКАЯ ОШИБКА при остановке воспроизведения")
+            self._capture(e)
             
-            # В случае ошибки пытаемся вернуться в главное меню
+            # В случае ошибки возвращаемся в главное меню, перерисовка идет в фоне
             try:
                 self.current_menu = self.root_menu
-                self.display_current_menu()
+                self._request_redraw()
             except Exception as menu_e:
                 print(f"Не удалось вернуться в главное меню после ошибки: {menu_e}")
-                sentry_sdk.capture_exception(menu_e)
+                self._capture(menu_e)
                 
             return False
     
+    def _switch_menu(self, menu, fallback=None):
+        """
+        Переключается на указанное меню и отображает его
+        
+        Args:
+            menu: Меню для перехода или None
+            fallback (optional): Меню на случай, если menu не задано; по умолчанию корневое
+        """
+        self.current_menu = menu or fallback or self.root_menu
+        self.display_current_menu()
+    
+    def _capture(self, e):
+        """
+        Отправляет исключение в Sentry выборочно: первый случай каждой ошибки
+        и далее каждый SENTRY_SAMPLE_EVERY-й повтор
+        
+        Args:
+            e (Exception): Перехваченное исключение
+        """
+        key = (type(e).__name__, str(e))
+        count = self._sentry_sampler.get(key, 0)
+        self._sentry_sampler[key] = count + 1
+        if count % self.SENTRY_SAMPLE_EVERY == 0:
+            sentry_sdk.capture_exception(e)
+    
     def _delete_current_file(self):
         """Удаляет текущий воспроизводимый файл"""
         if not self.player_mode_active:  # Проверяем только режим плеера, а не активность воспроизведения
-            if self.debug:
-                print("Попытка удалить файл, но режим плеера не активен")
+            logger.debug("Попытка удалить файл, но режим плеера не активен")
             return
         
         # Инициируем процесс удаления
@@ -1849,22 +2179,19 @@ class MenuManager:
                 level='info'
             )
             
-            if self.debug:
-                print(f"\n*** ПОДТВЕРЖДЕНИЕ/ОТМЕНА УДАЛЕНИЯ: {confirmed} ***")
-                print(f"Состояние до: player_mode={self.player_mode_active}, playback_active={self.playback_state['active']}")
+            logger.debug("*** ПОДТВЕРЖДЕНИЕ/ОТМЕНА УДАЛЕНИЯ: %s ***", confirmed)
+            logger.debug("Состояние до: player_mode=%s, playback_active=%s", self.player_mode_active, self.playback_state['active'])
             
             # Проверяем, активен ли режим подтверждения удаления
             if not self.playback_manager.is_delete_confirmation_active():
                 error_msg = "Попытка подтвердить/отменить удаление, когда режим подтверждения не активен"
-                if self.debug:
-                    print(f"ОШИБКА: {error_msg}")
+                logger.debug("ОШИБКА: %s", error_msg)
                 sentry_sdk.capture_message(error_msg, level='warning')
                 return
             
             # Сохраняем текущую папку перед удалением
             current_folder = self.playback_manager.current_folder
-            if self.debug:
-                print(f"Текущая папка перед удалением: {current_folder}")
+            logger.debug("Текущая папка перед удалением: %s", current_folder)
             
             # Подтверждаем или отменяем удаление
             try:
@@ -1877,17 +2204,15 @@ class MenuManager:
                 
                 # Если файл был удален, обновляем список файлов и создаем новое меню
                 if confirmed and result:
-                    if self.debug:
-                        print("Файл удален, обновляем список файлов")
+                    logger.debug("Файл удален, обновляем список файлов")
                     
                     try:
-                        # Добавляем задержку для гарантированного воспроизведения сообщения об удалении
-                        time.sleep(2.0)
+                        # Дожидаемся окончания сообщения об удалении, если оно еще звучит
+                        self._wait_for_speech(2.0)
                         
                         # Проверяем, был ли удален файл с флешки
                         if result == "usb_deleted":
-                            if self.debug:
-                                print("Удален файл с флешки, выходим из режима плеера")
+                            logger.debug("Удален файл с флешки, выходим из режима плеера")
                                 
                             # Деактивируем режим плеера
                             self.player_mode_active = False
@@ -1917,16 +2242,11 @@ class MenuManager:
                             # Получаем обновленный список файлов
                             files_count = self.playback_manager.get_files_count()
                             
-                            if self.debug:
-                                print(f"Найдено {files_count} файлов после удаления")
+                            logger.debug("Найдено %s файлов после удаления", files_count)
                             
                             # Добавляем файлы в новое меню
-                            for i in range(files_count):
-                                file_info = self.playback_manager.get_file_info(i)
-                                if file_info:
-                                    file_item = MenuItem(file_info["description"], 
-                                                       lambda idx=i: self._play_file(idx))
-                                    files_menu.add_item(file_item)
+                            files_list = list(self.playback_manager.files_list)
+                            self._append_file_items(files_menu, files_list, 0, files_count)
                             
                             # Устанавливаем родительское меню
                             if self.current_menu and self.current_menu.parent:
@@ -1948,15 +2268,14 @@ class MenuManager:
                                 data={'files_count': files_count}
                             )
                         else:
-                            if self.debug:
-                                print(f"Папка {current_folder} пуста после удаления")
+                            logger.debug("Папка %s пуста после удаления", current_folder)
                             
                             # Если папка пуста, показываем сообщение
                             message = f"В папке {current_folder} нет записей"
                             self.display_manager.display_message(message)
                             
                             if self.tts_enabled:
-                                voice = self.settings_manager.get_voice()
+                                voice = self._current_voice
                                 self.tts_manager.play_speech(message, voice_id=voice)
                             
                             # Возвращаемся в родительское меню
@@ -1984,9 +2303,8 @@ class MenuManager:
                 self.playback_state["active"] = True
                 self.playback_state["paused"] = False
                 
-                if self.debug:
-                    print(f"Отмена удаления: принудительно устанавливаем режим воспроизведения")
-                    print(f"Состояние после: player_mode={self.player_mode_active}, playback_active={self.playback_state['active']}")
+                logger.debug("Отмена удаления: принудительно устанавливаем режим воспроизведения")
+                logger.debug("Состояние после: player_mode=%s, playback_active=%s", self.player_mode_active, self.playback_state['active'])
                 
                 sentry_sdk.add_breadcrumb(
                     category='delete',
@@ -2024,34 +2342,41 @@ class MenuManager:
                 except Exception as recovery_error:
                     sentry_sdk.capture_exception(recovery_error)
     
-    def _next_file(self):
-        """Переходит к следующему файлу в списке"""
-        if not self.playback_state["active"]:
-            return
-        
-        # Переходим к следующему файлу
-        self.playback_manager.move_to_next_file()
-    
-    def _prev_file(self):
-        """Переходит к предыдущему файлу в списке"""
-        if not self.playback_state["active"]:
-            return
-        
-        # Переходим к предыдущему файлу
-        self.playback_manager.move_to_prev_file()
-    
     def _adjust_volume(self, delta):
         """
-        Изменяет громкость воспроизведения
+        Изменяет громкость воспроизведения, объединяя частые нажатия
+        в одно изменение за VOLUME_DEBOUNCE секунд
         
         Args:
             delta (int): Изменение громкости (-/+)
         """
-        if not self.playback_state["active"]:
+        # playback_state["active"] обновляется только тиками воспроизведения,
+        # поэтому проверяем режим плеера: громкость меняется и до первого тика,
+        # и после окончания трека
+        if not self.player_mode_active:
             return
         
-        # Изменяем громкость
-        self.playback_manager.adjust_volume(delta)
+        with self._vol_lock:
+            self._vol_pending += delta
+            if self._vol_timer is None:
+                self._vol_timer = threading.Timer(self.VOLUME_DEBOUNCE, self._flush_volume)
+                self._vol_timer.daemon = True
+                self._vol_timer.start()
+    
+    def _flush_volume(self):
+        """Применяет накопленное изменение громкости"""
+        try:
+            with self._vol_lock:
+                total = self._vol_pending
+                self._vol_pending = 0
+                self._vol_timer = None
+            
+            if total:
+                self.playback_manager.adjust_volume(total)
+        except Exception as e:
+            error_msg = f"Ошибка при применении изменения громкости: {e}"
+            print(error_msg)
+            sentry_sdk.capture_exception(e)
 
     def _get_voice_id_by_description(self, voice_description):
         """
@@ -2063,26 +2388,17 @@ class MenuManager:
         Returns:
             str: Идентификатор голоса или None, если не найден
         """
-        try:
-            # Получаем словарь голосов
-            voices_dict = self.settings_manager.get_available_voices()
-            
-            # Ищем голос по описанию
-            for voice_id, description in voices_dict.items():
-                if description == voice_description:
-                    if self.debug:
-                        print(f"Найден идентификатор {voice_id} для описания '{voice_description}'")
-                    return voice_id
-                    
-            if self.debug:
-                print(f"Идентификатор для описания '{voice_description}' не найден")
-            return None
-            
-        except Exception as e:
-            error_msg = f"Ошибка при поиске идентификатора голоса: {e}"
-            print(error_msg)
-            sentry_sdk.capture_exception(e)
+        # Менеджер настроек может отсутствовать
+        if self.settings_manager is None:
             return None
+        
+        # Обратный словарь голосов строится один раз в менеджере настроек
+        voice_id = self.settings_manager.voices_by_desc.get(voice_description)
+        if voice_id:
+            logger.debug("Найден идентификатор %s для описания %r", voice_id, voice_description)
+        else:
+            logger.debug("Идентификатор для описания %r не найден", voice_description)
+        return voice_id
 
     def _force_kill_playback_processes(self):
         """Принудительно завершает все процессы воспроизведения"""
@@ -2139,14 +2455,19 @@ class MenuManager:
             bool: True если кнопка была обработана
         """
         try:
+            # Получаем информацию о текущем режиме один раз на нажатие
+            is_player_mode = self.player_mode_active
+            is_recording = self.recording_state["active"]
+            is_playing = self.playback_state["active"]
+            
             # Специальная обработка для кнопки BACK в режиме аудиоплеера
             # Чтобы эта кнопка всегда имела высший приоритет
-            if button_id == "KEY_BACK" and (self.player_mode_active or self.playback_state["active"]):
+            if button_id == "KEY_BACK" and (is_player_mode or is_playing):
                 print("\n*** ПРИНУДИТЕЛЬНАЯ ОСТАНОВКА ВОСПРОИЗВЕДЕНИЯ ПО KEY_BACK ***")
-                print(f"Текущий режим: player_mode_active={self.player_mode_active}, playback_active={self.playback_state['active']}")
+                print(f"Текущий режим: player_mode_active={is_player_mode}, playback_active={is_playing}")
                 sentry_sdk.add_breadcrumb(
                     category='playback',
-                    message=f'Принудительная остановка воспроизведения по KEY_BACK (player_active={self.player_mode_active}, playback_active={self.playback_state["active"]})',
+                    message=f'Принудительная остановка воспроизведения по KEY_BACK (player_active={is_player_mode}, playback_active={is_playing})',
                     level='info'
                 )
                 
@@ -2204,15 +2525,9 @@ class MenuManager:
                     return self._stop_playback()
             
             # Обработка в зависимости от текущего режима
-            # Получаем информацию о текущем режиме
-            is_player_mode = self.player_mode_active
-            is_recording = self.recording_state["active"]
-            is_playing = self.playback_state["active"]
-            
-            if self.debug:
-                print(f"Обработка нажатия кнопки: {button_id}")
-                print(f"Текущий режим: {'АУДИОПЛЕЕР' if is_player_mode else 'МЕНЮ'}")
-                print(f"Запись активна: {is_recording}, Воспроизведение активно: {is_playing}")
+            logger.debug("Обработка нажатия кнопки: %s", button_id)
+            logger.debug("Текущий режим: %s", 'АУДИОПЛЕЕР' if is_player_mode else 'МЕНЮ')
+            logger.debug("Запись активна: %s, Воспроизведение активно: %s", is_recording, is_playing)
             
             # Проверяем, активен ли режим подтверждения удаления
             if self.playback_manager.is_delete_confirmation_active():
@@ -2256,20 +2571,18 @@ class MenuManager:
                 return True
             
             # В режиме аудиоплеера обрабатываем кнопки по-особому
-            elif self.player_mode_active:
+            elif is_player_mode:
                 # Обработка кнопок в режиме аудиоплеера
                 if button_id == "KEY_PAGEUP":
                     # Уменьшаем громкость
-                    if self.debug:
-                        print("Нажата клавиша PAGE_UP (уменьшение громкости)")
-                    self.playback_manager.adjust_volume(-10)
+                    logger.debug("Нажата клавиша PAGE_UP (уменьшение громкости)")
+                    self._adjust_volume(-10)
                     return True
                     
                 elif button_id == "KEY_PAGEDOWN":
                     # Увеличиваем громкость
-                    if self.debug:
-                        print("Нажата клавиша PAGE_DOWN (увеличение громкости)")
-                    self.playback_manager.adjust_volume(10)
+                    logger.debug("Нажата клавиша PAGE_DOWN (увеличение громкости)")
+                    self._adjust_volume(10)
                     return True
                     
                 elif button_id == "KEY_VOLUMEUP" or button_id == "KEY_VOLUMEDOWN" or button_id == "KEY_LEFT" or button_id == "KEY_RIGHT":
@@ -2284,8 +2597,7 @@ class MenuManager:
                         }
                         key_code = key_codes.get(button_id)
                         if key_code:
-                            if self.debug:
-                                print(f"Передача управления в PlaybackManager: {button_id}")
+                            logger.debug("Передача управления в PlaybackManager: %s", button_id)
                             self.playback_manager.handle_key_press(key_code, True)
                             return True
                     except Exception as e:
@@ -2302,8 +2614,7 @@ class MenuManager:
                 elif button_id == "KEY_BACK":
                     # Этот блок кода не должен выполняться из-за приоритетной обработки выше,
                     # но оставляем для надежности
-                    if self.debug:
-                        print("Вызов _stop_playback из стандартного обработчика KEY_BACK")
+                    logger.debug("Вызов _stop_playback из стандартного обработчика KEY_BACK")
                     self._stop_playback()
                     return True
                 
@@ -2381,16 +2692,14 @@ class MenuManager:
         try:
             # Проверяем, был ли уже озвучен уровень громкости
             if hasattr(self, '_volume_announced') and self._volume_announced:
-                if self.debug:
-                    print("Уровень громкости уже был озвучен")
+                logger.debug("Уровень громкости уже был озвучен")
                 return
             
             # Получаем текущую громкость из настроек
             volume = self.settings_manager.get_system_volume()
             level = (volume - 40) // 10  # Преобразуем проценты обратно в уровень
             
-            if self.debug:
-                print(f"Озвучивание текущего уровня громкости: {level} (соответствует {volume}%)")
+            logger.debug("Озвучивание текущего уровня громкости: %s (соответствует %s%%)", level, volume)
             
             # Озвучиваем текущий уровень громкости
             self.tts_manager.play_speech_blocking(f"Сейчас установлен уровень громкости {level}")
@@ -2413,19 +2722,17 @@ class MenuManager:
         try:
             # Если уровень не указан, запрашиваем его
             if level is None:
-                if self.debug:
-                    print("Запрос уровня громкости...")
+                logger.debug("Запрос уровня громкости...")
                 
                 # Получаем текущую громкость из настроек
                 current_volume = self.settings_manager.get_system_volume()
                 current_level = (current_volume - 40) // 10  # Преобразуем проценты обратно в уровень
                 
                 # Показываем текущую громкость
-                if self.debug:
-                    print(f"Текущий уровень громкости: {current_level} (соответствует {current_volume}%)")
+                logger.debug("Текущий уровень громкости: %s (соответствует %s%%)", current_level, current_volume)
                     
                 if self.tts_enabled:
-                    voice_id = self.settings_manager.get_voice()
+                    voice_id = self._current_voice
                     self.tts_manager.play_speech_blocking(f"Установлен уровень громкости {current_level}")
                 
                 # Запрашиваем новый уровень громкости
@@ -2524,6 +2831,10 @@ class MenuManager:
     
     def clear_screen(self):
         """Очищает экран консоли"""
+        # Выведенное DisplayManager меню стирается, его нужно будет перерисовать
+        if self.display_manager:
+            self.display_manager.invalidate()
+            
         try:
             # Для Windows
             if os.name == 'nt':
@@ -2532,8 +2843,7 @@ class MenuManager:
             else:
                 os.system('clear')
         except Exception as e:
-            if self.debug:
-                print(f"Ошибка при очистке экрана: {e}")
+            logger.debug("Ошибка при очистке экрана: %s", e)
             # Если не удалось очистить экран, печатаем пустые строки
             print("\n" * 100)
 
@@ -2566,60 +2876,51 @@ class MenuManager:
     # Удаляем дублирующий метод select() из этого места файла
     # Метод process_key_event будет использовать select_current_item() вместо него
 
-    def announce_current_menu_item(self):
-        """Озвучивает текущий выбранный пункт меню"""
+    def announce_current_menu_item(self, prefix=()):
+        """
+        Озвучивает текущий выбранный пункт меню
+        
+        Args:
+            prefix (tuple): Фразы, которые озвучиваются перед пунктом тем же запросом
+        """
         try:
             if not self.current_menu or not self.tts_enabled:
                 return
                 
             current_item = self.current_menu.get_current_item()
             if not current_item:
+                if prefix:
+                    self._submit_tts(tuple(prefix), self._current_voice)
                 return
                 
             # Получаем текст для озвучки
             item_speech_text = current_item.get_speech_text()
             
-            # Получаем текущий голос из настроек
-            voice_id = self.settings_manager.get_voice()
+            # Используем запомненный текущий голос, без обращения к настройкам
+            voice_id = self._current_voice
             
-            if self.debug:
-                print(f"Озвучиваем текущий пункт: {item_speech_text}, голос: {voice_id}")
+            logger.debug("Озвучиваем текущий пункт: %s, голос: %s", item_speech_text, voice_id)
             
             # Проверяем, является ли элемент папкой на флешке
             is_folder = hasattr(current_item, 'is_folder') and callable(current_item.is_folder) and current_item.is_folder()
             
             # Проверяем, является ли элемент папкой диктофона (A, B, C)
-            is_recorder_folder = item_speech_text in ["Папка A", "Папка B", "Папка C"]
+            is_recorder_folder = item_speech_text in _RECORDER_FOLDER_TEXTS
             
             if is_folder or is_recorder_folder:
-                # Если это папка, сначала озвучиваем слово "Папка"
-                if hasattr(self.tts_manager, 'play_speech_blocking'):
-                    self.tts_manager.play_speech_blocking("Папка", voice_id=voice_id)
-                else:
-                    self.tts_manager.play_speech("Папка", voice_id=voice_id)
-                    time.sleep(0.5)  # Более длинная пауза для гарантированного воспроизведения
-                
-                time.sleep(0.1)  # Небольшая пауза между сообщениями
-                
-                # Затем озвучиваем имя папки
+                # Если это папка, сначала озвучиваем слово "Папка", затем ее имя
                 folder_name = item_speech_text
                 if is_recorder_folder:
                     # Для папок диктофона извлекаем только букву (A, B, C)
                     folder_name = item_speech_text[-1]  # Последний символ - буква папки
-                
-                # Озвучиваем имя папки
-                if hasattr(self.tts_manager, 'play_speech_blocking'):
-                    self.tts_manager.play_speech_blocking(folder_name, voice_id=voice_id)
-                else:
-                    self.tts_manager.play_speech(folder_name, voice_id=voice_id)
-                    time.sleep(0.5)  # Пауза для гарантированного воспроизведения
+                phrases = ["Папка", folder_name]
             else:
                 # Обычное озвучивание для не-папок
-                self.tts_manager.play_speech(item_speech_text, voice_id=voice_id)
+                phrases = [item_speech_text]
             
             # Для пунктов меню папок диктофона (A, B, C) озвучиваем количество файлов
             # Для папок на флешке (is_folder) НЕ озвучиваем количество файлов
-            if not is_folder and (is_recorder_folder or item_speech_text in ["A", "B", "C"]) and hasattr(self, 'playback_manager'):
+            if not is_folder and (is_recorder_folder or item_speech_text in _FOLDERS) and hasattr(self, 'playback_manager'):
                 # Определяем букву папки
                 if is_recorder_folder:
                     folder_letter = item_speech_text[-1]  # Последний символ в "Папка X"
@@ -2630,16 +2931,10 @@ class MenuManager:
                 files_count = self.playback_manager.count_files_in_folder(folder_letter)
                 
                 # Формируем текст о количестве файлов
-                files_text = f"{files_count} {self._get_files_word(files_count)}"
-                
-                # Озвучиваем с небольшой паузой
-                time.sleep(0.2)  # Пауза между сообщениями
-                
-                if hasattr(self.tts_manager, 'play_speech_blocking'):
-                    self.tts_manager.play_speech_blocking(files_text, voice_id=voice_id)
-                else:
-                    self.tts_manager.play_speech(files_text, voice_id=voice_id)
-                    time.sleep(1.0)  # Более длинная пауза для гарантированного воспроизведения
+                phrases.append(f"{files_count} {self._get_files_word(files_count)}")
+            
+            # Озвучиваем в потоке озвучки, не задерживая навигацию
+            self._submit_tts(tuple(prefix) + tuple(phrases), voice_id)
                 
         except Exception as e:
             error_msg = f"Ошибка при озвучивании пункта меню: {e}"
@@ -2660,121 +2955,8 @@ class MenuManager:
         if voices is None:
             voices = list(self.settings_manager.get_available_voices().keys())
         
-        # Собираем все тексты для озвучки
-        speech_texts = set()
-        
-        def collect_speech_texts(menu):
-            # Добавляем только тексты пунктов меню, не озвучиваем название самого меню
-            for item in menu.items:
-                speech_texts.add(item.get_speech_text())
-                if isinstance(item, SubMenu):
-                    collect_speech_texts(item)
-        
-        # Начинаем с корневого меню
-        collect_speech_texts(self.root_menu)
-        
-        # Добавляем системные сообщения для возврата
-        speech_texts.add("Возврат в")
-        speech_texts.add("главное меню")
-        speech_texts.add("предыдущее меню")
-        speech_texts.add("Голос успешно изменен")
-        
-        # Добавляем сообщения для диктофона
-        speech_texts.add("Запись началась")
-        speech_texts.add("Запись приостановлена")
-        speech_texts.add("Запись возобновлена")
-        speech_texts.add("Запись остановлена")
-        speech_texts.add("Запись сохранена в папку")  # Первая часть сообщения
-        speech_texts.add("Запись отменена")
-        speech_texts.add("Выберите папку для записи")
-        speech_texts.add("Папка A")
-        speech_texts.add("Папка B")
-        speech_texts.add("Папка C")
-        
-        # Добавляем сообщения для массового удаления записей
-        speech_texts.add("Массовое удаление записей")
-        speech_texts.add("Удалить записи из всех папок")
-        speech_texts.add("Вы действительно хотите удалить все записи из папки")
-        speech_texts.add("Вы точно хотите удалить все записи из всех папок")
-        speech_texts.add("Финальное подтверждение удаления всех записей")
-        speech_texts.add("Количество записей")
-        speech_texts.add("В папке нет записей")
-        speech_texts.add("Нет записей во всех папках")
-        speech_texts.add("Ошибка при удалении записей из папки")
-        speech_texts.add("Ошибка при удалении записей из всех папок")
-        speech_texts.add("запись")
-        speech_texts.add("записи")
-        speech_texts.add("записей")
-        
-        # Добавляем сообщения для информации о файлах в папках
-        speech_texts.add("В папке")  # Первая часть сообщения
-        speech_texts.add("нет записей")  # Третья часть сообщения
-        
-        # Добавляем слова для формирования сообщений о количестве файлов
-        for count in range(0, 100):  # Поддержка до 99 файлов
-            speech_texts.add(str(count))
-        speech_texts.add("файл")
-        speech_texts.add("файла")
-        speech_texts.add("файлов")
-        
-        # Добавляем слово "Папка" для навигации по файлам на флешке
-        speech_texts.add("Папка")
-        
-        # Добавляем сообщения для воспроизведения
-        speech_texts.add("Воспроизведение")
-        speech_texts.add("Пауза")
-        speech_texts.add("Прослушано")
-        speech_texts.add("Переключаю вперед на запись")
-        speech_texts.add("Переключаю назад на запись")
-        speech_texts.add("Ошибка при переключении трека")
-        speech_texts.add("Запись успешно удалена")
-        speech_texts.add("Ошибка при удалении записи")
-        
-        # Добавляем сообщения для удаления файлов
-        speech_texts.add("Вы точно хотите удалить эту запись")
-        speech_texts.add("Запись успешно удалена")
-        speech_texts.add("Ошибка при удалении записи")
-        
-        # Добавляем сообщения для внешнего носителя
-        speech_texts.add("Недостаточно места на флешке")
-        speech_texts.add("Копирование успешно завершено")
-        speech_texts.add("Возврат в режим внешнего носителя")
-        speech_texts.add("Произошла ошибка при копировании файлов")
-        speech_texts.add("Флешка была отключена")
-        speech_texts.add("Директория с записями не найдена")
-        speech_texts.add("Скопировать все аудиозаписи из всех папок")
-        speech_texts.add("Скопировать все аудиозаписи из папки")
-        
-        # Добавляем сообщения для настроек громкости (теперь отдельно)
-        speech_texts.add("Установлен уровень громкости")
-        speech_texts.add("Уровень громкости")
-        speech_texts.add("Сейчас установлен уровень громкости")
-        
-        # Добавляем числовые значения для уровней громкости
-        for level in range(0, 7):
-            speech_texts.add(f"{level}")
-        
-        # Попытка добавить имена записей диктофона из папок A, B, C
-        try:
-            # Путь к папке с записями
-            records_dir = self.records_dir
-            if os.path.exists(records_dir):
-                # Папки для диктофона
-                folders = ["A", "B", "C"]
-                for folder in folders:
-                    folder_path = os.path.join(records_dir, folder)
-                    if os.path.exists(folder_path):
-                        # Получаем список файлов в папке
-                        files = [f for f in os.listdir(folder_path) if f.endswith(('.wav', '.mp3'))]
-                        for file in files:
-                            file_path = os.path.join(folder_path, file)
-                            # Получаем человекочитаемое название файла
-                            if hasattr(self, 'playback_manager') and self.playback_manager:
-                                readable_name = self.playback_manager.get_human_readable_filename(file_path)
-                                speech_texts.add(readable_name)
-        except Exception as e:
-            print(f"Ошибка при получении имен файлов из папок диктофона: {e}")
-            sentry_sdk.capture_exception(e)
+        # Тексты пунктов меню, системных сообщений и имена записей диктофона
+        speech_texts = self._collect_speech_texts()
         
         # Предварительно генерируем только отсутствующие звуки для всех голосов
         self.tts_manager.pre_generate_missing_menu_items(speech_texts, voices=voices)
\ No newline at end of file
@@ -3,6 +3,7 @@ import sentry_sdk
 import subprocess
 import threading
 import time
+from functools import partial
 from .menu_item import MenuItem, SubMenu
 from .event_bus import EventBus, EVENT_USB_MIC_DISCONNECTED, EVENT_RECORDING_SAVED
 
@@ -284,10 +285,6 @@ class MicrophoneSelector:
             
             # Добавляем пункты меню для каждого типа микрофона
             for mic_id, mic_desc in self.get_available_microphones().items():
-                # Создаем обертку для избежания проблем с lambda в цикле
-                def create_microphone_action(mic_id=mic_id):
-                    return lambda: self.change_microphone(mic_id)
-                
                 # Добавляем индикатор текущего выбора
                 display_name = f"{mic_desc}"
                 if mic_id == current_microphone:
@@ -295,7 +292,7 @@ class MicrophoneSelector:
                 
                 self.microphone_menu.add_item(MenuItem(
                     display_name,
-                    create_microphone_action()
+                    partial(self.change_microphone, mic_id)
                 ))
             
             if self.debug:
@@ -222,8 +222,20 @@ class PlaybackManager:
         if not self.files_list or self.current_index < 0 or self.current_index >= len(self.files_list):
             return None
         
-        file_path = self.files_list[self.current_index]
+        return self._build_file_info(self.files_list[self.current_index], load_into_player=True)
+    
+    def _build_file_info(self, file_path, load_into_player):
+        """
+        Собирает информацию о файле по его пути
         
+        Args:
+            file_path (str): Путь к файлу
+            load_into_player (bool): Загрузить файл в плеер, чтобы узнать длительность;
+                иначе длительность известна, только если файл уже загружен
+            
+        Returns:
+            dict: Информация о файле
+        """
         # Получаем метаданные файла
         file_name = os.path.basename(file_path)
         file_size = os.path.getsize(file_path)
@@ -233,9 +245,10 @@ class PlaybackManager:
         # Определяем длительность
         duration = 0
         try:
-            if self.player.file_path != file_path:
+            if self.player.file_path != file_path and load_into_player:
                 self.player.load_file(file_path)
-            duration = self.player.get_duration()
+            if self.player.file_path == file_path:
+                duration = self.player.get_duration()
         except:
             pass
         
@@ -269,6 +282,9 @@ class PlaybackManager:
         """
         Возвращает информацию о файле по индексу
         
+        Не меняет текущий индекс и не загружает файл в плеер,
+        поэтому длительность известна только для уже загруженного файла
+        
         Args:
             index (int): Индекс файла в списке
             
@@ -281,25 +297,29 @@ class PlaybackManager:
                     print(f"Индекс файла за пределами диапазона: {index}, доступно {len(self.files_list)} файлов")
                 return None
                 
-            # Сохраняем текущий индекс
-            current_index_backup = self.current_index
-            
-            # Временно устанавливаем индекс для получения информации
-            self.current_index = index
-            
-            # Получаем информацию о файле
-            file_info = self.get_current_file_info()
-            
-            # Восстанавливаем текущий индекс
-            self.current_index = current_index_backup
-            
-            return file_info
+            return self._build_file_info(self.files_list[index], load_into_player=False)
         except Exception as e:
             error_msg = f"Ошибка при получении информации о файле с индексом {index}: {e}"
             print(error_msg)
             sentry_sdk.capture_exception(e)
             return None
     
+    def get_file_descriptions(self, file_paths):
+        """
+        Возвращает человекочитаемые названия файлов за один проход
+        
+        В отличие от get_file_info, не меняет текущий индекс и не загружает
+        файлы в плеер для определения длительности
+        
+        Args:
+            file_paths (list): Пути к файлам
+            
+        Returns:
+            list: Названия файлов в том же порядке
+        """
+        get_name = self.get_human_readable_filename
+        return [get_name(file_path) for file_path in file_paths]
+    
     def get_human_readable_filename(self, file_path):
         """
         Возвращает человекочитаемое название файла
@@ -449,6 +469,18 @@ class PlaybackManager:
         
         return False
     
+    def play_file(self, index):
+        """
+        Делает файл с указанным индексом текущим и начинает его воспроизведение
+        
+        Args:
+            index (int): Индекс файла в списке
+            
+        Returns:
+            bool: True если воспроизведение начато, иначе False
+        """
+        return self.set_current_file(index) and self.play_current_file()
+    
     def play_current_file(self):
         """
         Начинает воспроизведение текущего файла
@@ -721,14 +753,14 @@ class PlaybackManager:
         Останавливает воспроизведение текущего аудиофайла
         
         Returns:
-            bool: True если воспроизведение успешно остановлено
+            bool: True если плеер подтвердил остановку воспроизведения
         """
         try:
             if self.debug:
                 print("\n*** ОСТАНОВКА ВОСПРОИЗВЕДЕНИЯ В PLAYBACK_MANAGER ***")
                 
             # Останавливаем воспроизведение
-            self.player.stop()
+            stopped = self.player.stop()
             
             # Обновляем информацию
             self.playback_info["active"] = False
@@ -743,7 +775,7 @@ class PlaybackManager:
             if self.debug:
                 print("Воспроизведение успешно остановлено")
                 
-            return True
+            return stopped
         except Exception as e:
             error_msg = f"Ошибка при остановке воспроизведения: {e}"
             print(error_msg)
@@ -1258,12 +1290,13 @@ class PlaybackManager:
                 
                 # Озвучиваем результат
                 voice_id = "ru-RU-Standard-D"
-                # Используем блокирующий вызов и добавляем паузу, чтобы сообщение гарантированно прозвучало
+                # Используем блокирующий вызов, чтобы сообщение гарантированно прозвучало
                 if hasattr(self.tts_manager, 'play_speech_blocking'):
                     self.tts_manager.play_speech_blocking("Запись успешно удалена", voice_id=voice_id)
                 else:
                     self.tts_manager.play_speech("Запись успешно удалена", voice_id=voice_id)
-                    time.sleep(1.5)  # Достаточная пауза для воспроизведения сообщения
+                    # Ждем окончания фразы, а не фиксированную паузу
+                    self.tts_manager.wait_for_speech(2.0)
 
                 # Добавляем задержку перед возвратом в меню
                 time.sleep(0.5)
@@ -7,6 +7,7 @@ import glob
 import logging
 import sentry_sdk
 import time
+from functools import partial
 from .menu_item import MenuItem, SubMenu
 
 # Настройка логирования
@@ -125,7 +126,7 @@ class StationSubMenu(SubMenu):
             
             # Проверяем существование директории
             if not self.directory:
-                self.add_item(MenuItem("Путь к папке станции не указан", lambda: None))
+                self.add_item(MenuItem("Путь к папке станции не указан"))
                 logger.warning(f"Путь к директории станции не указан для {self.name}")
                 return
                 
@@ -134,30 +135,26 @@ class StationSubMenu(SubMenu):
                 try:
                     logger.info(f"Создаем директорию для станции {self.name}: {self.directory}")
                     os.makedirs(self.directory, exist_ok=True)
-                    self.add_item(MenuItem("Папка создана. Добавьте аудиофайлы и вернитесь в меню", lambda: None))
+                    self.add_item(MenuItem("Папка создана. Добавьте аудиофайлы и вернитесь в меню"))
                     return
                 except Exception as dir_error:
                     logger.error(f"Ошибка при создании директории {self.directory}: {dir_error}")
                     sentry_sdk.capture_exception(dir_error)
-                    self.add_item(MenuItem(f"Ошибка создания папки: {str(dir_error)}", lambda: None))
+                    self.add_item(MenuItem(f"Ошибка создания папки: {str(dir_error)}"))
                     return
             
             # Получаем список аудиофайлов
             audio_files = self._get_audio_files(self.directory)
             
             if not audio_files:
-                self.add_item(MenuItem("В папке нет аудиофайлов", lambda: None))
+                self.add_item(MenuItem("В папке нет аудиофайлов"))
                 logger.info(f"Нет аудиофайлов в директории: {self.directory}")
                 return
             
-            # Добавляем файлы в меню
+            # Добавляем файлы в меню, действие привязывает путь к файлу через partial
             for file_path in audio_files:
                 file_name = os.path.basename(file_path)
-                # Создаем обертку для каждого файла, чтобы избежать проблем с lambda в цикле
-                def create_play_action(path=file_path):
-                    return lambda: self._play_audio_file(path)
-                
-                self.add_item(MenuItem(file_name, create_play_action()))
+                self.add_item(MenuItem(file_name, partial(self._play_audio_file, file_path)))
             
             logger.info(f"Загружено {len(audio_files)} аудиофайлов для станции {self.name}")
         except Exception as e:
@@ -165,7 +162,7 @@ class StationSubMenu(SubMenu):
             sentry_sdk.capture_exception(e)
             # Добавляем сообщение об ошибке
             self.items = []
-            self.add_item(MenuItem(f"Ошибка загрузки файлов: {str(e)}", lambda: None))
+            self.add_item(MenuItem(f"Ошибка загрузки файлов: {str(e)}"))
     
     def _get_audio_files(self, directory):
         """
@@ -36,6 +36,16 @@ class RecorderManager:
         # Текущее время записи
         self.current_time = 0
         
+        # Последний снимок состояния записи для интерфейса (см. _publish_snapshot).
+        # Снимок заменяется целиком, поэтому читается без блокировок
+        self.snapshot = {
+            "active": False,
+            "paused": False,
+            "folder": None,
+            "elapsed_time": 0,
+            "formatted_time": "00:00:00"
+        }
+        
         # Создаем директории для записей, если их нет
         self._create_directories()
         
@@ -96,6 +106,16 @@ class RecorderManager:
         """
         self.update_callback = callback
     
+    def _publish_snapshot(self):
+        """Собирает снимок состояния записи один раз для всех читателей"""
+        self.snapshot = {
+            "active": self.recorder.is_active(),
+            "paused": self.recorder.is_on_pause(),
+            "folder": self.recorder.get_current_folder(),
+            "elapsed_time": self.current_time,
+            "formatted_time": self.get_formatted_time()
+        }
+    
     def _timer_callback(self, time_sec):
         """
         Обработчик обновления таймера записи
@@ -106,8 +126,8 @@ class RecorderManager:
         try:
             self.current_time = time_sec
             
-            # Форматируем время в удобный вид (MM:SS)
-            formatted_time = self.get_formatted_time()
+            # Публикуем снимок состояния (с отформатированным временем) для интерфейса
+            self._publish_snapshot()
             
             # Вызываем колбэк обновления UI, если он установлен
             if self.update_callback:
@@ -239,6 +259,7 @@ class RecorderManager:
                     print("Запись успешно начата")
                     
                 # Обновляем интерфейс
+                self._publish_snapshot()
                 if self.update_callback:
                     try:
                         self.update_callback()
@@ -356,6 +377,7 @@ class RecorderManager:
                         sentry_sdk.capture_exception(tts_error)
                 
                 # Обновляем интерфейс
+                self._publish_snapshot()
                 if self.update_callback:
                     try:
                         self.update_callback()
@@ -448,6 +470,7 @@ class RecorderManager:
             
             if result:
                 # Обновляем интерфейс
+                self._publish_snapshot()
                 if self.update_callback:
                     try:
                         self.update_callback()
@@ -534,6 +557,7 @@ class RecorderManager:
                     sentry_sdk.capture_exception(e)
                 
                 # Обновляем интерфейс
+                self._publish_snapshot()
                 if self.update_callback:
                     try:
                         self.update_callback()
@@ -587,6 +611,7 @@ class RecorderManager:
         if result:
             self.tts_manager.play_speech("Запись отменена")
             
+            self._publish_snapshot()
             if self.update_callback:
                 self.update_callback()
                 
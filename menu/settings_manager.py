@@ -27,6 +27,16 @@ class SettingsManager:
                 "microphone": "built_in"  # Добавляем настройку микрофона по умолчанию
             }
             
+            # Доступные голоса {id: описание} и обратный словарь {описание: id}
+            self.voices_by_id = {
+                "ru-RU-Standard-A": "Женский голос 1",
+                "ru-RU-Standard-B": "Мужской голос 1",
+                "ru-RU-Standard-C": "Женский голос 2",
+                "ru-RU-Standard-D": "Мужской голос 2",
+                "ru-RU-Standard-E": "Женский голос 3"
+            }
+            self.voices_by_desc = {description: voice_id for voice_id, description in self.voices_by_id.items()}
+            
             # Создаем директорию для файла настроек, если её нет
             os.makedirs(os.path.dirname(os.path.abspath(settings_file)), exist_ok=True)
             
@@ -246,13 +256,7 @@ class SettingsManager:
         Returns:
             dict: Словарь доступных голосов {id: описание}
         """
-        return {
-            "ru-RU-Standard-A": "Женский голос 1",
-            "ru-RU-Standard-B": "Мужской голос 1",
-            "ru-RU-Standard-C": "Женский голос 2",
-            "ru-RU-Standard-D": "Мужской голос 2",
-            "ru-RU-Standard-E": "Женский голос 3"
-        }
+        return dict(self.voices_by_id)
 
     def get_system_volume(self):
         """
@@ -1,10 +1,12 @@
 #!/usr/bin/env python3
 import os
+import re
 import time
 import hashlib
 import threading
 import subprocess
 import json
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from gtts import gTTS
 import importlib.util
@@ -19,6 +21,12 @@ class TTSManager:
     # Лимит бесплатных запросов в день (приблизительная оценка)
     FREE_DAILY_LIMIT = 200
     
+    # Количество потоков для предварительной генерации озвучки
+    PRE_GENERATE_WORKERS = 4
+    
+    # Граница предложений для поочередной озвучки длинных сообщений
+    SENTENCE_SPLIT = re.compile(r'(?<=[.!?])\s+')
+    
     def __init__(self, cache_dir="/home/aleks/cache_tts", lang="ru", tld="com", debug=False, use_wav=True, 
                  voice="ru-RU-Standard-A", settings_manager=None):
         """
@@ -38,7 +46,18 @@ class TTSManager:
         self.tld = tld
         self.current_sound_process = None
         self.is_playing = False
+        # Событие окончания текущей фразы (установлено, когда ничего не звучит)
+        self.speech_done = threading.Event()
+        self.speech_done.set()
+        # Защищает процесс озвучки и событие окончания фразы: play_speech и
+        # stop_current_sound вызываются из разных потоков меню
+        self._sound_lock = threading.Lock()
+        # Растет при каждом запуске фразы и каждой остановке извне (под _sound_lock):
+        # по нему play_speech_blocking узнает, что его сообщение прервали
+        self._speech_serial = 0
         self.cache_lock = threading.Lock()
+        # Блокировки отдельных файлов кэша: одну фразу одновременно генерирует только один поток
+        self._key_locks = {}
         self.debug = debug
         self.use_wav = use_wav
         self.settings_manager = settings_manager
@@ -319,8 +338,10 @@ class TTSManager:
     def _save_stats(self):
         """Сохраняет статистику в файл"""
         try:
-            with open(self.stats_file, 'w') as f:
-                json.dump(self.stats, f, indent=2)
+            # Статистика может сохраняться из нескольких потоков предварительной генерации
+            with self.cache_lock:
+                with open(self.stats_file, 'w') as f:
+                    json.dump(self.stats, f, indent=2)
         except Exception as e:
             error_msg = f"Ошибка при сохранении статистики: {e}"
             if self.debug:
@@ -390,8 +411,9 @@ class TTSManager:
             if voice is None:
                 voice = self.voice
                 
-            # Хэшируем текст для создания имени файла
-            text_hash = hashlib.md5(text.encode('utf-8')).hexdigest()
+            # Ключ кэша - SHA-256 от голоса и нормализованного текста,
+            # одинаковые фразы из разных меню используют один файл
+            text_hash = hashlib.sha256(f"{voice}|{self._normalize_text(text)}".encode('utf-8')).hexdigest()
             
             # Добавляем идентификатор голоса к имени файла
             filename = f"{voice}_{text_hash}"
@@ -410,6 +432,124 @@ class TTSManager:
             # Возвращаем стандартный путь в случае ошибки
             return os.path.join(self.cache_dir, f"error_{hashlib.md5(text.encode('utf-8')).hexdigest()}.mp3")
     
+    @staticmethod
+    def _normalize_text(text):
+        """Приводит текст к единому виду для ключа кэша (убирает лишние пробелы)"""
+        return " ".join(text.split())
+    
+    def _migrate_legacy_cache(self, text, voice):
+        """
+        Переименовывает файлы кэша, созданные со старым ключом (MD5 от текста)
+        
+        Args:
+            text (str): Текст для озвучки
+            voice (str): Идентификатор голоса
+            
+        Returns:
+            bool: True, если был перенесен хотя бы один файл
+        """
+        migrated = False
+        legacy_hash = hashlib.md5(text.encode('utf-8')).hexdigest()
+        
+        for use_wav in (False, True):
+            ext = "wav" if use_wav else "mp3"
+            legacy_file = os.path.join(self.cache_dir, f"{voice}_{legacy_hash}.{ext}")
+            if not os.path.exists(legacy_file):
+                continue
+                
+            try:
+                os.replace(legacy_file, self.get_cached_filename(text, use_wav=use_wav, voice=voice))
+                migrated = True
+            except OSError as e:
+                error_msg = f"Ошибка при переносе файла кэша {legacy_file}: {e}"
+                print(f"[TTS CACHE ERROR] {error_msg}")
+                sentry_sdk.capture_exception(e)
+                
+        return migrated
+    
+    def cached_keys(self, voice=None, use_wav=None):
+        """
+        Возвращает имена (без расширения) уже сгенерированных файлов для голоса
+        
+        Args:
+            voice (str, optional): Идентификатор голоса
+            use_wav (bool, optional): Искать WAV вместо MP3
+            
+        Returns:
+            set: Множество имен файлов в кэше
+        """
+        if use_wav is None:
+            use_wav = self.use_wav
+            
+        if voice is None:
+            voice = self.voice
+            
+        ext = ".wav" if use_wav else ".mp3"
+        prefix = f"{voice}_"
+        
+        try:
+            return {
+                name[:-len(ext)]
+                for name in os.listdir(self.cache_dir)
+                if name.startswith(prefix) and name.endswith(ext)
+            }
+        except OSError as e:
+            error_msg = f"Ошибка при чтении каталога кэша: {e}"
+            print(f"[TTS CACHE ERROR] {error_msg}")
+            sentry_sdk.capture_exception(e)
+            return set()
+    
+    def cache_exists(self, text, voice=None):
+        """
+        Проверяет, есть ли уже в кэше озвучка текста для голоса
+        
+        Args:
+            text (str): Текст для озвучки
+            voice (str, optional): Идентификатор голоса
+            
+        Returns:
+            bool: True, если файл уже сгенерирован
+        """
+        if voice is None:
+            voice = self.voice
+            
+        # Google Cloud TTS хранит файлы под своими именами
+        if self.tts_engine == "google_cloud" and self.google_tts_manager:
+            file_path = self.google_tts_manager.get_cached_filename(text, use_wav=self.use_wav, voice=voice)
+        else:
+            file_path = self.get_cached_filename(text, use_wav=self.use_wav, voice=voice)
+            
+        return os.path.exists(file_path)
+    
+    def _key_lock(self, key):
+        """
+        Возвращает блокировку для файла кэша
+        
+        Args:
+            key (str): Путь к файлу кэша
+            
+        Returns:
+            threading.Lock: Блокировка, общая для всех потоков, работающих с этим файлом
+        """
+        with self.cache_lock:
+            lock = self._key_locks.get(key)
+            if lock is None:
+                lock = self._key_locks[key] = threading.Lock()
+            return lock
+    
+    def _remove_tmp(self, tmp_file):
+        """
+        Удаляет временный файл, оставшийся после неудачной записи
+        
+        Args:
+            tmp_file (str): Путь к временному файлу
+        """
+        try:
+            if os.path.exists(tmp_file):
+                os.remove(tmp_file)
+        except OSError as e:
+            print(f"Не удалось удалить временный файл {tmp_file}: {e}")
+    
     def mp3_to_wav(self, mp3_file):
         """
         Конвертирует MP3 в WAV
@@ -426,6 +566,9 @@ class TTSManager:
         if os.path.exists(wav_file):
             return wav_file
             
+        # Конвертируем во временный файл и переименовываем его целиком,
+        # чтобы плеер никогда не открыл недописанный WAV
+        tmp_file = wav_file + ".tmp"
         try:
             # Проверяем, установлен ли ffmpeg
             if self.debug:
@@ -433,14 +576,16 @@ class TTSManager:
                 
             # Используем mpg123 для конвертации, так как он скорее всего установлен
             subprocess.run(
-                ["mpg123", "-w", wav_file, mp3_file],
+                ["mpg123", "-w", tmp_file, mp3_file],
                 stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
                 check=True
             )
+            os.replace(tmp_file, wav_file)
             
             return wav_file
         except subprocess.CalledProcessError as e:
             print(f"Ошибка при конвертации MP3 в WAV: {e}")
+            self._remove_tmp(tmp_file)
             return None
         except FileNotFoundError:
             print("mpg123 не найден, конвертация невозможна")
@@ -469,98 +614,115 @@ class TTSManager:
             mp3_file = self.get_cached_filename(text, use_wav=False, voice=voice)
             wav_file = self.get_cached_filename(text, use_wav=True, voice=voice)
             
-            # Проверяем наличие файлов
-            mp3_exists = os.path.exists(mp3_file)
-            wav_exists = os.path.exists(wav_file)
-            
-            # Если нужен WAV и он уже есть, возвращаем его
-            if self.use_wav and wav_exists and not force_regenerate:
-                # Увеличиваем счётчик использования кэша
-                self.stats["cached_used"] += 1
-                self._save_stats()
+            # Одну и ту же фразу генерирует только один поток: остальные дожидаются
+            # его и берут готовый файл из кэша вместо повторной генерации
+            with self._key_lock(mp3_file):
+                # Проверяем наличие файлов
+                mp3_exists = os.path.exists(mp3_file)
+                wav_exists = os.path.exists(wav_file)
                 
-                if self.debug:
-                    print(f"Использован кэш для: {text} (голос: {voice})")
-                    
-                return wav_file
-            
-            # Если нужен MP3 и он уже есть, возвращаем его
-            if not self.use_wav and mp3_exists and not force_regenerate:
-                # Увеличиваем счётчик использования кэша
-                self.stats["cached_used"] += 1
-                self._save_stats()
+                # Файлы могли остаться в кэше под старыми именами
+                if not mp3_exists and not wav_exists and self._migrate_legacy_cache(text, voice):
+                    mp3_exists = os.path.exists(mp3_file)
+                    wav_exists = os.path.exists(wav_file)
                 
-                if self.debug:
-                    print(f"Использован кэш для: {text} (голос: {voice})")
+                # Если нужен WAV и он уже есть, возвращаем его
+                if self.use_wav and wav_exists and not force_regenerate:
+                    # Увеличиваем счётчик использования кэша
+                    self.stats["cached_used"] += 1
+                    self._save_stats()
                     
-                return mp3_file
-            
-            # Если нужен WAV, но есть только MP3 и не нужно пересоздавать
-            if self.use_wav and mp3_exists and not force_regenerate:
-                # Конвертируем MP3 в WAV
-                wav_result = self.mp3_to_wav(mp3_file)
-                if wav_result:
+                    if self.debug:
+                        print(f"Использован кэш для: {text} (голос: {voice})")
+                    
+                    return wav_file
+                
+                # Если нужен MP3 и он уже есть, возвращаем его
+                if not self.use_wav and mp3_exists and not force_regenerate:
                     # Увеличиваем счётчик использования кэша
                     self.stats["cached_used"] += 1
                     self._save_stats()
                     
                     if self.debug:
-                        print(f"Использован кэш (конвертация в WAV) для: {text} (голос: {voice})")
-                        
-                    return wav_result
-            
-            # Если нужно сгенерировать файл и мы используем Google Cloud TTS
-            if self.tts_engine == "google_cloud" and self.google_tts_manager:
-                return self.google_tts_manager.generate_speech(text, force_regenerate, voice)
-            
-            if self.debug:
-                print(f"[TTS] Генерация озвучки с помощью gTTS для: {text} (голос: {voice})")
+                        print(f"Использован кэш для: {text} (голос: {voice})")
+                    
+                    return mp3_file
                 
-            # Увеличиваем счетчики запросов
-            self.stats["total_requests"] += 1
-            self.stats["today_requests"] += 1
-            
-            # Замеряем время запроса
-            start_time = time.time()
-            
-            try:
-                # Создаем объект gTTS и сохраняем в MP3-файл
-                # Обратите внимание, что gTTS не поддерживает выбор конкретного голоса напрямую,
-                # но мы все равно храним разные файлы для разных голосов
-                tts = gTTS(text=text, lang=self.lang, tld=self.tld, slow=False)
-                tts.save(mp3_file)
-                
-                # Если нужен WAV, конвертируем MP3 в WAV
-                result_file = mp3_file
-                if self.use_wav:
+                # Если нужен WAV, но есть только MP3 и не нужно пересоздавать
+                if self.use_wav and mp3_exists and not force_regenerate:
+                    # Конвертируем MP3 в WAV
                     wav_result = self.mp3_to_wav(mp3_file)
                     if wav_result:
-                        result_file = wav_result
-                
-                # Вычисляем время выполнения
-                elapsed_time = time.time() - start_time
-                
-                # Записываем в историю
-                self.stats["requests_history"].append({
-                    "text": text,
-                    "time": elapsed_time,
-                    "date": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                    "voice": voice
-                })
-                
-                # Ограничиваем историю до 100 последних запросов
-                if len(self.stats["requests_history"]) > 100:
-                    self.stats["requests_history"] = self.stats["requests_history"][-100:]
-                    
-                # Сохраняем статистику
-                self._save_stats()
+                        # Увеличиваем счётчик использования кэша
+                        self.stats["cached_used"] += 1
+                        self._save_stats()
+                        
+                        if self.debug:
+                            print(f"Использован кэш (конвертация в WAV) для: {text} (голос: {voice})")
+                        
+                        return wav_result
                 
-                return result_file
-            except Exception as e:
-                error_msg = f"Ошибка при генерации озвучки: {e}"
-                print(f"[TTS ERROR] {error_msg}")
-                sentry_sdk.capture_exception(e)
-                return None
+                # Если нужно сгенерировать файл и мы используем Google Cloud TTS
+                if self.tts_engine == "google_cloud" and self.google_tts_manager:
+                    return self.google_tts_manager.generate_speech(text, force_regenerate, voice)
+                
+                if self.debug:
+                    print(f"[TTS] Генерация озвучки с помощью gTTS для: {text} (голос: {voice})")
+                
+                # Увеличиваем счетчики запросов
+                self.stats["total_requests"] += 1
+                self.stats["today_requests"] += 1
+                
+                # Замеряем время запроса
+                start_time = time.time()
+                
+                try:
+                    # Создаем объект gTTS и сохраняем в MP3-файл
+                    # Обратите внимание, что gTTS не поддерживает выбор конкретного голоса напрямую,
+                    # но мы все равно храним разные файлы для разных голосов
+                    tts = gTTS(text=text, lang=self.lang, tld=self.tld, slow=False)
+                    
+                    # Сохраняем во временный файл и переименовываем его целиком,
+                    # чтобы плеер никогда не открыл недописанный MP3
+                    tmp_file = mp3_file + ".tmp"
+                    try:
+                        tts.save(tmp_file)
+                        os.replace(tmp_file, mp3_file)
+                    except Exception:
+                        self._remove_tmp(tmp_file)
+                        raise
+                    
+                    # Если нужен WAV, конвертируем MP3 в WAV
+                    result_file = mp3_file
+                    if self.use_wav:
+                        wav_result = self.mp3_to_wav(mp3_file)
+                        if wav_result:
+                            result_file = wav_result
+                    
+                    # Вычисляем время выполнения
+                    elapsed_time = time.time() - start_time
+                    
+                    # Записываем в историю
+                    self.stats["requests_history"].append({
+                        "text": text,
+                        "time": elapsed_time,
+                        "date": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                        "voice": voice
+                    })
+                    
+                    # Ограничиваем историю до 100 последних запросов
+                    if len(self.stats["requests_history"]) > 100:
+                        self.stats["requests_history"] = self.stats["requests_history"][-100:]
+                    
+                    # Сохраняем статистику
+                    self._save_stats()
+                    
+                    return result_file
+                except Exception as e:
+                    error_msg = f"Ошибка при генерации озвучки: {e}"
+                    print(f"[TTS ERROR] {error_msg}")
+                    sentry_sdk.capture_exception(e)
+                    return None
         except Exception as e:
             error_msg = f"Ошибка при генерации речи: {e}"
             print(f"[TTS CRITICAL ERROR] {error_msg}")
@@ -591,8 +753,10 @@ class TTSManager:
             if voice_id is None:
                 voice_id = self.voice
             
-            # Если уже что-то воспроизводится, останавливаем
-            self.stop_current_sound()
+            # Если уже что-то воспроизводится, останавливаем. Это не остановка извне,
+            # поэтому _speech_serial увеличит только запуск новой фразы
+            with self._sound_lock:
+                self._stop_process_locked()
             
             # Генерируем озвучку
             audio_file = self.generate_speech(text, force_regenerate=False, voice=voice_id)
@@ -613,37 +777,49 @@ class TTSManager:
                 # Используем экспоненциальную шкалу для более естественного изменения громкости
                 volume_exp = (volume / 100.0) ** 2
                 
-                # Запускаем процесс воспроизведения звука с указанной громкостью
-                if self.use_wav:
-                    # Для WAV используем paplay или aplay с контролем громкости
-                    try:
-                        # paplay использует линейную шкалу от 0 до 65536
-                        volume_paplay = int(volume_exp * 65536)
-                        self.current_sound_process = subprocess.Popen(
-                            ["paplay", "--volume", str(volume_paplay), audio_file],
-                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
-                        )
-                    except:
-                        # Если paplay не доступен, пробуем aplay с softvol
-                        # aplay использует линейную шкалу от 0 до 100
-                        volume_aplay = int(volume_exp * 100)
+                # Процесс запускается под блокировкой: звук, начатый другим потоком
+                # после остановки выше, тоже останавливается, а speech_done
+                # всегда относится к последней запущенной фразе
+                with self._sound_lock:
+                    self._stop_process_locked()
+                    
+                    # Запускаем процесс воспроизведения звука с указанной громкостью
+                    if self.use_wav:
+                        # Для WAV используем paplay или aplay с контролем громкости
+                        try:
+                            # paplay использует линейную шкалу от 0 до 65536
+                            volume_paplay = int(volume_exp * 65536)
+                            self.current_sound_process = subprocess.Popen(
+                                ["paplay", "--volume", str(volume_paplay), audio_file],
+                                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+                            )
+                        except:
+                            # Если paplay не доступен, пробуем aplay с softvol
+                            # aplay использует линейную шкалу от 0 до 100
+                            volume_aplay = int(volume_exp * 100)
+                            self.current_sound_process = subprocess.Popen(
+                                ["aplay", "-D", f"softvol,softvol=volume={volume_aplay}", audio_file],
+                                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+                            )
+                    else:
+                        # Для MP3 используем mpg123 с контролем громкости
+                        # mpg123 использует линейную шкалу от 0 до 32768
+                        volume_mpg123 = int(volume_exp * 32768)
                         self.current_sound_process = subprocess.Popen(
-                            ["aplay", "-D", f"softvol,softvol=volume={volume_aplay}", audio_file],
+                            ["mpg123", "-f", str(volume_mpg123), audio_file],
                             stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
                         )
-                else:
-                    # Для MP3 используем mpg123 с контролем громкости
-                    # mpg123 использует линейную шкалу от 0 до 32768
-                    volume_mpg123 = int(volume_exp * 32768)
-                    self.current_sound_process = subprocess.Popen(
-                        ["mpg123", "-f", str(volume_mpg123), audio_file],
-                        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+                        
+                    # Запускаем поток ожидания завершения воспроизведения
+                    self.is_playing = True
+                    self._speech_serial += 1
+                    self.speech_done = threading.Event()
+                    wait_thread = threading.Thread(
+                        target=self.wait_completion,
+                        args=(self.current_sound_process, self.speech_done),
+                        daemon=True
                     )
-                    
-                # Запускаем поток ожидания завершения воспроизведения
-                self.is_playing = True
-                wait_thread = threading.Thread(target=self.wait_completion, daemon=True)
-                wait_thread.start()
+                    wait_thread.start()
                 
                 if blocking:
                     wait_thread.join()
@@ -660,12 +836,40 @@ class TTSManager:
             sentry_sdk.capture_exception(e)
             return False
     
-    def wait_completion(self):
-        """Ожидает завершения воспроизведения звука"""
-        if self.current_sound_process:
-            self.current_sound_process.wait()
-            self.is_playing = False
-            self.current_sound_process = None
+    def wait_completion(self, process=None, done_event=None):
+        """
+        Ожидает завершения воспроизведения звука
+        
+        Args:
+            process (subprocess.Popen, optional): Процесс воспроизведения
+            done_event (threading.Event, optional): Событие, устанавливаемое по окончании
+        """
+        process = process or self.current_sound_process
+        if process:
+            process.wait()
+            # Процесс мог быть уже заменен следующей фразой
+            with self._sound_lock:
+                if self.current_sound_process is process:
+                    self.is_playing = False
+                    self.current_sound_process = None
+        if done_event:
+            done_event.set()
+    
+    def wait_for_speech(self, timeout=None):
+        """
+        Ожидает окончания текущей фразы
+        
+        Args:
+            timeout (float, optional): Максимальное время ожидания в секундах
+            
+        Returns:
+            bool: True, если фраза закончилась, False по таймауту
+        """
+        # Если используем Google Cloud TTS, воспроизведением управляет он
+        if self.tts_engine == "google_cloud" and self.google_tts_manager:
+            return self.google_tts_manager.wait_for_speech(timeout)
+            
+        return self.speech_done.wait(timeout)
     
     def stop_current_sound(self):
         """Останавливает текущий воспроизводимый звук"""
@@ -673,15 +877,23 @@ class TTSManager:
         if self.tts_engine == "google_cloud" and self.google_tts_manager:
             return self.google_tts_manager.stop_current_sound()
             
-        if self.current_sound_process and self.current_sound_process.poll() is None:
+        with self._sound_lock:
+            self._speech_serial += 1
+            self._stop_process_locked()
+    
+    def _stop_process_locked(self):
+        """Останавливает текущий процесс озвучки, вызывается под _sound_lock"""
+        process = self.current_sound_process
+        if process and process.poll() is None:
             try:
-                self.current_sound_process.terminate()
-                self.current_sound_process.wait()
+                process.terminate()
+                process.wait()
             except:
                 pass
                 
         self.is_playing = False
         self.current_sound_process = None
+        self.speech_done.set()
     
     def pre_generate_menu_items(self, menu_items, voices=None):
         """
@@ -698,21 +910,14 @@ class TTSManager:
         if not voices:
             voices = [self.voice]  # По умолчанию только текущий голос
             
-        # Удаляем дубликаты из списка текстов
-        unique_items = set(menu_items)
-        
-        total_items = len(unique_items) * len(voices)
-        processed = 0
+        # Удаляем дубликаты из списка текстов, сохраняя порядок
+        unique_items = list(dict.fromkeys(menu_items))
         
         if self.debug:
             print(f"Предварительная генерация озвучки для {len(unique_items)} уникальных текстов в {len(voices)} голосах")
         
-        for voice in voices:
-            for text in unique_items:
-                self.generate_speech(text, force_regenerate=False, voice=voice)
-                processed += 1
-                if self.debug:
-                    print(f"Предварительная генерация: {processed}/{total_items} - {text} (голос: {voice})")
+        items = [(text, voice) for voice in voices for text in unique_items]
+        self._generate_in_pool(items, "Предварительная генерация")
     
     def pre_generate_missing_menu_items(self, menu_items, voices=None):
         """
@@ -729,21 +934,22 @@ class TTSManager:
         if not voices:
             voices = [self.voice]  # По умолчанию только текущий голос
             
-        # Удаляем дубликаты из списка текстов
-        unique_items = set(menu_items)
+        # Удаляем дубликаты из списка текстов, сохраняя порядок
+        unique_items = list(dict.fromkeys(menu_items))
         
         missing_items = []
         
-        # Проверяем наличие файлов и составляем список отсутствующих
+        # Проверяем наличие файлов одним чтением каталога кэша на голос
+        # вместо отдельной проверки существования для каждого текста
         for voice in voices:
+            cached = self.cached_keys(voice)
             for text in unique_items:
                 # Получаем имя файла без проверки существования
                 filename = self._get_voice_specific_filename(text, voice, check_exists=False)
-                if not os.path.exists(filename):
+                if os.path.splitext(os.path.basename(filename))[0] not in cached:
                     missing_items.append((text, voice))
         
         total_missing = len(missing_items)
-        processed = 0
         
         if self.debug:
             print(f"Предварительная генерация отсутствующей озвучки: найдено {total_missing} из {len(unique_items) * len(voices)} возможных файлов")
@@ -752,11 +958,53 @@ class TTSManager:
             print("Все аудиофайлы уже сгенерированы. Нет необходимости в дополнительной генерации.")
             return
         
-        for text, voice in missing_items:
-            self.generate_speech(text, force_regenerate=False, voice=voice)
-            processed += 1
-            if self.debug:
-                print(f"Генерация: {processed}/{total_missing} - {text} (голос: {voice})")
+        self._generate_in_pool(missing_items, "Генерация")
+    
+    def _generate_in_pool(self, items, label):
+        """
+        Генерирует озвучку для набора фраз в пуле потоков
+        
+        Фразы не зависят друг от друга, поэтому синтез идет параллельно
+        
+        Args:
+            items (list): Список пар (текст, голос)
+            label (str): Подпись для отладочного вывода прогресса
+            
+        Returns:
+            int: Количество фраз, которые не удалось сгенерировать
+        """
+        total = len(items)
+        processed = 0
+        failed = 0
+        
+        with ThreadPoolExecutor(max_workers=self.PRE_GENERATE_WORKERS) as executor:
+            futures = {
+                executor.submit(self.generate_speech, text, False, voice): (text, voice)
+                for text, voice in items
+            }
+            for future in as_completed(futures):
+                text, voice = futures[future]
+                processed += 1
+                try:
+                    # generate_speech сообщает об ошибке синтеза, возвращая None
+                    generated = future.result() is not None
+                except Exception as e:
+                    error_msg = f"Ошибка при генерации озвучки для '{text}': {e}"
+                    print(error_msg)
+                    sentry_sdk.capture_exception(e)
+                    generated = False
+                if not generated:
+                    failed += 1
+                if self.debug:
+                    status = "готово" if generated else "ошибка"
+                    print(f"{label}: {processed}/{total} - {text} (голос: {voice}) - {status}")
+        
+        if failed:
+            print(f"{label}: не удалось сгенерировать {failed} из {total} фраз")
+        elif self.debug:
+            print(f"{label}: все фразы сгенерированы ({total})")
+        
+        return failed
 
     def speak_text(self, text, voice_id=None):
         """
@@ -777,6 +1025,22 @@ class TTSManager:
             sentry_sdk.capture_exception(e)
             return False
 
+    def prewarm(self):
+        """
+        Прогревает движок синтеза, чтобы первое сообщение не ждало
+        установки соединения с API
+        """
+        try:
+            # Клиент Google Cloud TTS живет все время работы, но gRPC-канал
+            # открывается при первом запросе: делаем легкий запрос списка голосов.
+            # gTTS открывает новое соединение на каждую фразу, прогревать нечего
+            if self.tts_engine == "google_cloud" and self.google_tts_manager:
+                self.google_tts_manager.get_available_voices()
+        except Exception as e:
+            error_msg = f"Ошибка при прогреве движка TTS: {e}"
+            print(error_msg)
+            sentry_sdk.capture_exception(e)
+
     def play_speech_blocking(self, text, voice_id=None):
         """
         Озвучивает текст и ожидает завершения озвучивания
@@ -786,16 +1050,56 @@ class TTSManager:
             voice_id (str): Идентификатор голоса (можно переопределить)
             
         Returns:
-            bool: True, если озвучивание успешно выполнено
+            bool: True, если озвучивание успешно выполнено и не было прервано
         """
         try:
-            return self.play_speech(text, voice_id, blocking=True)
+            # Обычное сообщение - одно предложение: без разбиения и проверки кэша
+            if not isinstance(text, str) or not self.SENTENCE_SPLIT.search(text.strip()):
+                return self.play_speech(text, voice_id, blocking=True)
+            
+            sentences = self._split_sentences(text)
+            if len(sentences) < 2 or self.cache_exists(text, voice_id):
+                return self.play_speech(text, voice_id, blocking=True)
+            
+            # Фразы запускает и останавливает движок, которому play_speech передает озвучку
+            engine = self.google_tts_manager if self.tts_engine == "google_cloud" and self.google_tts_manager else self
+            
+            # Пока звучит одно предложение, следующее синтезируется в фоне
+            result = True
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                next_file = pool.submit(self.generate_speech, sentences[0], voice=voice_id)
+                for index, sentence in enumerate(sentences):
+                    next_file.result()
+                    if index + 1 < len(sentences):
+                        next_file = pool.submit(self.generate_speech, sentences[index + 1], voice=voice_id)
+                    serial = engine._speech_serial
+                    played = self.play_speech(sentence, voice_id, blocking=True)
+                    result = played and result
+                    
+                    # Остановка или новая фраза из другого потока прерывают сообщение целиком,
+                    # иначе следующее предложение зазвучало бы поверх новой озвучки
+                    if engine._speech_serial != serial + (1 if played else 0):
+                        next_file.cancel()
+                        return False
+            return result
         except Exception as e:
             error_msg = f"Ошибка при блокирующем воспроизведении речи: {e}"
             print(error_msg)
             sentry_sdk.capture_exception(e)
             return False
 
+    def _split_sentences(self, text):
+        """
+        Разбивает текст на предложения для поочередной озвучки
+        
+        Args:
+            text (str): Текст для озвучивания
+            
+        Returns:
+            list: Непустые предложения в исходном порядке
+        """
+        return [part for part in self.SENTENCE_SPLIT.split(text.strip()) if part]
+
     def _get_voice_specific_filename(self, text, voice, check_exists=True):
         """
         Возвращает путь к файлу для конкретного голоса, без зависимости от API
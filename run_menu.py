@@ -14,8 +14,8 @@ sentry_sdk.init(
     dsn="https://990b663058427f36a87004fc14319c09@o4508953992101888.ingest.de.sentry.io/4508953994330192",
     # Добавляем данные о пользователе и запросах
     send_default_pii=True,
-    # Включаем отслеживание исключений в фоновых потоках
-    enable_tracing=True,
+    # Трассируем только часть операций, чтобы отправка в Sentry не нагружала сеть
+    traces_sample_rate=0.1,
 )
 
 # Добавляем текущую директорию в путь поиска модулей
@@ -76,12 +76,10 @@ if args.pre_generate or args.pre_generate_missing:
         debug=args.debug,
         use_wav=not args.use_mp3,
         settings_manager=settings_manager,
-        records_dir=args.records_dir
+        records_dir=args.records_dir,
+        background_pre_generate=False  # Озвучка генерируется ниже синхронно
     )
     
-    # Создаем структуру меню
-    menu_manager.create_menu_structure()
-    
     # Генерируем озвучку для всех голосов или только для указанного
     voices = None  # Все голоса по умолчанию
     if args.voice: